@@ -1,4 +1,27 @@
-from adspy.algorithms.searching.binary_search import binary_search
-from adspy.algorithms.searching.linear_search import linear_search
+from adspy.algorithms.searching.binary_search import (
+    batch_binary_search,
+    binary_search,
+    bisect_left,
+    bisect_right,
+)
+from adspy.algorithms.searching.exponential_search import exponential_search
+from adspy.algorithms.searching.eytzinger_index import EytzingerIndex
+from adspy.algorithms.searching.interpolation_search import (
+    interpolation_search,
+)
+from adspy.algorithms.searching.linear_search import (
+    batch_linear_search,
+    linear_search,
+)
 
-__all__ = ["binary_search", "linear_search"]
+__all__ = [
+    "EytzingerIndex",
+    "batch_binary_search",
+    "batch_linear_search",
+    "binary_search",
+    "bisect_left",
+    "bisect_right",
+    "exponential_search",
+    "interpolation_search",
+    "linear_search",
+]
@@ -3,38 +3,252 @@
 References:
 
 - https://en.wikipedia.org/wiki/Binary_search
+- https://docs.python.org/3/library/bisect.html
 """
 
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, cast
 
+from adspy.algorithms import vectorised
+from adspy.algorithms.sorting.common import validate_key_arg
 
-def binary_search(it: Iterable, value: Any) -> None | int:
+
+def _as_sequence(it: Iterable) -> Sequence:
+    """Returns the `it`erable itself if it can be indexed, else a tuple."""
+
+    if isinstance(it, Sequence) or vectorised.numeric_array(it) is not None:
+        return cast("Sequence", it)
+    return tuple(it)
+
+
+def _validate_bounds(seq: Sequence, lo: int, hi: None | int) -> int:
+    """Returns the `hi` bound, the length of the `seq` if None."""
+
+    if lo < 0:
+        msg = f"lo={lo} must be non-negative"
+        raise ValueError(msg)
+    return len(seq) if hi is None else hi
+
+
+def _bisect_left(
+    seq: Sequence,
+    value: Any,
+    lo: int,
+    hi: int,
+    key: Callable,
+) -> int:
+    """The actual leftmost bisection implementation."""
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key(seq[mid]) < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_left(
+    seq: Sequence,
+    value: Any,
+    lo: int = 0,
+    hi: None | int = None,
+    *,
+    key: None | Callable = None,
+) -> int:
+    """Returns the leftmost insertion point of the `value` into the `seq`.
+
+    The `seq[lo:hi]` slice must be sorted by the `key`,
+    it is searched in place with O(log n) comparisons.
+    The `key` is applied to the items, not to the `value`.
+    All the items in `seq[lo:idx]` are less than the `value`
+    and the rest of the slice are not.
+
+    Parameters
+    ----------
+    seq : Sequence
+    value : Any
+    lo : int, default 0
+    hi : None | int, default None
+        the length of the `seq` if None
+    key : None | Callable, default None
+
+    Returns
+    -------
+    int
+    """
+
+    hi = _validate_bounds(seq, lo, hi)
+    if key is None:
+        idx = vectorised.search(seq, value, lo=lo, hi=hi)
+        if idx is not None:
+            return idx
+
+    key = validate_key_arg(key)
+
+    return _bisect_left(seq, value, lo, hi, key)
+
+
+def bisect_right(
+    seq: Sequence,
+    value: Any,
+    lo: int = 0,
+    hi: None | int = None,
+    *,
+    key: None | Callable = None,
+) -> int:
+    """Returns the rightmost insertion point of the `value` into the `seq`.
+
+    The `seq[lo:hi]` slice must be sorted by the `key`,
+    it is searched in place with O(log n) comparisons.
+    The `key` is applied to the items, not to the `value`.
+    All the items in `seq[lo:idx]` are less than or equal to the `value`
+    and the rest of the slice are greater.
+
+    Parameters
+    ----------
+    seq : Sequence
+    value : Any
+    lo : int, default 0
+    hi : None | int, default None
+        the length of the `seq` if None
+    key : None | Callable, default None
+
+    Returns
+    -------
+    int
+    """
+
+    hi = _validate_bounds(seq, lo, hi)
+    if key is None:
+        idx = vectorised.search(seq, value, lo=lo, hi=hi, right=True)
+        if idx is not None:
+            return idx
+
+    key = validate_key_arg(key)
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if value < key(seq[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def binary_search(
+    it: Iterable,
+    value: Any,
+    lo: int = 0,
+    hi: None | int = None,
+    *,
+    key: None | Callable = None,
+) -> None | int:
     """Returns the index of the first occurence of the `value`.
 
-    The `it`erable must be already sorted,
+    The `it`erable must be already sorted (by the `key`),
     no sorting is done under the hood.
+    Sequences are searched in place within the `lo` and `hi` bounds,
+    other iterables are converted to `tuple` first.
     If None, then the `value` was not found in the `it`erable.
+    The numeric NumPy arrays and `array.array`s are searched
+    by the NumPy-vectorised backend if NumPy is installed
+    and no `key` is given.
 
     Parameters
     ----------
     it : Iterable
     value : Any
+    lo : int, default 0
+    hi : None | int, default None
+        the length of the `it`erable if None
+    key : None | Callable, default None
+        applied to the items, not to the `value`
 
     Returns
     -------
     None | int
     """
 
-    seq = tuple(it)
-    left, right = 0, len(seq) - 1
-    while left <= right:
-        midx = (left + right) // 2
-        mid = seq[midx]
-        if mid == value:
-            return midx
-        if mid < value:
-            left = midx + 1
-        else:
-            right = midx - 1
-    return None
+    seq = _as_sequence(it)
+    hi = _validate_bounds(seq, lo, hi)
+    idx = bisect_left(seq, value, lo, hi, key=key)
+    if idx >= hi:
+        return None
+    item = seq[idx] if key is None else key(seq[idx])
+    return idx if item == value else None
+
+
+def _batch_bisect_left(
+    seq: Sequence,
+    values: Sequence,
+    key: Callable,
+) -> list[int]:
+    """Returns the leftmost insertion points of the `values`.
+
+    The `values` are visited in the sorted order, the median one
+    is bisected first and splits both the rest of the `values`
+    and the search window of the `seq`, so each of them
+    narrows down the windows of the others.
+    """
+
+    order = sorted(range(len(values)), key=values.__getitem__)
+    points = [0] * len(values)
+    # the (first value, last value, lo, hi) windows
+    stack = [(0, len(order), 0, len(seq))]
+    while stack:
+        first, last, lo, hi = stack.pop()
+        if first >= last:
+            continue
+        mid = (first + last) // 2
+        vidx = order[mid]
+        point = _bisect_left(seq, values[vidx], lo, hi, key)
+        points[vidx] = point
+        stack.append((first, mid, lo, point))
+        stack.append((mid + 1, last, point, hi))
+    return points
+
+
+def batch_binary_search(
+    it: Iterable,
+    values: Iterable,
+    *,
+    key: None | Callable = None,
+) -> list[None | int]:
+    """Returns the index of the first occurence of each of the `values`.
+
+    The `it`erable must be already sorted (by the `key`),
+    the `values` can come in any order.
+    The `values` are sorted and located all together,
+    every found index narrows the search windows of the rest,
+    so m values cost O(m log(n/m)) comparisons instead of O(m log n)
+    for the m separate `binary_search` calls.
+    The numeric NumPy arrays and `array.array`s are searched
+    by the NumPy-vectorised backend if NumPy is installed
+    and no `key` is given.
+
+    Parameters
+    ----------
+    it : Iterable
+    values : Iterable
+    key : None | Callable, default None
+        applied to the items, not to the `values`
+
+    Returns
+    -------
+    list[None | int]
+        the index (or None if not found) per each of the `values`
+    """
+
+    seq = _as_sequence(it)
+    values = values if isinstance(values, Sequence) else tuple(values)
+    points = None if key is not None else vectorised.search_batch(seq, values)
+    key = validate_key_arg(key)
+    if points is None:
+        points = _batch_bisect_left(seq, values, key)
+
+    size = len(seq)
+    return [
+        idx if (idx < size) and (key(seq[idx]) == value) else None
+        for idx, value in zip(points, values, strict=True)
+    ]
@@ -0,0 +1,83 @@
+"""The "Exponential search" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/Exponential_search
+"""
+
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from adspy.algorithms.sorting.common import validate_key_arg
+
+
+class Indexable(Protocol):
+    """The source of items accessed by the non-negative indices.
+
+    The length is not required, the indices past the end
+    must raise `IndexError` (as for sequences).
+    """
+
+    def __getitem__(self, idx: int, /) -> Any: ...
+
+
+def exponential_search(
+    source: Indexable,
+    value: Any,
+    lo: int = 0,
+    *,
+    key: None | Callable = None,
+) -> None | int:
+    """Returns the index of the first occurence of the `value`.
+
+    The `source` must be already sorted (by the `key`),
+    its length is not needed, so lazily computed and unbounded
+    sources can be searched too. The `source[lo + 2**k - 1]` items
+    are probed until one is not less than the `value` (or missing),
+    then the last bracket is bisected. The index `d` positions away
+    from the `lo` costs O(log d) probes.
+    If None, then the `value` was not found in the `source`.
+
+    Parameters
+    ----------
+    source : Indexable
+    value : Any
+    lo : int, default 0
+    key : None | Callable, default None
+        applied to the items, not to the `value`
+
+    Returns
+    -------
+    None | int
+    """
+
+    if lo < 0:
+        msg = f"lo={lo} must be non-negative"
+        raise ValueError(msg)
+
+    key = validate_key_arg(key)
+
+    def precedes(idx: int) -> bool:
+        # the missing items are past the end, so they are greater
+        try:
+            item = source[idx]
+        except IndexError:
+            return False
+        return bool(key(item) < value)
+
+    low, high, step = lo, lo, 1
+    while precedes(high):
+        low, high, step = high + 1, lo + 2 * step - 1, 2 * step
+    # the first item not less than the `value` is in `source[low:high + 1]`
+    while low < high:
+        mid = (low + high) // 2
+        if precedes(mid):
+            low = mid + 1
+        else:
+            high = mid
+
+    try:
+        item = source[low]
+    except IndexError:
+        return None
+    return low if key(item) == value else None
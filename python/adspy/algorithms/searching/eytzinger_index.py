@@ -0,0 +1,177 @@
+"""The static search index in the Eytzinger (BFS) layout.
+
+References:
+
+- https://arxiv.org/abs/1509.05053
+- https://algorithmica.org/en/eytzinger
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from adspy.algorithms.sorting.common import is_sorted
+
+
+def _buffer(items: list) -> array | list:
+    """Returns the `array` of the integers or floats, else the `items`."""
+
+    for typecode, tp in (("q", int), ("d", float)):
+        if items and all(type(item) is tp for item in items):
+            try:
+                return array(typecode, items)
+            except OverflowError:
+                return items
+    return items
+
+
+def _in_order_ranks(size: int) -> "array[int]":
+    """Returns the sorted index of each of the 1..`size` tree positions.
+
+    The position `k` has the children `2k` and `2k + 1`,
+    the in-order traversal of the tree visits the sorted items.
+    """
+
+    ranks = array("q", bytes(8 * (size + 1)))
+    stack: list[int] = []
+    rank, pos = 0, 1
+    while stack or (pos <= size):
+        while pos <= size:
+            stack.append(pos)
+            pos *= 2
+        pos = stack.pop()
+        ranks[pos] = rank
+        rank += 1
+        pos = 2 * pos + 1
+    return ranks
+
+
+class EytzingerIndex:
+    """The immutable search index of the sorted items.
+
+    The items are laid out as the implicit binary search tree
+    in the breadth-first (Eytzinger) order: the root is at 1
+    and the children of the `k` position are at `2k` and `2k + 1`.
+    The first levels, visited by every query, share a few cache lines,
+    and the descent needs neither the bounds nor the midpoints.
+    The integers or floats are stored in `array` buffers.
+
+    The index is built once in O(n), the queries cost O(log n).
+    """
+
+    __slots__ = ("_items", "_tree", "_ranks", "_size")
+
+    def __init__(self, it: Iterable, /) -> None:
+        items = list(it)
+        if not is_sorted(items):
+            msg = "the items must be sorted"
+            raise ValueError(msg)
+
+        size = len(items)
+        ranks = _in_order_ranks(size)
+        tree = [items[0] if items else None]
+        tree += [items[rank] for rank in ranks[1:]]
+
+        self._items = _buffer(items)
+        self._tree: Sequence = (
+            array(self._items.typecode, tree)
+            if isinstance(self._items, array)
+            else tree
+        )
+        self._ranks = ranks
+        self._size = size
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) is not None
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        cls_name = type(self).__name__
+        return f"{cls_name}({list(self._items)!r})"
+
+    def _lower_bound(self, value: Any) -> int:
+        """Returns the tree position of the first item not less than `value`.
+
+        Zero is returned if all the items are less than the `value`.
+        """
+
+        tree, size = self._tree, self._size
+        pos = 1
+        while pos <= size:
+            pos = 2 * pos + (tree[pos] < value)
+        # the last left turn is before the trailing right turns (ones)
+        return pos >> (~pos & (pos + 1)).bit_length()
+
+    def find(self, value: Any) -> None | int:
+        """Returns the sorted index of the first occurence of the `value`.
+
+        If None, then the `value` was not found.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        None | int
+        """
+
+        pos = self._lower_bound(value)
+        if pos and (self._tree[pos] == value):
+            return self._ranks[pos]
+        return None
+
+    def rank(self, value: Any) -> int:
+        """Returns the number of the items less than the `value`.
+
+        It is also the leftmost insertion point of the `value`.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        int
+        """
+
+        pos = self._lower_bound(value)
+        return self._ranks[pos] if pos else self._size
+
+    def lower_bound(self, value: Any) -> Any:
+        """Returns the first item not less than the `value`.
+
+        If None, then all the items are less than the `value`.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        Any
+        """
+
+        pos = self._lower_bound(value)
+        return self._tree[pos] if pos else None
+
+    def range(self, start: Any, stop: Any) -> list:  # noqa: A003
+        """Returns the sorted items within the [`start`, `stop`) interval.
+
+        Parameters
+        ----------
+        start : Any
+        stop : Any
+
+        Returns
+        -------
+        list
+        """
+
+        lo, hi = self.rank(start), self.rank(stop)
+        return list(self._items[lo:hi]) if lo < hi else []
@@ -0,0 +1,87 @@
+"""The "Interpolation search" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/Interpolation_search
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from adspy.algorithms.searching.binary_search import (
+    _as_sequence,
+    _validate_bounds,
+)
+from adspy.algorithms.sorting.common import validate_key_arg
+
+
+def interpolation_search(
+    it: Iterable,
+    value: Any,
+    lo: int = 0,
+    hi: None | int = None,
+    *,
+    key: None | Callable = None,
+) -> None | int:
+    """Returns the index of the first occurence of the `value`.
+
+    The `it`erable must be already sorted (by the `key`)
+    and the keys must be numbers. The next probe is estimated
+    by the linear interpolation between the keys of the window ends,
+    so the uniformly distributed keys cost O(log log n) probes.
+    If a probe fails to halve the window (skewed keys),
+    the next probe is the midpoint, so the worst case
+    is O(log n) probes as for the `binary_search`.
+    The midpoint is probed as well if the estimate is not finite
+    (e.g. infinite keys or a NaN `value`).
+    Sequences are searched in place within the `lo` and `hi` bounds,
+    other iterables are converted to `tuple` first.
+    If None, then the `value` was not found in the `it`erable.
+
+    Parameters
+    ----------
+    it : Iterable
+    value : Any
+    lo : int, default 0
+    hi : None | int, default None
+        the length of the `it`erable if None
+    key : None | Callable, default None
+        applied to the items, not to the `value`
+
+    Returns
+    -------
+    None | int
+    """
+
+    key = validate_key_arg(key)
+
+    seq = _as_sequence(it)
+    hi = end = _validate_bounds(seq, lo, hi)
+
+    bisect = False
+    while lo < hi:
+        first, last = key(seq[lo]), key(seq[hi - 1])
+        if value <= first:
+            break
+        if value > last:
+            lo = hi
+            break
+        # the `value` is in the (first, last] range
+        size = hi - lo
+        mid = (lo + hi) // 2
+        if not bisect:
+            try:
+                offset = int((value - first) * (size - 1) // (last - first))
+            except (ArithmeticError, ValueError):
+                # the estimate is not finite (infinite keys or a NaN value)
+                pass
+            else:
+                mid = lo + min(max(offset, 0), size - 1)
+        if key(seq[mid]) < value:
+            lo = mid + 1
+        else:
+            hi = mid
+        bisect = (hi - lo) > size // 2
+    if lo >= end:
+        return None
+    return lo if key(seq[lo]) == value else None
@@ -5,28 +5,117 @@ References:
 - https://en.wikipedia.org/wiki/Linear_search
 """
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from typing import Any
 
 
-def linear_search(it: Iterable, value: Any) -> None | int:
+def _window(it: Iterable, start: int, stop: None | int) -> Iterator:
+    """Returns the iterator over the `it[start:stop]` items."""
+
+    if start < 0:
+        msg = f"start={start} must be non-negative"
+        raise ValueError(msg)
+    if (stop is not None) and (stop < 0):
+        msg = f"stop={stop} must be non-negative"
+        raise ValueError(msg)
+    if (start == 0) and (stop is None):
+        return iter(it)
+    return islice(it, start, stop)
+
+
+def linear_search(
+    it: Iterable,
+    value: Any = None,
+    start: int = 0,
+    stop: None | int = None,
+    *,
+    predicate: None | Callable[[Any], bool] = None,
+) -> None | int:
     """Returns the index of the first occurence of the `value`.
 
-    The `it`erable is converted to `tuple` first
-    for exhausting possibly given generator objects.
+    The `it`erable is streamed: the items are pulled one at a time
+    and the search stops at the first match, so a generator
+    is consumed only up to (and including) the found item.
+    Only the `it[start:stop]` items are checked,
+    the indices are still counted from the beginning.
+    If the `predicate` is given, then the index of the first item
+    it is true for is returned and the `value` is ignored.
     If None, then the `value` was not found in the `it`erable.
 
     Parameters
     ----------
     it : Iterable
-    value : Any
+    value : Any, default None
+    start : int, default 0
+    stop : None | int, default None
+        the end of the `it`erable if None
+    predicate : None | Callable[[Any], bool], default None
 
     Returns
     -------
     None | int
     """
 
-    for idx, item in enumerate(tuple(it)):
-        if item == value:
+    items = _window(it, start, stop)
+
+    if predicate is None:
+        for idx, item in enumerate(items, start):
+            if item == value:
+                return idx
+        return None
+    for idx, item in enumerate(items, start):
+        if predicate(item):
             return idx
     return None
+
+
+def batch_linear_search(
+    it: Iterable,
+    values: Iterable,
+    start: int = 0,
+    stop: None | int = None,
+) -> list[None | int]:
+    """Returns the index of the first occurence of each of the `values`.
+
+    The `it`erable is streamed once for all the `values`,
+    which must be hashable, and the search stops as soon as
+    every value is found. Only the `it[start:stop]` items are checked.
+
+    Parameters
+    ----------
+    it : Iterable
+    values : Iterable
+    start : int, default 0
+    stop : None | int, default None
+        the end of the `it`erable if None
+
+    Returns
+    -------
+    list[None | int]
+        the index (or None if not found) per each of the `values`
+    """
+
+    items = _window(it, start, stop)
+
+    result: list[None | int] = []
+    # the positions of the values in the result, duplicates share the index
+    pending: dict[Any, list[int]] = {}
+    for pos, value in enumerate(values):
+        pending.setdefault(value, []).append(pos)
+        result.append(None)
+
+    if not pending:
+        return result
+    for idx, item in enumerate(items, start):
+        try:
+            positions = pending.pop(item, None)
+        except TypeError:  # unhashable items are not among the `values`
+            continue
+        if positions is None:
+            continue
+        for pos in positions:
+            result[pos] = idx
+        if not pending:
+            break
+    return result
@@ -1,15 +1,27 @@
 from adspy.algorithms.sorting.bubble_sort import bubble_sort
-from adspy.algorithms.sorting.common import is_sorted
+from adspy.algorithms.sorting.common import is_sorted, kmerge
+from adspy.algorithms.sorting.counting_sort import counting_sort
+from adspy.algorithms.sorting.external_sort import external_sort
+from adspy.algorithms.sorting.heap_sort import heap_sort
 from adspy.algorithms.sorting.insertion_sort import insertion_sort
 from adspy.algorithms.sorting.merge_sort import merge_sort
+from adspy.algorithms.sorting.parallel_sort import parallel_merge_sort
 from adspy.algorithms.sorting.quick_sort import quick_sort
+from adspy.algorithms.sorting.radix_sort import lsd_radix_sort, msd_radix_sort
 from adspy.algorithms.sorting.selection_sort import selection_sort
 
 __all__ = [
     "bubble_sort",
+    "counting_sort",
+    "external_sort",
+    "heap_sort",
     "insertion_sort",
     "is_sorted",
+    "kmerge",
+    "lsd_radix_sort",
     "merge_sort",
+    "msd_radix_sort",
+    "parallel_merge_sort",
     "quick_sort",
     "selection_sort",
 ]
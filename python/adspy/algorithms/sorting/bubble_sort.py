@@ -8,7 +8,11 @@ References:
 from collections.abc import Callable, Sequence
 from operator import gt, lt
 
-from adspy.algorithms.sorting.common import validate_key_arg
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
 
 
 def bubble_sort(
@@ -32,17 +36,16 @@ def bubble_sort(
 
     key = validate_key_arg(key)
 
-    lst = list(seq)
-    if (size := len(lst)) < 2:
-        return lst
+    records = decorate(seq, key, reverse=reverse)
+    size = len(records)
     op = lt if reverse else gt
-    while True:
+    while size > 1:
         swapped = False
         for idx in range(1, size):
-            if op(key(lst[idx - 1]), key(lst[idx])):
-                lst[idx - 1], lst[idx] = lst[idx], lst[idx - 1]
+            if op(records[idx - 1], records[idx]):
+                records[idx - 1], records[idx] = records[idx], records[idx - 1]
                 swapped = True
         if not swapped:
             break
         size -= 1
-    return lst
+    return undecorate(records)
@@ -1,7 +1,15 @@
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import pairwise
 from operator import ge, gt, le, lt
 from typing import Any, cast
 
+Record = tuple[Any, int, Any]
+
+# the number of consecutive wins of one run to start galloping
+MIN_GALLOP = 7
+
+_EXHAUSTED = object()
+
 
 def _default_key(arg: Any) -> Any:
     return arg
@@ -16,6 +24,43 @@ def validate_key_arg(key: Any) -> Callable:
     raise TypeError(msg)
 
 
+def decorate(
+    it: Iterable,
+    key: Callable,
+    *,
+    reverse: bool = False,
+    start: int = 0,
+) -> list[Record]:
+    """Returns the list of `(key, index, value)` records.
+
+    The `key` is called exactly once per item.
+    The index breaks ties between equal keys, so the values
+    are never compared and any sort over the records is stable.
+    For the `reverse` order the indices are negated
+    to keep equal keys in their original order.
+
+    Parameters
+    ----------
+    it : Iterable
+    key : Callable
+    reverse : bool, default False
+    start : int, default 0
+        the index of the first item
+
+    Returns
+    -------
+    list[Record]
+    """
+
+    sign = -1 if reverse else 1
+    return [(key(item), sign * idx, item) for idx, item in enumerate(it, start)]
+
+
+def undecorate(records: Iterable[Record]) -> list:
+    """Returns the list of values from the `(key, index, value)` records."""
+    return [record[-1] for record in records]
+
+
 def is_sorted(
     seq: Sequence,
     key: None | Callable = None,
@@ -48,11 +93,175 @@ def is_sorted(
         if strict:
             op = lt
 
-    tup = tuple(seq)
-    for idx in range(1, len(tup)):
-        if not op(key(tup[idx - 1]), key(tup[idx])):
-            return False
-    return True
+    return all(op(prev, curr) for prev, curr in pairwise(map(key, seq)))
+
+
+def gallop(
+    item: Any,
+    lst: list,
+    lo: int,
+    hi: int,
+    *,
+    reverse: bool = False,
+    right: bool = False,
+) -> int:
+    """Returns the insertion point of the `item` into the sorted slice.
+
+    The `lst[lo:hi]` slice is probed at the offsets 0, 1, 3, 7, ...
+    and then the last bracket is bisected, so the point `d` positions
+    away from the `lo` costs O(log d) comparisons.
+
+    Parameters
+    ----------
+    item : Any
+    lst : list
+    lo : int
+    hi : int
+    reverse : bool, default False
+    right : bool, default False
+        if True, then the point is after the items equal to the `item`
+
+    Returns
+    -------
+    int
+    """
+
+    op = gt if reverse else lt
+
+    def precedes(other: Any) -> bool:
+        # the items preceding the insertion point
+        return not op(item, other) if right else op(other, item)
+
+    if (lo >= hi) or not precedes(lst[lo]):
+        return lo
+    prev, ofs = lo, 1
+    while (lo + ofs < hi) and precedes(lst[lo + ofs]):
+        prev = lo + ofs
+        ofs = 2 * ofs + 1
+    # the point is in the (prev, lo + ofs] bracket
+    low, high = prev + 1, min(lo + ofs, hi)
+    while low < high:
+        mid = (low + high) // 2
+        if precedes(lst[mid]):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def merge_runs(
+    lst: list[Record],
+    lo: int,
+    mid: int,
+    hi: int,
+    *,
+    reverse: bool = False,
+    min_gallop: int = MIN_GALLOP,
+) -> None:
+    """Merge the sorted `lst[lo:mid]` and `lst[mid:hi]` runs in place.
+
+    Only the left run is copied aside. Once one run wins
+    `min_gallop` times in a row, its items are moved in bulk
+    up to the insertion point found by `gallop`.
+
+    Parameters
+    ----------
+    lst : list[Record]
+    lo : int
+    mid : int
+    hi : int
+    reverse : bool, default False
+    min_gallop : int, default MIN_GALLOP
+
+    Returns
+    -------
+    None
+    """
+
+    op = gt if reverse else lt
+
+    tmp = lst[lo:mid]
+    len1 = len(tmp)
+    idx1, idx2, dst = 0, mid, lo
+    wins1, wins2 = 0, 0
+    while (idx1 < len1) and (idx2 < hi):
+        if op(lst[idx2], tmp[idx1]):
+            lst[dst] = lst[idx2]
+            idx2 += 1
+            dst += 1
+            wins1, wins2 = 0, wins2 + 1
+            if wins2 >= min_gallop:
+                end = gallop(tmp[idx1], lst, idx2, hi, reverse=reverse)
+                lst[dst : dst + end - idx2] = lst[idx2:end]
+                dst += end - idx2
+                idx2, wins2 = end, 0
+        else:
+            lst[dst] = tmp[idx1]
+            idx1 += 1
+            dst += 1
+            wins1, wins2 = wins1 + 1, 0
+            if (wins1 >= min_gallop) and (idx2 < hi):
+                end = gallop(
+                    lst[idx2], tmp, idx1, len1, reverse=reverse, right=True
+                )
+                lst[dst : dst + end - idx1] = tmp[idx1:end]
+                dst += end - idx1
+                idx1, wins1 = end, 0
+    # the rest of the right run is already in place
+    lst[dst : dst + len1 - idx1] = tmp[idx1:]
+
+
+def merge_into(
+    src: list[Record],
+    dst: list,
+    left: int,
+    mid: int,
+    right: int,
+    *,
+    reverse: bool = False,
+) -> None:
+    """Merge the sorted `src[left:mid]` and `src[mid:right]` into `dst`.
+
+    The merged records are written to the `dst[left:right]` slice,
+    no other lists are allocated.
+
+    Parameters
+    ----------
+    src : list[Record]
+    dst : list
+        the list of the same size as the `src`
+    left : int
+    mid : int
+    right : int
+    reverse : bool, default False
+
+    Returns
+    -------
+    None
+    """
+
+    op = gt if reverse else lt
+
+    if (left == mid) or (mid == right):
+        dst[left:right] = src[left:right]
+        return
+    idx1, idx2 = left, mid
+    item1, item2 = src[idx1], src[idx2]
+    for idx in range(left, right):
+        if op(item2, item1):
+            dst[idx] = item2
+            idx2 += 1
+            if idx2 == right:
+                dst[idx + 1 : right] = src[idx1:mid]
+                return
+            item2 = src[idx2]
+        else:
+            dst[idx] = item1
+            idx1 += 1
+            if idx1 == mid:
+                dst[idx + 1 : right] = src[idx2:right]
+                return
+            item1 = src[idx1]
 
 
 def merge(
@@ -78,19 +287,91 @@ def merge(
 
     key = validate_key_arg(key)
 
+    records = decorate(seq1, key, reverse=reverse)
+    mid = len(records)
+    records += decorate(seq2, key, reverse=reverse, start=mid)
+    merge_runs(records, 0, mid, len(records), reverse=reverse)
+    return undecorate(records)
+
+
+def _sift_down(heap: list[list], idx: int, *, op: Callable) -> None:
+    """Move the `heap[idx]` entry down until no child precedes it."""
+
+    size = len(heap)
+    entry = heap[idx]
+    while (child := 2 * idx + 1) < size:
+        if (child + 1 < size) and op(heap[child + 1], heap[child]):
+            child += 1
+        if not op(heap[child], entry):
+            break
+        heap[idx] = heap[child]
+        idx = child
+    heap[idx] = entry
+
+
+def _kmerge(
+    iterables: Iterable[Iterable],
+    key: Callable,
+    *,
+    reverse: bool,
+) -> Iterator:
+    """The actual generator implementation."""
+
     op = gt if reverse else lt
+    sign = -1 if reverse else 1
 
-    merged = []
-    lst1, lst2 = map(list, (seq1, seq2))
-    len1, len2 = map(len, (lst1, lst2))
-    idx1, idx2 = 0, 0
-    while (idx1 < len1) and (idx2 < len2):
-        if op(key(seq1[idx1]), key(seq2[idx2])):
-            merged.append(seq1[idx1])
-            idx1 += 1
+    # the heap entries are [key, order, value, iterator] lists,
+    # the distinct orders keep the values from being compared
+    heap: list[list] = []
+    for order, iterable in enumerate(iterables):
+        it = iter(iterable)
+        if (value := next(it, _EXHAUSTED)) is not _EXHAUSTED:
+            heap.append([key(value), sign * order, value, it])
+    for idx in range(len(heap) // 2 - 1, -1, -1):
+        _sift_down(heap, idx, op=op)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        if (value := next(entry[3], _EXHAUSTED)) is _EXHAUSTED:
+            heap[0] = heap[-1]
+            heap.pop()
         else:
-            merged.append(seq2[idx2])
-            idx2 += 1
-    merged += seq1[idx1:]
-    merged += seq2[idx2:]
-    return merged
+            entry[0], entry[2] = key(value), value
+        _sift_down(heap, 0, op=op)
+
+    # the last iterable needs no comparisons
+    if heap:
+        _, _, value, it = heap.pop()
+        yield value
+        yield from it
+
+
+def kmerge(
+    *iterables: Iterable,
+    key: None | Callable = None,
+    reverse: bool = False,
+) -> Iterator:
+    """Yields the merged items of the sorted iterables.
+
+    The items are pulled lazily, one at a time from each iterable,
+    so the memory is O(k) for the k iterables.
+    The `key` is called at most once per item.
+    The merge is stable: equal items come in the order
+    of the iterables they belong to.
+
+    Parameters
+    ----------
+    *iterables : Iterable
+        the iterables sorted in the same order
+    key : None | Callable, default None
+    reverse : bool, default False
+
+    Returns
+    -------
+    Iterator
+    """
+
+    key = validate_key_arg(key)
+
+    return _kmerge(iterables, key, reverse=reverse)
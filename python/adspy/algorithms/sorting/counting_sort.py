@@ -0,0 +1,76 @@
+"""The "Counting sort" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/Counting_sort
+"""
+
+from collections.abc import Callable, Sequence
+
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.merge_sort import _merge_sort
+from adspy.algorithms.sorting.radix_sort import _lsd_radix_sort
+
+# the key ranges of this size are always counted
+MIN_SPAN = 1 << 16
+
+
+def counting_sort(
+    seq: Sequence,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+) -> list:
+    """Returns the sorted list.
+
+    The keys must be integers, the items are placed
+    by the counts of the keys in O(n + k) time
+    for the k-wide range of the keys.
+    The ranges wider than `max(4 * n, MIN_SPAN)` are sorted
+    by `lsd_radix_sort`, the non-integer keys by `merge_sort`.
+    The sort is stable.
+
+    Parameters
+    ----------
+    seq : Sequence
+    key : None | Callable, default None
+    reverse : bool, default False
+
+    Returns
+    -------
+    list
+    """
+
+    key = validate_key_arg(key)
+
+    records = decorate(seq, key, reverse=reverse)
+    if not all(isinstance(record[0], int) for record in records):
+        return undecorate(_merge_sort(records, reverse=reverse))
+    if not records:
+        return []
+    low = min(record[0] for record in records)
+    span = max(record[0] for record in records) - low + 1
+    if span > max(4 * len(records), MIN_SPAN):
+        return undecorate(_lsd_radix_sort(records, reverse=reverse))
+
+    counts = [0] * span
+    for record in records:
+        counts[record[0] - low] += 1
+    # the output position of the next item of each key
+    starts = [0] * span
+    pos = 0
+    for idx in range(span - 1, -1, -1) if reverse else range(span):
+        starts[idx] = pos
+        pos += counts[idx]
+    del counts
+
+    result = [None] * len(records)
+    for record in records:
+        idx = record[0] - low
+        result[starts[idx]] = record[-1]
+        starts[idx] += 1
+    return result
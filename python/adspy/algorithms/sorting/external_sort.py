@@ -0,0 +1,224 @@
+"""The "External merge sort" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/External_sorting
+- https://en.wikipedia.org/wiki/K-way_merge_algorithm
+"""
+
+import pickle
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from itertools import count, islice
+from tempfile import TemporaryFile
+from typing import IO, Any, Protocol
+
+from adspy.algorithms.sorting.common import (
+    Record,
+    decorate,
+    kmerge,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.merge_sort import _merge_sort
+
+# the default number of items sorted in memory at once
+CHUNK_SIZE = 100_000
+# the number of records (de)serialised at once
+BATCH_SIZE = 1_000
+# the default number of files merged at once
+MAX_FAN_IN = 64
+
+
+class Serializer(Protocol):
+    """The (de)serialiser of the spilled records, e.g. `pickle`."""
+
+    def dump(self, obj: Any, file: IO[bytes], /) -> None:
+        """Write the `obj` to the `file`."""
+
+    def load(self, file: IO[bytes], /) -> Any:
+        """Read the next object from the `file`.
+
+        Raises
+        ------
+        EOFError
+            if the file is exhausted.
+        """
+
+
+def _spill(
+    records: Iterable[Record],
+    *,
+    serializer: Serializer,
+    tmpdir: None | str,
+) -> IO[bytes]:
+    """Returns the temporary file with the `records` written in batches."""
+
+    file = TemporaryFile(dir=tmpdir)  # noqa: SIM115
+    try:
+        records = iter(records)
+        while batch := list(islice(records, BATCH_SIZE)):
+            serializer.dump(batch, file)
+    except BaseException:
+        file.close()
+        raise
+    file.seek(0)
+    return file
+
+
+def _load(file: IO[bytes], *, serializer: Serializer) -> Iterator[Record]:
+    """Yields the records from the spilled `file`."""
+
+    while True:
+        try:
+            batch = serializer.load(file)
+        except EOFError:
+            return
+        yield from batch
+
+
+def _merge_files(
+    files: list[IO[bytes]],
+    *,
+    reverse: bool,
+    serializer: Serializer,
+    tmpdir: None | str,
+) -> IO[bytes]:
+    """Returns the temporary file with the merged records of the `files`.
+
+    The merged `files` are closed.
+    """
+
+    try:
+        streams = [_load(file, serializer=serializer) for file in files]
+        records = kmerge(*streams, reverse=reverse)
+        return _spill(records, serializer=serializer, tmpdir=tmpdir)
+    finally:
+        for file in files:
+            file.close()
+
+
+def _external_sort(
+    it: Iterable,
+    key: Callable,
+    *,
+    reverse: bool,
+    chunk_size: int,
+    max_fan_in: int,
+    serializer: Serializer,
+    tmpdir: None | str,
+) -> Iterator:
+    """The actual generator implementation."""
+
+    it = iter(it)
+    # the spilled runs by the number of merges they went through,
+    # the runs of the same level are ordered by their first items
+    levels: list[list[IO[bytes]]] = []
+    merge = partial(
+        _merge_files, reverse=reverse, serializer=serializer, tmpdir=tmpdir
+    )
+    start = 0
+    try:
+        while chunk := list(islice(it, chunk_size)):
+            records = decorate(chunk, key, reverse=reverse, start=start)
+            records = _merge_sort(records, reverse=reverse)
+            start += len(chunk)
+            del chunk
+            if not levels and len(records) < chunk_size:
+                # the whole input fits in a single chunk
+                yield from (record[-1] for record in records)
+                return
+            file = _spill(records, serializer=serializer, tmpdir=tmpdir)
+            del records
+            # a full level is merged into a run of the next one
+            for level in count():
+                if level == len(levels):
+                    levels.append([])
+                levels[level].append(file)
+                if len(levels[level]) < max_fan_in:
+                    break
+                file, levels[level] = merge(levels[level]), []
+
+        # the older runs are in the higher levels
+        files = [file for runs in reversed(levels) for file in runs]
+        levels = [files]  # to be closed in the end
+        while len(files) > max_fan_in:
+            group = min(max_fan_in, len(files) - max_fan_in + 1)
+            files[-group:] = [merge(files[-group:])]
+
+        streams = [_load(file, serializer=serializer) for file in files]
+        for record in kmerge(*streams, reverse=reverse):
+            yield record[-1]
+    finally:
+        for runs in levels:
+            for file in runs:
+                file.close()
+
+
+def external_sort(
+    it: Iterable,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    max_fan_in: int = MAX_FAN_IN,
+    serializer: Serializer = pickle,
+    tmpdir: None | str = None,
+) -> Iterator:
+    """Yields the items of the `it`erable in the sorted order.
+
+    The `it`erable is consumed in chunks of the `chunk_size` items,
+    each chunk is sorted in memory and spilled to a temporary file.
+    At most `max_fan_in` files are merged at once: when as many runs
+    of the same level are spilled, they are merged into a single file
+    of the next level, and the newest files are merged likewise
+    until `max_fan_in` remain, so only O(max_fan_in log(n / chunk_size))
+    files are open at a time.
+    The final files are merged lazily by `kmerge`, so only a chunk
+    (while spilling) or a batch of records per file (while merging)
+    are kept in memory.
+    The `key` is called once per item, its results are spilled
+    along with the items, so both must be serialisable.
+    The sort is stable.
+
+    Parameters
+    ----------
+    it : Iterable
+    key : None | Callable, default None
+    reverse : bool, default False
+    chunk_size : int, default CHUNK_SIZE
+        the number of items sorted in memory at once
+    max_fan_in : int, default MAX_FAN_IN
+        the number of files merged at once
+    serializer : Serializer, default pickle
+        the object with `dump(obj, file)` and `load(file)` methods
+    tmpdir : None | str, default None
+        the directory for the temporary files
+
+    Raises
+    ------
+    ValueError
+        if the `chunk_size` is not positive
+        or the `max_fan_in` is less than 2.
+
+    Returns
+    -------
+    Iterator
+    """
+
+    key = validate_key_arg(key)
+    if chunk_size < 1:
+        msg = f"chunk_size={chunk_size} must be positive"
+        raise ValueError(msg)
+    if max_fan_in < 2:
+        msg = f"max_fan_in={max_fan_in} must be at least 2"
+        raise ValueError(msg)
+
+    return _external_sort(
+        it,
+        key,
+        reverse=reverse,
+        chunk_size=chunk_size,
+        max_fan_in=max_fan_in,
+        serializer=serializer,
+        tmpdir=tmpdir,
+    )
@@ -0,0 +1,90 @@
+"""The "Heap sort" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/Heapsort
+"""
+
+from collections.abc import Callable, Sequence
+from operator import gt, lt
+
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
+
+
+def _sift_down(
+    lst: list,
+    offset: int,
+    root: int,
+    size: int,
+    *,
+    cmp: Callable,
+) -> None:
+    """Restore the heap property for the subtree at the `root`.
+
+    The heap occupies the `lst[offset:offset + size]` slice
+    and its indices are relative to the `offset`.
+    """
+
+    while (child := 2 * root + 1) < size:
+        if child + 1 < size and cmp(
+            lst[offset + child], lst[offset + child + 1]
+        ):
+            child += 1
+        if not cmp(lst[offset + root], lst[offset + child]):
+            return
+        lst[offset + root], lst[offset + child] = (
+            lst[offset + child],
+            lst[offset + root],
+        )
+        root = child
+
+
+def _heap_sort(
+    lst: list,
+    left: int,
+    right: int,
+    *,
+    cmp: Callable,
+) -> None:
+    """Sort the `lst[left:right + 1]` slice in place.
+
+    The `cmp(a, b)` is True if `a` must precede `b`.
+    """
+
+    size = right - left + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(lst, left, root, size, cmp=cmp)
+    for end in range(size - 1, 0, -1):
+        lst[left], lst[left + end] = lst[left + end], lst[left]
+        _sift_down(lst, left, 0, end, cmp=cmp)
+
+
+def heap_sort(
+    seq: Sequence,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+) -> list:
+    """Returns the sorted list.
+
+    Parameters
+    ----------
+    seq : Sequence
+    key : None | Callable, default None
+    reverse : bool, default False
+
+    Returns
+    -------
+    list
+    """
+
+    key = validate_key_arg(key)
+
+    records = decorate(seq, key, reverse=reverse)
+    cmp = gt if reverse else lt
+    _heap_sort(records, 0, len(records) - 1, cmp=cmp)
+    return undecorate(records)
@@ -8,7 +8,61 @@ References:
 from collections.abc import Callable, Sequence
 from operator import gt, lt
 
-from adspy.algorithms.sorting.common import validate_key_arg
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
+
+
+def _insertion_sort(
+    lst: list,
+    left: int,
+    right: int,
+    *,
+    cmp: Callable,
+) -> None:
+    """Sort the `lst[left:right + 1]` slice in place.
+
+    The `cmp(a, b)` is True if `a` must precede `b`.
+    """
+
+    for idx in range(left + 1, right + 1):
+        curr = lst[idx]
+        jdx = idx - 1
+        while jdx >= left and cmp(curr, lst[jdx]):
+            lst[jdx + 1] = lst[jdx]
+            jdx -= 1
+        lst[jdx + 1] = curr
+
+
+def _binary_insertion_sort(
+    lst: list,
+    left: int,
+    right: int,
+    start: int,
+    *,
+    cmp: Callable,
+) -> None:
+    """Sort the `lst[left:right + 1]` slice in place.
+
+    The `lst[left:start]` prefix must be already sorted.
+    The insertion points are found by bisection and
+    the items are shifted by slice assignments.
+    The `cmp(a, b)` is True if `a` must precede `b`.
+    """
+
+    for idx in range(max(start, left + 1), right + 1):
+        curr = lst[idx]
+        low, high = left, idx
+        while low < high:
+            mid = (low + high) // 2
+            if cmp(curr, lst[mid]):
+                high = mid
+            else:
+                low = mid + 1
+        lst[low + 1 : idx + 1] = lst[low:idx]
+        lst[low] = curr
 
 
 def insertion_sort(
@@ -32,15 +86,7 @@ def insertion_sort(
 
     key = validate_key_arg(key)
 
-    lst = list(seq)
-    if (size := len(lst)) < 2:
-        return lst
-    op = lt if reverse else gt
-    for idx in range(1, size):
-        curr = lst[idx]
-        jdx = idx - 1
-        while jdx > -1 and op(key(lst[jdx]), key(lst[jdx + 1])):
-            lst[jdx + 1], lst[jdx] = lst[jdx], lst[jdx + 1]
-            jdx -= 1
-        lst[jdx + 1] = curr
-    return lst
+    records = decorate(seq, key, reverse=reverse)
+    cmp = gt if reverse else lt
+    _insertion_sort(records, 0, len(records) - 1, cmp=cmp)
+    return undecorate(records)
@@ -3,27 +3,181 @@
 References:
 
 - https://en.wikipedia.org/wiki/Merge_sort
+- https://en.wikipedia.org/wiki/Merge_sort#Bottom-up_implementation
+- https://en.wikipedia.org/wiki/Timsort
+- https://github.com/python/cpython/blob/main/Objects/listsort.txt
 """
 
 from collections.abc import Callable, Sequence
+from operator import gt, lt
 
-from adspy.algorithms.sorting.common import merge, validate_key_arg
+from adspy.algorithms import vectorised
+from adspy.algorithms.sorting.common import (
+    Record,
+    decorate,
+    gallop,
+    merge_into,
+    merge_runs,
+    undecorate,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.insertion_sort import (
+    _binary_insertion_sort,
+    _insertion_sort,
+)
+
+# the initial runs of this size are sorted by insertion
+RUN_SIZE = 8
+# inputs shorter than this are sorted by binary insertion at once
+MIN_MERGE = 64
 
 
 def _merge_sort(
-    lst: list,
-    key: Callable | None = None,
+    lst: list[Record],
     *,
     reverse: bool = False,
-) -> list:
-    """The actual recursive implementation."""
+) -> list[Record]:
+    """The actual iterative bottom-up implementation.
+
+    The runs of doubling width are merged back and forth
+    between the `lst` and a single auxiliary buffer,
+    the sorted records end up in one of them.
+    """
+
+    size = len(lst)
+    cmp = gt if reverse else lt
+    for left in range(0, size, RUN_SIZE):
+        _insertion_sort(lst, left, min(left + RUN_SIZE, size) - 1, cmp=cmp)
+
+    src: list = lst
+    dst: list = [None] * size
+    width = RUN_SIZE
+    while width < size:
+        for left in range(0, size, 2 * width):
+            mid = min(left + width, size)
+            right = min(mid + width, size)
+            merge_into(src, dst, left, mid, right, reverse=reverse)
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def _min_run(size: int) -> int:
+    """Returns the minimal natural run length for the `size` items.
+
+    The result is in the `[MIN_MERGE // 2, MIN_MERGE]` range
+    (unless the `size` is smaller), so that `size / min_run`
+    is a power of two or slightly less.
+    """
+
+    extra = 0
+    while size >= MIN_MERGE:
+        extra |= size & 1
+        size >>= 1
+    return size + extra
+
+
+def _count_run(lst: list[Record], lo: int, hi: int, *, cmp: Callable) -> int:
+    """Returns the length of the natural run starting at the `lo`.
+
+    A descending run is reversed in place. Records are distinct,
+    so descending runs are strictly descending and reversing them
+    keeps the sort stable.
+    """
+
+    if hi - lo < 2:
+        return hi - lo
+    end = lo + 2
+    if cmp(lst[lo + 1], lst[lo]):
+        while (end < hi) and cmp(lst[end], lst[end - 1]):
+            end += 1
+        lst[lo:end] = lst[lo:end][::-1]
+    else:
+        while (end < hi) and not cmp(lst[end], lst[end - 1]):
+            end += 1
+    return end - lo
+
+
+def _merge_at(
+    lst: list[Record],
+    runs: list[tuple[int, int]],
+    idx: int,
+    *,
+    reverse: bool,
+) -> None:
+    """Merge the `idx`-th and the next runs of the stack."""
 
-    if (size := len(lst)) < 2:
-        return lst
-    mid = size // 2
-    left_half = _merge_sort(lst[:mid], key, reverse=reverse)
-    right_half = _merge_sort(lst[mid:], key, reverse=reverse)
-    return merge(left_half, right_half, key, reverse=reverse)
+    base1, len1 = runs[idx]
+    base2, len2 = runs[idx + 1]
+    runs[idx] = (base1, len1 + len2)
+    del runs[idx + 1]
+
+    # the left run items preceding the right run are already in place
+    lo = gallop(lst[base2], lst, base1, base2, reverse=reverse, right=True)
+    if lo == base2:
+        return
+    # the right run items following the left run are already in place
+    hi = gallop(lst[base2 - 1], lst, base2, base2 + len2, reverse=reverse)
+    merge_runs(lst, lo, base2, hi, reverse=reverse)
+
+
+def _merge_collapse(
+    lst: list[Record],
+    runs: list[tuple[int, int]],
+    *,
+    reverse: bool,
+) -> None:
+    """Merge the runs until the stack invariants hold.
+
+    For the run lengths A, B, C, D from the top of the stack:
+    C > B + A, D > C + B and B > A.
+    """
+
+    while len(runs) > 1:
+        idx = len(runs) - 2
+        if (
+            idx > 0 and runs[idx - 1][1] <= runs[idx][1] + runs[idx + 1][1]
+        ) or (idx > 1 and runs[idx - 2][1] <= runs[idx - 1][1] + runs[idx][1]):
+            if runs[idx - 1][1] < runs[idx + 1][1]:
+                idx -= 1
+        elif runs[idx][1] > runs[idx + 1][1]:
+            return
+        _merge_at(lst, runs, idx, reverse=reverse)
+
+
+def _adaptive_merge_sort(
+    lst: list[Record],
+    *,
+    reverse: bool = False,
+) -> list[Record]:
+    """The Timsort-like natural merge sort.
+
+    The natural runs shorter than the minimal run length
+    are extended by binary insertion and pushed onto the stack,
+    which is kept balanced by merging. Already sorted input
+    costs n - 1 comparisons.
+    """
+
+    size = len(lst)
+    cmp = gt if reverse else lt
+    min_run = _min_run(size)
+    runs: list[tuple[int, int]] = []
+    lo = 0
+    while lo < size:
+        run = _count_run(lst, lo, size, cmp=cmp)
+        if run < min_run:
+            force = min(min_run, size - lo)
+            _binary_insertion_sort(lst, lo, lo + force - 1, lo + run, cmp=cmp)
+            run = force
+        runs.append((lo, run))
+        _merge_collapse(lst, runs, reverse=reverse)
+        lo += run
+    while len(runs) > 1:
+        idx = len(runs) - 2
+        if idx > 0 and runs[idx - 1][1] < runs[idx + 1][1]:
+            idx -= 1
+        _merge_at(lst, runs, idx, reverse=reverse)
+    return lst
 
 
 def merge_sort(
@@ -31,23 +185,36 @@ def merge_sort(
     key: None | Callable = None,
     *,
     reverse: bool = False,
+    adaptive: bool = False,
 ) -> list:
     """Returns the sorted list.
 
+    The numeric NumPy arrays and `array.array`s are sorted
+    by the NumPy-vectorised backend if NumPy is installed,
+    if the `key` is None or a NumPy ufunc (e.g. `np.abs`),
+    other keys are applied per item.
+
     Parameters
     ----------
     seq : Sequence
     key : None | Callable, default None
     reverse : bool, default False
+    adaptive : bool, default False
+        if True, then the natural runs of the input are merged
+        (Timsort-like), so (nearly) sorted input is sorted
+        in (nearly) linear time.
 
     Returns
     -------
     list
     """
 
+    if (result := vectorised.sort(seq, key, reverse=reverse)) is not None:
+        return result
+
     key = validate_key_arg(key)
 
-    lst = list(seq)
-    if len(lst) > 1:
-        lst = _merge_sort(lst, key=key, reverse=reverse)
-    return lst
+    records = decorate(vectorised.python_items(seq), key, reverse=reverse)
+    if adaptive:
+        return undecorate(_adaptive_merge_sort(records, reverse=reverse))
+    return undecorate(_merge_sort(records, reverse=reverse))
@@ -0,0 +1,87 @@
+"""The parallel "Merge sort" algorithm.
+
+References:
+
+- https://en.wikipedia.org/wiki/Merge_sort#Parallel_merge_sort
+"""
+
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from adspy.algorithms.sorting.common import (
+    Record,
+    decorate,
+    kmerge,
+    undecorate,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.merge_sort import _merge_sort
+
+# inputs shorter than this per worker are not worth the processes
+MIN_CHUNK_SIZE = 10_000
+
+
+def _sort_chunk(records: list[Record], *, reverse: bool) -> list[Record]:
+    """Returns the sorted chunk (runs in a worker process)."""
+    return _merge_sort(records, reverse=reverse)
+
+
+def parallel_merge_sort(
+    seq: Sequence,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+    workers: None | int = None,
+) -> list:
+    """Returns the sorted list.
+
+    The input is split into one chunk per worker,
+    the chunks are sorted by `merge_sort` in a process pool
+    and the sorted chunks are merged by `kmerge`.
+    The `key` is called in the calling process only,
+    so it need not be picklable, but its results and the items must be.
+    The sort is stable.
+
+    Parameters
+    ----------
+    seq : Sequence
+    key : None | Callable, default None
+    reverse : bool, default False
+    workers : None | int, default None
+        the number of worker processes, `os.cpu_count()` if None
+
+    Raises
+    ------
+    ValueError
+        if the `workers` is not positive.
+
+    Returns
+    -------
+    list
+    """
+
+    key = validate_key_arg(key)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        msg = f"workers={workers} must be positive"
+        raise ValueError(msg)
+
+    records = decorate(seq, key, reverse=reverse)
+    workers = min(workers, max(1, len(records) // MIN_CHUNK_SIZE))
+    if workers == 1:
+        return undecorate(_merge_sort(records, reverse=reverse))
+
+    size = -(-len(records) // workers)
+    chunks = [
+        records[start : start + size] for start in range(0, len(records), size)
+    ]
+    del records
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        sorted_chunks = list(
+            executor.map(partial(_sort_chunk, reverse=reverse), chunks)
+        )
+    del chunks
+    return undecorate(kmerge(*sorted_chunks, reverse=reverse))
@@ -3,24 +3,27 @@
 References:
 
 - https://en.wikipedia.org/wiki/Quicksort
+- https://en.wikipedia.org/wiki/Introsort
+- https://en.wikipedia.org/wiki/Dutch_national_flag_problem
 """
 
 from collections.abc import Callable, Sequence
 from operator import gt, lt
 from random import randint
-from typing import Any
 
-from adspy.algorithms.sorting.common import validate_key_arg
+from adspy.algorithms import vectorised
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.heap_sort import _heap_sort
+from adspy.algorithms.sorting.insertion_sort import _insertion_sort
 
-
-def _compare(
-    left: Any,
-    right: Any,
-    *,
-    key: Callable[[Any], Any],
-    cmp: Callable[[Any, Any], bool],
-) -> bool:
-    return cmp(key(left), key(right))
+# partitions of this size or smaller are sorted by insertion
+INSERTION_THRESHOLD = 16
+# partitions larger than this pick the pivot by "ninther"
+NINTHER_THRESHOLD = 128
 
 
 def _quick_sort(
@@ -28,7 +31,6 @@ def _quick_sort(
     left: int,
     right: int,
     *,
-    key: Callable,
     cmp: Callable,
 ) -> None:
     """The actual recursive implementation."""
@@ -37,7 +39,7 @@ def _quick_sort(
     if left >= right:
         return
     if (right - left) == 1:
-        if not _compare(lst[left], lst[right], key=key, cmp=cmp):
+        if not cmp(lst[left], lst[right]):
             lst[left], lst[right] = lst[right], lst[left]
         return
 
@@ -47,18 +49,161 @@ def _quick_sort(
     # partitioning
     lefter, righter = left, right
     while lefter < righter:
-        while (lefter < righter) and _compare(
-            lst[lefter], pivot, key=key, cmp=cmp
-        ):
+        while (lefter < righter) and cmp(lst[lefter], pivot):
             lefter += 1
-        while (lefter < righter) and (
-            not _compare(lst[righter], pivot, key=key, cmp=cmp)
-        ):
+        while (lefter < righter) and (not cmp(lst[righter], pivot)):
             righter -= 1
         if lefter != righter:
             lst[lefter], lst[righter] = lst[righter], lst[lefter]
-    _quick_sort(lst, left, righter - 1, key=key, cmp=cmp)
-    _quick_sort(lst, righter, right, key=key, cmp=cmp)
+    _quick_sort(lst, left, righter - 1, cmp=cmp)
+    _quick_sort(lst, righter, right, cmp=cmp)
+
+
+def _three_way_partition(
+    lst: list,
+    left: int,
+    right: int,
+    pidx: int,
+    *,
+    cmp: Callable,
+) -> tuple[int, int]:
+    """Returns `(lower, upper)` bounds of the items equal to the pivot.
+
+    The items are compared by their keys only, so all the records
+    with the pivot key end up in the `lst[lower:upper + 1]` slice
+    and need no further sorting. The partitioning is stable.
+    """
+
+    pivot = lst[pidx][0]
+    less, equal, greater = [], [], []
+    for record in lst[left : right + 1]:
+        if cmp(record[0], pivot):
+            less.append(record)
+        elif cmp(pivot, record[0]):
+            greater.append(record)
+        else:
+            equal.append(record)
+    lower = left + len(less)
+    upper = lower + len(equal) - 1
+    lst[left:lower] = less
+    lst[lower : upper + 1] = equal
+    lst[upper + 1 : right + 1] = greater
+    return lower, upper
+
+
+def _three_way_quick_sort(
+    lst: list,
+    left: int,
+    right: int,
+    *,
+    cmp: Callable,
+) -> None:
+    """The recursive implementation with three-way partitioning."""
+
+    if left >= right:
+        return
+    pidx = randint(left, right)
+    lower, upper = _three_way_partition(lst, left, right, pidx, cmp=cmp)
+    _three_way_quick_sort(lst, left, lower - 1, cmp=cmp)
+    _three_way_quick_sort(lst, upper + 1, right, cmp=cmp)
+
+
+def _median_of_three(
+    lst: list,
+    idx1: int,
+    idx2: int,
+    idx3: int,
+    *,
+    cmp: Callable,
+) -> int:
+    """Returns the index of the median item of the three ones."""
+
+    if cmp(lst[idx1], lst[idx2]):
+        if cmp(lst[idx2], lst[idx3]):
+            return idx2
+        return idx3 if cmp(lst[idx1], lst[idx3]) else idx1
+    if cmp(lst[idx1], lst[idx3]):
+        return idx1
+    return idx3 if cmp(lst[idx2], lst[idx3]) else idx2
+
+
+def _choose_pivot(lst: list, left: int, right: int, *, cmp: Callable) -> int:
+    """Returns the pivot index: median-of-three or Tukey's ninther."""
+
+    mid = (left + right) // 2
+    if (right - left) < NINTHER_THRESHOLD:
+        return _median_of_three(lst, left, mid, right, cmp=cmp)
+    step = (right - left) // 8
+    return _median_of_three(
+        lst,
+        _median_of_three(lst, left, left + step, left + 2 * step, cmp=cmp),
+        _median_of_three(lst, mid - step, mid, mid + step, cmp=cmp),
+        _median_of_three(lst, right - 2 * step, right - step, right, cmp=cmp),
+        cmp=cmp,
+    )
+
+
+def _hoare_partition(
+    lst: list,
+    left: int,
+    right: int,
+    *,
+    cmp: Callable,
+) -> int:
+    """Returns `jdx` splitting the slice into `[left, jdx]` and the rest.
+
+    The items must be distinct and the pivot must be neither
+    the minimum nor the maximum of the slice.
+    """
+
+    pivot = lst[_choose_pivot(lst, left, right, cmp=cmp)]
+    idx, jdx = left, right
+    while True:
+        while cmp(lst[idx], pivot):
+            idx += 1
+        while cmp(pivot, lst[jdx]):
+            jdx -= 1
+        if idx >= jdx:
+            return jdx
+        lst[idx], lst[jdx] = lst[jdx], lst[idx]
+        idx += 1
+        jdx -= 1
+
+
+def _introsort(
+    lst: list,
+    *,
+    cmp: Callable,
+    three_way: bool = False,
+) -> None:
+    """The iterative introspective sort.
+
+    Small partitions are finished by insertion sort and
+    too deep partitioning falls back to heap sort.
+    """
+
+    size = len(lst)
+    stack = [(0, size - 1, 2 * (size.bit_length() - 1))]
+    while stack:
+        left, right, depth = stack.pop()
+        if (right - left) < INSERTION_THRESHOLD:
+            _insertion_sort(lst, left, right, cmp=cmp)
+            continue
+        if not depth:
+            _heap_sort(lst, left, right, cmp=cmp)
+            continue
+        if three_way:
+            pidx = _choose_pivot(lst, left, right, cmp=cmp)
+            lower, upper = _three_way_partition(lst, left, right, pidx, cmp=cmp)
+            small, large = (left, lower - 1), (upper + 1, right)
+        else:
+            mid = _hoare_partition(lst, left, right, cmp=cmp)
+            small, large = (left, mid), (mid + 1, right)
+        if (small[1] - small[0]) > (large[1] - large[0]):
+            small, large = large, small
+        # the smaller partition is popped first to bound the stack size
+        stack.append((*large, depth - 1))
+        stack.append((*small, depth - 1))
 
 
 def quick_sort(
@@ -66,24 +211,46 @@ def quick_sort(
     key: None | Callable = None,
     *,
     reverse: bool = False,
+    introsort: bool = False,
+    three_way: bool = False,
 ) -> list:
     """Returns the sorted list.
 
+    The numeric NumPy arrays and `array.array`s are sorted
+    by the NumPy-vectorised backend if NumPy is installed,
+    if the `key` is None or a NumPy ufunc (e.g. `np.abs`),
+    other keys are applied per item.
+
     Parameters
     ----------
     seq : Sequence
     key : None | Callable, default None
     reverse : bool, default False
+    introsort : bool, default False
+        if True, then the introspective sort is used:
+        no recursion and O(n log n) comparisons in the worst case.
+    three_way : bool, default False
+        if True, then the items with the pivot key are grouped together
+        and excluded from further partitioning,
+        which pays off for many duplicate keys.
 
     Returns
     -------
     list
     """
 
+    if (result := vectorised.sort(seq, key, reverse=reverse)) is not None:
+        return result
+
     key = validate_key_arg(key)
 
-    lst = list(seq)
-    if (size := len(lst)) > 1:
+    records = decorate(vectorised.python_items(seq), key, reverse=reverse)
+    if (size := len(records)) > 1:
         cmp = gt if reverse else lt
-        _quick_sort(lst, 0, size - 1, key=key, cmp=cmp)
-    return lst
+        if introsort:
+            _introsort(records, cmp=cmp, three_way=three_way)
+        elif three_way:
+            _three_way_quick_sort(records, 0, size - 1, cmp=cmp)
+        else:
+            _quick_sort(records, 0, size - 1, cmp=cmp)
+    return undecorate(records)
@@ -0,0 +1,171 @@
+"""The "Radix sort" algorithms.
+
+References:
+
+- https://en.wikipedia.org/wiki/Radix_sort
+"""
+
+from collections.abc import Callable, Sequence
+from operator import gt, lt
+
+from adspy.algorithms.sorting.common import (
+    Record,
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
+from adspy.algorithms.sorting.insertion_sort import _insertion_sort
+from adspy.algorithms.sorting.merge_sort import _merge_sort
+
+# a byte digit plus the "end of key" digit
+RADIX = 257
+# buckets of this size or smaller are sorted by insertion
+INSERTION_THRESHOLD = 16
+
+
+def _byte_keys(records: list[Record]) -> None | list[bytes]:
+    """Returns the keys as bytes of the same order or None.
+
+    The integers become big-endian bytes of the same width
+    (offset by the minimum), the strings are UTF-8 encoded
+    (which preserves the code point order).
+    None is returned for any other or mixed key types.
+    """
+
+    keys = [record[0] for record in records]
+    if all(isinstance(key, int) for key in keys):
+        low = min(keys, default=0)
+        width = max(1, ((max(keys, default=0) - low).bit_length() + 7) // 8)
+        return [(key - low).to_bytes(width, "big") for key in keys]
+    if all(isinstance(key, (bytes, bytearray)) for key in keys):
+        return [bytes(key) for key in keys]
+    if all(isinstance(key, str) for key in keys):
+        return [key.encode("utf-8", "surrogatepass") for key in keys]
+    return None
+
+
+def _digit(bkey: bytes, pos: int) -> int:
+    """Returns the digit at the `pos`, 0 past the end of the key."""
+    return bkey[pos] + 1 if pos < len(bkey) else 0
+
+
+def _lsd_radix_sort(
+    records: list[Record],
+    *,
+    reverse: bool = False,
+) -> list[Record]:
+    """The actual least significant digit implementation."""
+
+    if (bkeys := _byte_keys(records)) is None:
+        return _merge_sort(records, reverse=reverse)
+
+    items = list(zip(bkeys, records, strict=True))
+    width = max(map(len, bkeys), default=0)
+    for pos in range(width - 1, -1, -1):
+        buckets: list[list] = [[] for _ in range(RADIX)]
+        for item in items:
+            buckets[_digit(item[0], pos)].append(item)
+        if reverse:
+            buckets.reverse()
+        items = [item for bucket in buckets for item in bucket]
+    return [item[1] for item in items]
+
+
+def _msd_radix_sort(
+    records: list[Record],
+    *,
+    reverse: bool = False,
+) -> list[Record]:
+    """The actual most significant digit implementation.
+
+    The buckets are processed with an explicit stack
+    in the output order, so long keys cause no recursion.
+    """
+
+    if (bkeys := _byte_keys(records)) is None:
+        return _merge_sort(records, reverse=reverse)
+
+    cmp = gt if reverse else lt
+    result: list[Record] = []
+    # the None position marks the items with equal keys
+    stack: list[tuple[list, None | int]] = [
+        (list(zip(bkeys, records, strict=True)), 0)
+    ]
+    while stack:
+        items, pos = stack.pop()
+        if pos is None:
+            result.extend(item[1] for item in items)
+            continue
+        if len(items) <= INSERTION_THRESHOLD:
+            _insertion_sort(items, 0, len(items) - 1, cmp=cmp)
+            result.extend(item[1] for item in items)
+            continue
+        buckets: list[list] = [[] for _ in range(RADIX)]
+        for item in items:
+            buckets[_digit(item[0], pos)].append(item)
+        # the stack is popped in the reverse order
+        digits = range(RADIX) if reverse else range(RADIX - 1, -1, -1)
+        for digit in digits:
+            if buckets[digit]:
+                stack.append((buckets[digit], pos + 1 if digit else None))
+    return result
+
+
+def lsd_radix_sort(
+    seq: Sequence,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+) -> list:
+    """Returns the sorted list.
+
+    The keys must be all integers, all bytes or all strings,
+    they are sorted byte by byte from the least significant one
+    in O(n * w) time for the w bytes long keys.
+    Otherwise `merge_sort` is used. The sort is stable.
+
+    Parameters
+    ----------
+    seq : Sequence
+    key : None | Callable, default None
+    reverse : bool, default False
+
+    Returns
+    -------
+    list
+    """
+
+    key = validate_key_arg(key)
+
+    records = decorate(seq, key, reverse=reverse)
+    return undecorate(_lsd_radix_sort(records, reverse=reverse))
+
+
+def msd_radix_sort(
+    seq: Sequence,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+) -> list:
+    """Returns the sorted list.
+
+    The keys must be all integers, all bytes or all strings,
+    they are distributed byte by byte from the most significant one,
+    so only the distinguishing prefixes of the keys are examined.
+    Otherwise `merge_sort` is used. The sort is stable.
+
+    Parameters
+    ----------
+    seq : Sequence
+    key : None | Callable, default None
+    reverse : bool, default False
+
+    Returns
+    -------
+    list
+    """
+
+    key = validate_key_arg(key)
+
+    records = decorate(seq, key, reverse=reverse)
+    return undecorate(_msd_radix_sort(records, reverse=reverse))
@@ -8,7 +8,11 @@ References:
 from collections.abc import Callable, Sequence
 from operator import gt, lt
 
-from adspy.algorithms.sorting.common import validate_key_arg
+from adspy.algorithms.sorting.common import (
+    decorate,
+    undecorate,
+    validate_key_arg,
+)
 
 
 def selection_sort(
@@ -32,15 +36,14 @@ def selection_sort(
 
     key = validate_key_arg(key)
 
-    lst = list(seq)
-    if (size := len(lst)) < 2:
-        return lst
+    records = decorate(seq, key, reverse=reverse)
+    size = len(records)
     op = gt if reverse else lt
-    for idx in range(size):
+    for idx in range(size - 1):
         imin = idx
         for jdx in range(idx + 1, size):
-            if op(key(lst[jdx]), key(lst[imin])):
+            if op(records[jdx], records[imin]):
                 imin = jdx
         if imin != idx:
-            lst[idx], lst[imin] = lst[imin], lst[idx]
-    return lst
+            records[idx], records[imin] = records[imin], records[idx]
+    return undecorate(records)
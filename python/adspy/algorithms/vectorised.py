@@ -0,0 +1,186 @@
+"""The optional NumPy-vectorised backend of the algorithms.
+
+The backend is used only if NumPy is installed (the "numpy" extra)
+and the input is a one-dimensional NumPy array or an `array.array`
+of numbers. Otherwise the functions return None and the callers
+proceed with their pure Python implementations.
+"""
+
+from array import array
+from collections.abc import Callable
+from numbers import Number
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+# the `array.array` type codes of characters
+_CHAR_TYPECODES = frozenset("uw")
+# the NumPy dtype kinds of booleans, (un)signed integers and floats
+_NUMERIC_KINDS = frozenset("biuf")
+
+
+def numeric_array(seq: Any) -> Any:
+    """Returns the NumPy array (a view, if possible) of the `seq` or None.
+
+    None is returned if NumPy is not installed or the `seq`
+    is neither a 1-D numeric NumPy array nor a numeric `array.array`.
+    """
+
+    if not HAS_NUMPY:
+        return None
+    if isinstance(seq, array):
+        if seq.typecode in _CHAR_TYPECODES:
+            return None
+        return np.asarray(seq)
+    if isinstance(seq, np.ndarray) and seq.ndim == 1:
+        return seq if seq.dtype.kind in _NUMERIC_KINDS else None
+    return None
+
+
+def python_items(seq: Any) -> Any:
+    """Returns the list of the Python numbers of the numeric `seq`.
+
+    The keys applied per item see the Python numbers then,
+    not the fixed-width NumPy scalars. Other `seq`s are returned as is.
+    """
+
+    if (arr := numeric_array(seq)) is None:
+        return seq
+    return arr.tolist()
+
+
+def vectorised_keys(arr: Any, key: None | Callable) -> Any:
+    """Returns the keys of the `arr` items or None.
+
+    Only the NumPy ufuncs (e.g. `np.abs` or `np.negative`) are applied
+    to the whole array at once, they opt in to the NumPy semantics
+    (the fixed-width integers wrap around on overflow).
+    None is returned for any other `key` or if the ufunc does not return
+    a numeric array of the same shape, then the `key` must be applied
+    per item with the Python semantics.
+    """
+
+    if key is None:
+        return arr
+    if not isinstance(key, np.ufunc):
+        return None
+    try:
+        keys = np.asarray(key(arr))
+    except (TypeError, ValueError):
+        return None
+    if keys.shape != arr.shape or keys.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    return keys
+
+
+def argsort(keys: Any, *, reverse: bool = False) -> Any:
+    """Returns the stable sorting permutation of the `keys`."""
+
+    if not reverse:
+        return np.argsort(keys, kind="stable")
+    # the stable descending order: equal keys keep their order
+    size = len(keys)
+    return (size - 1) - np.argsort(keys[::-1], kind="stable")[::-1]
+
+
+def sort(
+    seq: Any,
+    key: None | Callable = None,
+    *,
+    reverse: bool = False,
+) -> None | list:
+    """Returns the sorted list of the numeric `seq` or None.
+
+    Parameters
+    ----------
+    seq : Any
+    key : None | Callable, default None
+        the NumPy ufunc, None is returned for other callables
+    reverse : bool, default False
+
+    Returns
+    -------
+    None | list
+    """
+
+    if (arr := numeric_array(seq)) is None:
+        return None
+    if (keys := vectorised_keys(arr, key)) is None:
+        return None
+    result: list = arr[argsort(keys, reverse=reverse)].tolist()
+    return result
+
+
+def search(
+    seq: Any,
+    value: Any,
+    *,
+    lo: int = 0,
+    hi: None | int = None,
+    right: bool = False,
+) -> None | int:
+    """Returns the insertion point of the `value` into the numeric `seq`.
+
+    The `seq[lo:hi]` slice (a view) must be sorted.
+    None is returned if the backend is not applicable.
+    No `key` is accepted: it would be computed over the whole slice,
+    so the keyed searches bisect with a `key` call per probe instead.
+
+    Parameters
+    ----------
+    seq : Any
+    value : Any
+    lo : int, default 0
+    hi : None | int, default None
+        the bounds of the searched slice
+    right : bool, default False
+        if True, then the point is after the items equal to the `value`
+
+    Returns
+    -------
+    None | int
+    """
+
+    is_number = isinstance(value, Number)
+    if not is_number or (arr := numeric_array(seq)) is None:
+        return None
+    pos = np.searchsorted(arr[lo:hi], value, side="right" if right else "left")
+    return lo + int(pos)
+
+
+def search_batch(
+    seq: Any,
+    values: Any,
+    *,
+    right: bool = False,
+) -> None | list[int]:
+    """Returns the insertion points of the numeric `values` into the `seq`.
+
+    The `seq` must be sorted.
+    None is returned if the backend is not applicable.
+
+    Parameters
+    ----------
+    seq : Any
+    values : Any
+    right : bool, default False
+        if True, then the points are after the items equal to the values
+
+    Returns
+    -------
+    None | list[int]
+    """
+
+    if (arr := numeric_array(seq)) is None:
+        return None
+    queries = np.asarray(values)
+    if queries.ndim != 1 or queries.dtype.kind not in _NUMERIC_KINDS:
+        return None
+    pos = np.searchsorted(arr, queries, side="right" if right else "left")
+    points: list[int] = pos.tolist()
+    return points
@@ -1,4 +1,33 @@
-from adspy.data_structures.linked_lists import DoublyLinkedList
+from adspy.data_structures.caches import (
+    Cache,
+    CacheInfo,
+    LFUCache,
+    LRUCache,
+    lfu_cache,
+    lru_cache,
+    memoize,
+)
+from adspy.data_structures.compact_linked_lists import CompactLinkedList
+from adspy.data_structures.linked_lists import (
+    DoublyLinkedList,
+    DoublyLinkedNode,
+    LinkedListError,
+)
 from adspy.data_structures.queues import Deque
+from adspy.data_structures.ring_buffers import RingBuffer
 
-__all__ = ["Deque", "DoublyLinkedList"]
+__all__ = [
+    "Cache",
+    "CacheInfo",
+    "CompactLinkedList",
+    "Deque",
+    "DoublyLinkedList",
+    "DoublyLinkedNode",
+    "LFUCache",
+    "LRUCache",
+    "LinkedListError",
+    "RingBuffer",
+    "lfu_cache",
+    "lru_cache",
+    "memoize",
+]
@@ -0,0 +1,336 @@
+"""Cache data structures.
+
+References:
+
+- https://en.wikipedia.org/wiki/Cache_replacement_policies
+- http://dhruvbird.com/lfu.pdf
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
+from functools import wraps
+from typing import Any, NamedTuple, cast
+
+from adspy.data_structures.linked_lists import (
+    DoublyLinkedList,
+    DoublyLinkedNode,
+)
+
+_MISSING = object()
+# separates the positional and keyword arguments of the memoised calls
+_KWARGS_MARK = object()
+
+
+class CacheInfo(NamedTuple):
+    """The cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: None | int
+    currsize: int
+
+
+class Cache(ABC):
+    """The bounded key-value cache.
+
+    The `maxsize` of None means the unbounded cache,
+    zero disables caching at all.
+    """
+
+    __slots__ = ("_maxsize", "_hits", "_misses", "_evictions")
+
+    def __init__(self, maxsize: None | int = 128) -> None:
+        if (maxsize is not None) and (maxsize < 0):
+            msg = f"maxsize={maxsize} must be non-negative"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @abstractmethod
+    def __contains__(self, key: Hashable) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    def __repr__(self) -> str:
+        cls_name = type(self).__name__
+        return f"{cls_name}(maxsize={self._maxsize})"
+
+    @property
+    def maxsize(self) -> None | int:
+        """Return the maximum number of the entries."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """Return the number of the found keys."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of the missing keys."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Return the number of the evicted entries."""
+        return self._evictions
+
+    def _is_full(self) -> bool:
+        return (self._maxsize is not None) and (len(self) >= self._maxsize)
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Remove all the entries."""
+
+    @abstractmethod
+    def _evict(self) -> None:
+        """Remove the entry chosen by the replacement policy."""
+
+    @abstractmethod
+    def _lookup(self, key: Hashable) -> Any:
+        """Return the value of the key (and mark it used) or `_MISSING`."""
+
+    @abstractmethod
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Add or update the entry, the cache is not full for the new ones."""
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        self._clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value of the key or the `default` if missing.
+
+        The lookup counts as a hit or a miss
+        and the found entry is marked as used.
+        """
+        value = self._lookup(key)
+        if value is _MISSING:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return value
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, self._maxsize, len(self)
+        )
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add or update the entry.
+
+        If the cache is full, then an entry is evicted for the new key.
+        """
+        if self._maxsize == 0:
+            return
+        if (key not in self) and self._is_full():
+            self._evict()
+            self._evictions += 1
+        self._store(key, value)
+
+
+class LRUCache(Cache):
+    """The Least Recently Used cache.
+
+    The entries are kept in the order of use, the most recent first,
+    and the least recent entry (the tail) is evicted.
+    All the operations are O(1): the keys are mapped
+    to the `DoublyLinkedNode` handles of the entries.
+    """
+
+    __slots__ = ("_nodes", "_order")
+
+    def __init__(self, maxsize: None | int = 128) -> None:
+        super().__init__(maxsize)
+        self._nodes: dict[Hashable, DoublyLinkedNode] = {}
+        # the (key, value) entries
+        self._order = DoublyLinkedList()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _clear(self) -> None:
+        self._nodes.clear()
+        self._order.clear()
+
+    def _evict(self) -> None:
+        key, _ = self._order.popright()
+        del self._nodes[key]
+
+    def _lookup(self, key: Hashable) -> Any:
+        if (node := self._nodes.get(key)) is None:
+            return _MISSING
+        self._order.move_to_front(node)
+        return node.value[1]
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if (node := self._nodes.get(key)) is None:
+            self._nodes[key] = self._order.prepend((key, value))
+            return
+        self._order.set_value(node, (key, value))
+        self._order.move_to_front(node)
+
+
+class _LFUEntry:
+    """The entry of the `LFUCache`."""
+
+    __slots__ = ("key", "value", "bucket")
+
+    def __init__(
+        self, key: Hashable, value: Any, bucket: DoublyLinkedNode
+    ) -> None:
+        self.key = key
+        self.value = value
+        # the node of the frequency bucket of the entry
+        self.bucket = bucket
+
+
+class _LFUBucket:
+    """The entries of the `LFUCache` used the same number of times."""
+
+    __slots__ = ("frequency", "entries")
+
+    def __init__(self, frequency: int) -> None:
+        self.frequency = frequency
+        # the nodes of the entries, the least recently used first
+        self.entries = DoublyLinkedList()
+
+
+class LFUCache(Cache):
+    """The Least Frequently Used cache.
+
+    The entries are grouped into the buckets by their use counts,
+    the buckets are linked in the increasing order of the counts,
+    so an entry moves to the next bucket (or a new one) on every use.
+    The least recently used entry of the first bucket is evicted.
+    All the operations are O(1).
+    """
+
+    __slots__ = ("_nodes", "_buckets")
+
+    def __init__(self, maxsize: None | int = 128) -> None:
+        super().__init__(maxsize)
+        self._nodes: dict[Hashable, DoublyLinkedNode] = {}
+        # the `_LFUBucket`s in the increasing order of the frequencies
+        self._buckets = DoublyLinkedList()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def frequency(self, key: Hashable) -> int:
+        """Return the use count of the key, zero if missing."""
+        if (node := self._nodes.get(key)) is None:
+            return 0
+        bucket: _LFUBucket = node.value.bucket.value
+        return bucket.frequency
+
+    def _clear(self) -> None:
+        self._nodes.clear()
+        self._buckets.clear()
+
+    def _evict(self) -> None:
+        bucket_node = cast("DoublyLinkedNode", self._buckets.head)
+        bucket: _LFUBucket = bucket_node.value
+        entry: _LFUEntry = bucket.entries.popleft()
+        del self._nodes[entry.key]
+        if not bucket.entries:
+            self._buckets.remove_node(bucket_node)
+
+    def _touch(self, node: DoublyLinkedNode) -> None:
+        """Move the entry of the node to the next frequency bucket."""
+        entry: _LFUEntry = node.value
+        bucket_node = entry.bucket
+        bucket: _LFUBucket = bucket_node.value
+
+        post = bucket_node.next
+        if (post is None) or (post.value.frequency != bucket.frequency + 1):
+            post = self._buckets.insert_after(
+                bucket_node, _LFUBucket(bucket.frequency + 1)
+            )
+        bucket.entries.remove_node(node)
+        if not bucket.entries:
+            self._buckets.remove_node(bucket_node)
+
+        entry.bucket = post
+        self._nodes[entry.key] = post.value.entries.append(entry)
+
+    def _lookup(self, key: Hashable) -> Any:
+        if (node := self._nodes.get(key)) is None:
+            return _MISSING
+        entry: _LFUEntry = node.value
+        self._touch(node)
+        return entry.value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        if (node := self._nodes.get(key)) is not None:
+            node.value.value = value
+            self._touch(node)
+            return
+        first = self._buckets.head
+        if (first is None) or (first.value.frequency != 1):
+            first = self._buckets.prepend(_LFUBucket(1))
+        entry = _LFUEntry(key, value, first)
+        self._nodes[key] = first.value.entries.append(entry)
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """Return the cache key of the call arguments."""
+    if not kwargs:
+        return args
+    return (*args, _KWARGS_MARK, *kwargs.items())
+
+
+def memoize(cache: Cache) -> Callable[[Callable], Callable]:
+    """Return the decorator caching the results in the `cache`.
+
+    The arguments of the calls must be hashable.
+    The decorated function has the `cache` attribute
+    and the `cache_info` and `cache_clear` functions
+    like the `functools.lru_cache` ones.
+
+    Parameters
+    ----------
+    cache : Cache
+
+    Returns
+    -------
+    Callable[[Callable], Callable]
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+            if (result := cache.get(key, _MISSING)) is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore [attr-defined]
+        wrapper.cache_info = cache.info  # type: ignore [attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore [attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def lru_cache(maxsize: None | int = 128) -> Callable[[Callable], Callable]:
+    """Return the decorator caching the results in the `LRUCache`."""
+    return memoize(LRUCache(maxsize))
+
+
+def lfu_cache(maxsize: None | int = 128) -> Callable[[Callable], Callable]:
+    """Return the decorator caching the results in the `LFUCache`."""
+    return memoize(LFUCache(maxsize))
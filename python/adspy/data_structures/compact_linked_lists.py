@@ -0,0 +1,414 @@
+"""The compact (array-backed) doubly linked list data structure.
+
+References:
+
+- https://en.wikipedia.org/wiki/Linked_list#Linked_lists_using_arrays_of_nodes
+- https://en.wikipedia.org/wiki/Free_list
+"""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from functools import total_ordering
+from sys import maxsize as MAX_INT
+from typing import Any
+
+from typing_extensions import Self
+
+# the missing slot, the end of the list
+NIL = -1
+
+
+def _links(start: int, stop: int) -> "array[int]":
+    """Return the array of the integers from the `start` to the `stop`."""
+    return array("q", range(start, stop))
+
+
+@total_ordering
+class CompactLinkedList(MutableSequence):
+    """Doubly Linked List stored in the parallel arrays.
+
+    Every item takes a slot: its value is in the `values` list
+    and its neighbours are the slots in the `prev` and `next` arrays
+    of the 64-bit integers (-1 for none). So an item costs
+    3 machine words instead of a node object,
+    and the garbage collector tracks only one list.
+    The slots of the removed items are kept in the free list
+    and reused by the next insertions; once more than half of the slots
+    are free, the items are compacted into the consecutive ones,
+    which is O(1) amortised.
+
+    The list has the same API and complexities as the `DoublyLinkedList`
+    without the node handles and the `indexed` mode,
+    its `reverse` is O(1): the `prev` and `next` arrays are swapped.
+    Both lists raise `ValueError` removing a missing value, as `list` does.
+    """
+
+    __slots__ = ("_values", "_prev", "_next", "_free", "_head", "_tail")
+
+    def __init__(self, it: None | Iterable = None, /) -> None:
+        self._reset([])
+        self.extend(it or ())
+
+    def __add__(self, other: Iterable) -> Self:
+        clist = self.copy()
+        clist += other
+        return clist
+
+    def __bool__(self) -> bool:
+        return self._head != NIL
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item is value or item == value for item in self)
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def _slot_at(self, index: int, /) -> int:
+        """Return the slot of the item at the index.
+
+        The slot is reached from the nearer end of the list.
+
+        Raises
+        ------
+        IndexError
+            if the index is out of range
+        """
+        length = len(self)
+        idx = index + length if index < 0 else index
+        if not 0 <= idx < length:
+            msg = f"index={index} out of range"
+            raise IndexError(msg)
+
+        if idx < length // 2:
+            slot, links, steps = self._head, self._next, idx
+        else:
+            slot, links, steps = self._tail, self._prev, length - 1 - idx
+        for _ in range(steps):
+            slot = links[slot]
+        return slot
+
+    def __delitem__(self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            items = list(self)
+            del items[key]
+            self._reset(items)
+            return
+        self._release(self._slot_at(key))
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if (count := len(range(start, stop, step))) == 0:
+                return type(self)()
+            links = self._next if step > 0 else self._prev
+            slot, values = self._slot_at(start), []
+            for _ in range(count - 1):
+                values.append(self._values[slot])
+                for _ in range(abs(step)):
+                    slot = links[slot]
+            values.append(self._values[slot])
+            return type(self)(values)
+        return self._values[self._slot_at(key)]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Iterable):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __iadd__(self, other: Iterable) -> Self:
+        self.extend(other)
+        return self
+
+    def __imul__(self, nbr: int) -> Self:
+        self._reset(list(self) * nbr)
+        return self
+
+    def _yield_slots(self, *, reverse: bool = False) -> Iterator[int]:
+        slot = self._tail if reverse else self._head
+        links = self._prev if reverse else self._next
+        while slot != NIL:
+            yield slot
+            slot = links[slot]
+
+    def __iter__(self) -> Iterator:
+        values = self._values
+        for slot in self._yield_slots():
+            yield values[slot]
+
+    def __len__(self) -> int:
+        return len(self._values) - len(self._free)
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, Iterable):
+            return tuple(self) < tuple(other)
+        return NotImplemented
+
+    def __mul__(self, nbr: int) -> Self:
+        clist = self.copy()
+        clist *= nbr
+        return clist
+
+    def __repr__(self) -> str:
+        cls_name = type(self).__name__
+        it = tuple(self)
+        return f"{cls_name}({it})"
+
+    def __reversed__(self) -> Iterator:
+        values = self._values
+        for slot in self._yield_slots(reverse=True):
+            yield values[slot]
+
+    def __setitem__(self, key: int | slice, value: Any) -> None:
+        if isinstance(key, slice):
+            items = list(self)
+            items[key] = value
+            self._reset(items)
+            return
+        self._values[self._slot_at(key)] = value
+
+    def _reset(self, items: list) -> None:
+        """Replace the items with the list ones stored in the slot order."""
+        size = len(items)
+        self._values = items
+        self._prev = _links(NIL, size - 1)
+        self._next = _links(1, size + 1)
+        if size:
+            self._next[-1] = NIL
+        # the slots of the removed items
+        self._free: list[int] = []
+        self._head = 0 if size else NIL
+        self._tail = size - 1
+
+    def _link(self, value: Any, ante: int, post: int) -> int:
+        """Store the value in a free slot between the `ante` and `post` ones.
+
+        `NIL` for the `ante` (`post`) means the head (tail) of the list.
+        """
+        if self._free:
+            slot = self._free.pop()
+            self._values[slot] = value
+            self._prev[slot], self._next[slot] = ante, post
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+            self._prev.append(ante)
+            self._next.append(post)
+        if ante == NIL:
+            self._head = slot
+        else:
+            self._next[ante] = slot
+        if post == NIL:
+            self._tail = slot
+        else:
+            self._prev[post] = slot
+        return slot
+
+    def _release(self, slot: int) -> Any:
+        """Unlink the slot, put it into the free list and return its value.
+
+        The storage is compacted when more than half of the slots are free.
+        """
+        ante, post = self._prev[slot], self._next[slot]
+        if ante == NIL:
+            self._head = post
+        else:
+            self._next[ante] = post
+        if post == NIL:
+            self._tail = ante
+        else:
+            self._prev[post] = ante
+        value, self._values[slot] = self._values[slot], None
+        self._free.append(slot)
+        if len(self._free) > len(self._values) // 2:
+            self._reset(list(self))
+        return value
+
+    def append(self, value: Any, /) -> None:
+        """Append the value."""
+        self._link(value, self._tail, NIL)
+
+    def clear(self) -> None:
+        """Remove all elements in O(1)."""
+        self._reset([])
+
+    def copy(self) -> Self:
+        """Return the copy of the list, the slots are compacted."""
+        return type(self)(self)
+
+    def count(self, value: Any, /) -> int:
+        """Return the number of occurrences of the value."""
+        return sum(1 for item in self if item is value or item == value)
+
+    def extend(self, it: Iterable, /) -> None:
+        """Append the items from the `it`erable.
+
+        Without the free slots the items take the consecutive slots,
+        which are linked by the bulk extension of the arrays.
+        """
+        items = list(it)
+        if self._free:
+            for item in items:
+                self.append(item)
+            return
+        if not items:
+            return
+        base, size = len(self._values), len(items)
+        self._values += items
+        self._prev += _links(base - 1, base + size - 1)
+        self._next += _links(base + 1, base + size + 1)
+        self._next[-1] = NIL
+        self._prev[base] = self._tail
+        if self._tail == NIL:
+            self._head = base
+        else:
+            self._next[self._tail] = base
+        self._tail = base + size - 1
+
+    def extendleft(self, it: Iterable, /) -> None:
+        """Prepend the items from the `it`erable keeping their order."""
+        for item in reversed(list(it)):
+            self.prepend(item)
+
+    def index(self, value: Any, start: int = 0, stop: int = MAX_INT) -> int:
+        """Return the index of the first occurrence of the value.
+
+        The start parametre (default 0) marks the start index.
+
+        Raises
+        ------
+        ValueError
+            if the value is not present
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        for idx, item in enumerate(self):
+            if idx >= stop:
+                break
+            if idx >= start and (item is value or item == value):
+                return idx
+        raise ValueError from None
+
+    def insert(self, index: int, value: Any, /) -> None:
+        """Insert a value in the list at the given index.
+
+        Parameters
+        ----------
+        index : int
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        length = len(self)
+        idx = min(max(index + length if index < 0 else index, 0), length)
+        if idx == length:
+            self.append(value)
+            return
+        post = self._slot_at(idx)
+        self._link(value, self._prev[post], post)
+
+    def pop(self, index: int = -1, /) -> Any:
+        """Return with removal the value at the index.
+
+        Raises
+        ------
+        IndexError
+            if the list is empty or the index is out of range
+        """
+        return self._release(self._slot_at(index))
+
+    def popleft(self) -> Any:
+        """Return with removal the leftmost item.
+
+        Raises
+        ------
+        IndexError
+            when popping from an empty list.
+        """
+        if self._head == NIL:
+            msg = "cannot pop from an empty list"
+            raise IndexError(msg)
+        return self._release(self._head)
+
+    def popright(self) -> Any:
+        """Return with removal the rightmost item.
+
+        Raises
+        ------
+        IndexError
+            when popping from an empty list.
+        """
+        if self._tail == NIL:
+            msg = "cannot pop from an empty list"
+            raise IndexError(msg)
+        return self._release(self._tail)
+
+    def prepend(self, value: Any, /) -> None:
+        """Prepend the value."""
+        self._link(value, NIL, self._head)
+
+    def remove(self, value: Any, /) -> None:
+        """Remove the first occurence of the value.
+
+        Raises
+        ------
+        ValueError
+            if the value is not present
+        """
+        values = self._values
+        for slot in self._yield_slots():
+            item = values[slot]
+            if item is value or item == value:
+                self._release(slot)
+                return
+        raise ValueError from None
+
+    def reverse(self) -> None:
+        """Reverse in place in O(1) by swapping the links."""
+        self._prev, self._next = self._next, self._prev
+        self._head, self._tail = self._tail, self._head
+
+    def rotate(self, n: int = 1, /) -> None:
+        """Rotate `n` steps.
+
+        If n is positive, rotate to the right.
+        Otherwise, to the left.
+        The list is closed into a ring and cut before the new head,
+        which is reached from the nearer end, so the rotation by `k`
+        walks O(min(k, n - k)) slots.
+
+        Parameters
+        ----------
+        n : int
+            the number of steps for rotation.
+
+        Returns
+        -------
+        None
+        """
+        length = len(self)
+        if length < 2 or not (steps := n % length):
+            return
+        new_head = self._slot_at(length - steps)
+        new_tail = self._prev[new_head]
+        self._next[self._tail], self._prev[self._head] = self._head, self._tail
+        self._next[new_tail] = self._prev[new_head] = NIL
+        self._head, self._tail = new_head, new_tail
+
+    def sort(
+        self, key: None | Callable = None, *, reverse: bool = False
+    ) -> None:
+        """Sort in place, stable.
+
+        The sorted values are stored in the consecutive slots.
+
+        Parameters
+        ----------
+        key : None | Callable, default None
+        reverse : bool, default False
+
+        Returns
+        -------
+        None
+        """
+        self._reset(sorted(self, key=key, reverse=reverse))
@@ -1,25 +1,38 @@
 """Linked list data structures."""
 
-from collections.abc import Iterable, Iterator, MutableSequence
-from functools import total_ordering
-from operator import attrgetter
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from functools import partial, total_ordering
+from itertools import chain, islice
+from operator import attrgetter, gt, lt
 from sys import maxsize as MAX_INT
-from typing import Any
+from typing import Any, cast
 
 from typing_extensions import Self
 
-from adspy.algorithms.sorting import merge_sort
+from adspy.algorithms.sorting.common import validate_key_arg
 
 
-class _DoublyLinkedNode:
-    """Doubly linked node."""
+class DoublyLinkedNode:
+    """Doubly linked node.
 
-    __slots__ = ("value", "_prev", "_next")
+    The nodes returned by the `DoublyLinkedList` methods are the handles
+    of its items: they stay valid while the items are in the list
+    and give O(1) access for `move_to_front`, `move_to_end`,
+    `remove_node`, `insert_after` and `set_value`.
+    The `value` of a node is read-only, it is replaced
+    by the `DoublyLinkedList.set_value` of its list.
+    The nodes compare equal to their values, so they are unhashable.
+    The `prev` and `next` links are maintained by the list.
+    """
+
+    __slots__ = ("_value", "prev", "next", "_owner")
 
     def __init__(self, value: Any = None, /) -> None:
-        self.value = value
-        self._prev: _DoublyLinkedNode | None = None
-        self._next: _DoublyLinkedNode | None = None
+        self._value = value
+        self.prev: DoublyLinkedNode | None = None
+        self.next: DoublyLinkedNode | None = None
+        # the token of the list the node is linked into
+        self._owner: None | object = None
 
     def __eq__(self, value: object) -> bool:
         return bool(self.value == value)
@@ -29,20 +42,24 @@ class _DoublyLinkedNode:
         return f"{cls_name}({self.value!r})"
 
     @property
-    def prev(self) -> "_DoublyLinkedNode | None":
-        return self._prev
+    def value(self) -> Any:
+        return self._value
 
-    @prev.setter
-    def prev(self, node: "_DoublyLinkedNode | None", /) -> None:
-        self._prev = node if isinstance(node, _DoublyLinkedNode) else None
 
-    @property
-    def next(self) -> "_DoublyLinkedNode | None":
-        return self._next
+def _bind(node: DoublyLinkedNode, token: None | object) -> DoublyLinkedNode:
+    """Mark the `node` linked into the list of the `token` (None if none)."""
+    node._owner = token  # noqa: SLF001
+    return node
+
 
-    @next.setter
-    def next(self, node: "_DoublyLinkedNode | None", /) -> None:
-        self._next = node if isinstance(node, _DoublyLinkedNode) else None
+def _is_bound(node: DoublyLinkedNode, token: object) -> bool:
+    """Return True if the `node` is linked into the list of the `token`."""
+    return node._owner is token  # noqa: SLF001
+
+
+def _store(node: DoublyLinkedNode, value: Any) -> None:
+    """Replace the value of the `node` bypassing its list."""
+    node._value = value  # noqa: SLF001
 
 
 # Linked lists
@@ -52,16 +69,61 @@ class LinkedListError(Exception):
     """Generic Linked List Error."""
 
 
-@total_ordering
-class DoublyLinkedList(MutableSequence):
-    """Doubly Linked List."""
+def _precedes_by_key(op: Callable, item1: tuple, item2: tuple) -> Any:
+    """Compare the keys of the `(key, value)` pairs."""
+    return op(item1[0], item2[0])
+
+
+def _join(
+    head: None | DoublyLinkedNode,
+    tail: None | DoublyLinkedNode,
+    left: DoublyLinkedNode,
+    lsize: int,
+    right: None | DoublyLinkedNode,
+) -> DoublyLinkedNode:
+    """Return the head of the merged nodes followed by the unmerged ones.
 
-    __slots__ = ("_head", "_tail", "_length")
+    The `lsize` nodes of the left run are linked before the `right` run,
+    which leads to the rest of the list.
+    """
+    last = left
+    for _ in range(lsize - 1):
+        last = cast("DoublyLinkedNode", last.next)
+    last.next = right
+    if (head is None) or (tail is None):
+        return left
+    tail.next = left
+    return head
 
-    def __init__(self, it: None | Iterable = None, /) -> None:
-        self._head: _DoublyLinkedNode | None = None
-        self._tail: _DoublyLinkedNode | None = None
+
+@total_ordering
+class DoublyLinkedList(MutableSequence):
+    """Doubly Linked List.
+
+    In the `indexed` mode the list also maps every value
+    to its nodes keyed by their identities, so `in` and `count` are O(1),
+    the node updates (including those by the handles) stay O(1),
+    and `remove` and `index` walk no further than the first found node
+    without comparing values (`remove` of a unique value is O(1)).
+    The values must be hashable then.
+
+    The `append`, `prepend`, `insert` and `insert_after` methods
+    return the `DoublyLinkedNode` handles of the inserted items.
+    """
+
+    __slots__ = ("_head", "_tail", "_length", "_value_nodes", "_token")
+
+    def __init__(
+        self, it: None | Iterable = None, /, *, indexed: bool = False
+    ) -> None:
+        self._head: DoublyLinkedNode | None = None
+        self._tail: DoublyLinkedNode | None = None
         self._length: int = 0
+        self._value_nodes: None | dict[Any, dict[int, DoublyLinkedNode]] = (
+            {} if indexed else None
+        )
+        # the nodes linked into this list refer to the token
+        self._token = object()
 
         # Well, it's kinda unfair to use Python lists here :)
         self.extend(it or ())
@@ -75,7 +137,12 @@ class DoublyLinkedList(MutableSequence):
         return bool(len(self))
 
     def __contains__(self, value: Any) -> bool:
-        return value in tuple(self)
+        if self._value_nodes is not None:
+            try:
+                return value in self._value_nodes
+            except TypeError:  # unhashable values are not in the list
+                return False
+        return any(item is value or item == value for item in self)
 
     def __copy__(self) -> Self:
         return self.copy()
@@ -86,34 +153,68 @@ class DoublyLinkedList(MutableSequence):
             idx = length
         return 0 if idx < 0 else idx
 
-    def _get_indices(self, key: int | slice) -> tuple[int, ...]:
-        if isinstance(key, int):
-            key = self._get_normalised_index(key)
-            key = slice(key, key + 1, 1)
-        return tuple(range(key.start, key.stop, key.step))
-
-    def _check_indices(self, key: int | slice) -> tuple[int, ...]:
-        indices = tuple(self._get_indices(key))
-        if isinstance(key, int) and (len(indices) > len(self)):
-            msg = f"bad key {key!r}"
+    def _node_at(self, index: int, /) -> DoublyLinkedNode:
+        """Return the node at the index.
+
+        The node is reached from the nearer end of the list,
+        so at most n/2 nodes are walked.
+
+        Raises
+        ------
+        IndexError
+            if the index is out of range
+        """
+        length = self._length
+        idx = index + length if index < 0 else index
+        if not 0 <= idx < length:
+            msg = f"index={index} out of range"
             raise IndexError(msg)
-        return indices
+
+        node: Any
+        if idx < length // 2:
+            node = self._head
+            for _ in range(idx):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(length - 1 - idx):
+                node = node.prev
+        return cast("DoublyLinkedNode", node)
+
+    def _slice_nodes(self, key: slice, /) -> Iterator[DoublyLinkedNode]:
+        """Yield the nodes of the slice.
+
+        The first node is reached from the nearer end of the list
+        and the rest are visited in one walk stepping by the `step`.
+        The following node is found before yielding the current one,
+        so the yielded node can be detached.
+        """
+        start, stop, step = key.indices(self._length)
+        if not (count := len(range(start, stop, step))):
+            return
+        node: Any = self._node_at(start)
+        attr = "next" if step > 0 else "prev"
+        hops = abs(step)
+        for _ in range(count - 1):
+            following = node
+            for _ in range(hops):
+                following = getattr(following, attr)
+            yield node
+            node = following
+        yield node
 
     def __delitem__(self, key: int | slice) -> None:
-        indices = self._check_indices(key=key)
-        for idx, node in enumerate(self._yield_nodes()):
-            if idx not in indices:
-                continue
+        if isinstance(key, int):
+            self._detach(self._node_at(key))
+            return
+        for node in self._slice_nodes(key):
             self._detach(node)
 
     def __getitem__(self, key: int | slice) -> Any:
-        dlist = type(self)()
-        indices = set(self._check_indices(key=key))
-        for idx, node in enumerate(self._yield_nodes()):
-            if idx not in indices:
-                continue
-            dlist.append(node)
-        return dlist
+        if isinstance(key, int):
+            return self._node_at(key).value
+        nodes = self._slice_nodes(key)
+        return type(self)((node.value for node in nodes), indexed=self.indexed)
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Iterable):
@@ -125,15 +226,18 @@ class DoublyLinkedList(MutableSequence):
         return self
 
     def __imul__(self, nbr: int) -> Self:
-        items = tuple(self)
-        self.clear()
-        for _ in range(nbr):
-            self.extend(items)
+        if nbr < 1:
+            self.clear()
+            return self
+        # the list is intact until the chain of the copies is spliced
+        length = self._length
+        copies = (islice(self, length) for _ in range(nbr - 1))
+        self._splice(*self._chain(chain.from_iterable(copies)))
         return self
 
     def _yield_nodes(
         self, *, reverse: bool = False
-    ) -> Iterator[_DoublyLinkedNode]:
+    ) -> Iterator[DoublyLinkedNode]:
         node = self._tail if reverse else self._head
         op = attrgetter("prev" if reverse else "next")
         while node:
@@ -168,45 +272,231 @@ class DoublyLinkedList(MutableSequence):
             yield tail.value
             tail = tail.prev
 
+    def _set_value(self, node: DoublyLinkedNode, value: Any) -> None:
+        """Replace the value of the node, the value is hashable if needed."""
+        self._unindex_node(node)
+        _store(node, value)
+        self._index_node(node)
+
     def __setitem__(self, key: int | slice, value: Any) -> None:
-        indices = self._check_indices(key=key)
-
-        if isinstance(key, slice):
-            value = tuple(value)  # raises TypeError
-
-        # relies on ordered dictionaries
-        values = (value,) if isinstance(key, int) else value
-        idx_values = dict(zip(indices, values, strict=False))
-        del indices
-        del values
-
-        for idx, node in enumerate(self._yield_nodes()):
-            if idx not in idx_values:
-                continue
-            node.value = idx_values.pop(idx)
-
-        if isinstance(key, slice):
-            for idx in tuple(idx_values.keys()):
-                self.append(idx_values.pop(idx))
-
-    def append(self, value: Any, /) -> None:
-        """Append the value."""
-        node = _DoublyLinkedNode(value)
-        if self._tail is None:
-            self._tail = node
+        if isinstance(key, int):
+            node = self._node_at(key)
+            self._set_value(node, self._check_hashable(value))
+            return
+
+        values = tuple(map(self._check_hashable, value))  # raises TypeError
+        start, stop, step = key.indices(self._length)
+        if step != 1:
+            if (size := len(range(start, stop, step))) != len(values):
+                msg = (
+                    f"attempt to assign sequence of size {len(values)}"
+                    f" to extended slice of size {size}"
+                )
+                raise ValueError(msg)
+            for node, item in zip(self._slice_nodes(key), values, strict=True):
+                self._set_value(node, item)
+            return
+
+        self._replace_span(start, stop, values)
+
+    def _replace_span(self, start: int, stop: int, values: tuple) -> None:
+        """Replace the contiguous `[start:stop]` span with the values.
+
+        The nodes of the span are reused, the extra ones are detached
+        and the extra values are linked after the reused nodes.
+        """
+        span = max(stop - start, 0)
+        common = min(span, len(values))
+        nodes = self._slice_nodes(slice(start, start + span))
+        last = None
+        # the values come first for not consuming an extra node
+        for item, node in zip(values[:common], nodes, strict=False):
+            self._set_value(node, item)
+            last = node
+        for node in nodes:
+            self._detach(node)
+        if common == len(values):
+            return
+
+        ante: None | DoublyLinkedNode
+        post: None | DoublyLinkedNode
+        if last is not None:
+            ante, post = last, last.next
+        elif start < self._length:
+            post = self._node_at(start)
+            ante = post.prev
+        else:
+            ante, post = self._tail, None
+        for item in values[common:]:
+            ante = self._link(DoublyLinkedNode(item), ante, post)
+
+    @property
+    def head(self) -> None | DoublyLinkedNode:
+        """Return the handle of the first item or None if empty."""
+        return self._head
+
+    @property
+    def tail(self) -> None | DoublyLinkedNode:
+        """Return the handle of the last item or None if empty."""
+        return self._tail
+
+    @property
+    def indexed(self) -> bool:
+        """Return True if the values are mapped to their nodes."""
+        return self._value_nodes is not None
+
+    def _check_hashable(self, value: Any) -> Any:
+        """Return the value, it must be hashable if `indexed`.
+
+        Raises
+        ------
+        TypeError
+            if the value is unhashable
+        """
+        if self._value_nodes is not None:
+            hash(value)
+        return value
+
+    def _index_node(self, node: DoublyLinkedNode) -> None:
+        """Add the linked `node` to the nodes of its value."""
+        if self._value_nodes is not None:
+            self._value_nodes.setdefault(node.value, {})[id(node)] = node
+
+    def _unindex_node(self, node: DoublyLinkedNode) -> None:
+        """Discard the `node` from the nodes of its value."""
+        if self._value_nodes is None:
+            return
+        nodes = self._value_nodes[node.value]
+        del nodes[id(node)]
+        if not nodes:
+            del self._value_nodes[node.value]
+
+    def _check_node(self, node: DoublyLinkedNode) -> DoublyLinkedNode:
+        """Return the node if it is linked into the list.
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+        """
+        if not isinstance(node, DoublyLinkedNode) or not _is_bound(
+            node, self._token
+        ):
+            msg = f"{node!r} is not in the list"
+            raise LinkedListError(msg)
+        return node
+
+    def _link(
+        self,
+        node: DoublyLinkedNode,
+        ante: None | DoublyLinkedNode,
+        post: None | DoublyLinkedNode,
+    ) -> DoublyLinkedNode:
+        """Link the `node` between the adjacent `ante` and `post` nodes.
+
+        None for the `ante` (`post`) means the head (tail) of the list.
+        """
+        node.prev, node.next = ante, post
+        if ante is None:
             self._head = node
         else:
-            self._tail.next = node
-            node.prev = self._tail
+            ante.next = node
+        if post is None:
             self._tail = node
+        else:
+            post.prev = node
+        _bind(node, self._token)
         self._length += 1
+        self._index_node(node)
+        return node
+
+    def _chain(
+        self, it: Iterable, /
+    ) -> tuple[None | DoublyLinkedNode, None | DoublyLinkedNode, int]:
+        """Return the first and last new nodes of the values and their count.
+
+        The nodes are linked to each other, not to the list yet,
+        so the list is intact if the iteration (or hashing) fails.
+        """
+        indexed = self._value_nodes is not None
+        token = self._token
+        first: None | DoublyLinkedNode = None
+        last: None | DoublyLinkedNode = None
+        count = 0
+        for value in it:
+            if indexed:
+                hash(value)
+            node = _bind(DoublyLinkedNode(value), token)
+            if last is None:
+                first = node
+            else:
+                last.next, node.prev = node, last
+            last = node
+            count += 1
+        return first, last, count
+
+    def _splice(
+        self,
+        first: None | DoublyLinkedNode,
+        last: None | DoublyLinkedNode,
+        count: int,
+        /,
+        *,
+        left: bool = False,
+    ) -> None:
+        """Link the chain of the new nodes to the head if `left` else the tail.
+
+        The chain of the `count` nodes is linked with one update
+        of the head (or tail) of the list.
+        """
+        if (first is None) or (last is None):
+            return
+        if left:
+            if (post := self._head) is None:
+                self._tail = last
+            else:
+                last.next, post.prev = post, last
+            self._head = first
+        else:
+            if (ante := self._tail) is None:
+                self._head = first
+            else:
+                ante.next, first.prev = first, ante
+            self._tail = last
+        self._length += count
+        self._index_chain(first, last)
+
+    def _index_chain(
+        self, first: DoublyLinkedNode, last: DoublyLinkedNode
+    ) -> None:
+        """Add the nodes of the chain spliced to one end of the list."""
+        if (value_nodes := self._value_nodes) is None:
+            return
+        node = first
+        while node is not last:
+            value_nodes.setdefault(node.value, {})[id(node)] = node
+            node = cast("DoublyLinkedNode", node.next)
+        value_nodes.setdefault(last.value, {})[id(last)] = last
+
+    def append(  # type: ignore [override]
+        self, value: Any, /
+    ) -> DoublyLinkedNode:
+        """Append the value.
 
-    def _detach(self, node: None | _DoublyLinkedNode) -> None:
+        Returns
+        -------
+        DoublyLinkedNode
+            the handle of the appended item
+        """
+        node = DoublyLinkedNode(self._check_hashable(value))
+        return self._link(node, self._tail, None)
+
+    def _detach(self, node: None | DoublyLinkedNode) -> None:
         if node is None:
             return
 
-        ante: None | _DoublyLinkedNode = node.prev
-        post: None | _DoublyLinkedNode = node.next
+        ante: None | DoublyLinkedNode = node.prev
+        post: None | DoublyLinkedNode = node.next
 
         if ante:
             ante.next = post
@@ -219,34 +509,61 @@ class DoublyLinkedList(MutableSequence):
             self._tail = ante
 
         self._length -= 1
+        self._unindex_node(node)
+        _bind(node, None)
         del node
 
     def clear(self) -> None:
-        """Remove all elements."""
-        for node in self._yield_nodes():
-            self._detach(node)
+        """Remove all elements in O(1).
+
+        The nodes are dropped at once and the new token
+        invalidates their handles.
+        """
+        self._head = self._tail = None
+        self._length = 0
+        if self._value_nodes is not None:
+            self._value_nodes = {}
+        self._token = object()
 
     def copy(self) -> Self:
         """Return the copy of the list."""
-        return type(self)(self)
+        return type(self)(self, indexed=self.indexed)
 
     def count(self, value: Any, /) -> int:
         """Return the number of occurrences of the value."""
+        if (nodes := self._find_nodes(value)) is not None:
+            return len(nodes)
         cnt = 0
         for item in self:
             if item == value:
                 cnt += 1
         return cnt
 
+    def _find_nodes(self, value: Any) -> None | dict[int, DoublyLinkedNode]:
+        """Return the nodes of the value or None if not `indexed`.
+
+        The unhashable values have no nodes.
+        """
+        if self._value_nodes is None:
+            return None
+        try:
+            return self._value_nodes.get(value, {})
+        except TypeError:
+            return {}
+
     def extend(self, it: Iterable, /) -> None:
-        """Append the items from the `it`erable."""
-        for item in it:
-            self.append(item)
+        """Append the items from the `it`erable.
+
+        The new nodes are chained aside and linked to the tail at once.
+        """
+        self._splice(*self._chain(it))
 
     def extendleft(self, it: Iterable, /) -> None:
-        """Prepend the items from the `it`erable."""
-        for item in reversed(tuple(it)):
-            self.prepend(item)
+        """Prepend the items from the `it`erable keeping their order.
+
+        The new nodes are chained aside and linked to the head at once.
+        """
+        self._splice(*self._chain(it), left=True)
 
     def index(self, value: Any, start: int = 0, stop: int = MAX_INT) -> int:
         """Return the index of the first occurrence of the value.
@@ -263,6 +580,9 @@ class DoublyLinkedList(MutableSequence):
         if istart > istop:
             raise ValueError
 
+        if (nodes := self._find_nodes(value)) is not None:
+            return self._index_of_nodes(nodes, istart, istop)
+
         it = iter(self)
         for _ in range(istart):
             try:
@@ -277,7 +597,24 @@ class DoublyLinkedList(MutableSequence):
                 return idx
         raise ValueError from None
 
-    def insert(self, index: int, value: Any, /) -> None:
+    def _index_of_nodes(
+        self, nodes: dict[int, DoublyLinkedNode], start: int, stop: int
+    ) -> int:
+        """Return the index of the first of the `nodes` within the bounds.
+
+        The `nodes` are found by identity.
+        """
+        if nodes:
+            for idx, node in enumerate(self._yield_nodes()):
+                if idx >= stop:
+                    break
+                if (idx >= start) and (id(node) in nodes):
+                    return idx
+        raise ValueError from None
+
+    def insert(  # type: ignore [override]
+        self, index: int, value: Any, /
+    ) -> DoublyLinkedNode:
         """Insert a value in the list at the given index.
 
         Parameters
@@ -287,43 +624,83 @@ class DoublyLinkedList(MutableSequence):
 
         Returns
         -------
-        None
+        DoublyLinkedNode
+            the handle of the inserted item
         """
         pidx = self._get_normalised_index(index)
         if not pidx:
-            self.prepend(value)
-            return
+            return self.prepend(value)
         if pidx < 0 or pidx >= len(self):
-            self.append(value)
-            return
-        new_node = _DoublyLinkedNode(value)
-        for idx, node in enumerate(self._yield_nodes()):
-            if idx == pidx:
-                # mypy treats the `prev_node` value of type None | Node
-                if prev_node := node.prev:
-                    prev_node.next = new_node
-                new_node.prev = prev_node
-
-                new_node.next = node
-                node.prev = new_node
-
-                self._length += 1
-                break
+            return self.append(value)
+        new_node = DoublyLinkedNode(self._check_hashable(value))
+        node = self._node_at(pidx)
+        return self._link(new_node, node.prev, node)
+
+    def insert_after(
+        self, node: DoublyLinkedNode, value: Any, /
+    ) -> DoublyLinkedNode:
+        """Insert a value right after the node in O(1).
+
+        Parameters
+        ----------
+        node : DoublyLinkedNode
+        value : Any
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+
+        Returns
+        -------
+        DoublyLinkedNode
+            the handle of the inserted item
+        """
+        node = self._check_node(node)
+        new_node = DoublyLinkedNode(self._check_hashable(value))
+        return self._link(new_node, node, node.next)
+
+    def move_to_end(self, node: DoublyLinkedNode, /) -> None:
+        """Move the node to the end (tail) of the list in O(1).
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+        """
+        node = self._check_node(node)
+        if node is not self._tail:
+            self._detach(node)
+            self._link(node, self._tail, None)
+
+    def move_to_front(self, node: DoublyLinkedNode, /) -> None:
+        """Move the node to the front (head) of the list in O(1).
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+        """
+        node = self._check_node(node)
+        if node is not self._head:
+            self._detach(node)
+            self._link(node, None, self._head)
 
     def pop(self, index: int = -1, /) -> Any:
-        """Return with removal the value at the index."""
+        """Return with removal the value at the index.
+
+        Raises
+        ------
+        IndexError
+            if the list is empty or the index is out of range
+        """
         if index == -1:
             return self.popright()
         if not index:
             return self.popleft()
-        pidx = self._get_normalised_index(index)
-        for idx, node in enumerate(self._yield_nodes()):
-            if idx == pidx:
-                value = node.value
-                self._detach(node)
-                return value
-        msg = f"bad index={index}"
-        raise IndexError(msg)
+        node = self._node_at(index)
+        self._detach(node)
+        return node.value
 
     def popleft(self) -> Any:
         """Return with removal the leftmost item.
@@ -366,34 +743,221 @@ class DoublyLinkedList(MutableSequence):
         msg = "cannot pop from an empty list"
         raise IndexError(msg)
 
-    def prepend(self, value: Any, /) -> None:
-        """Prepend the value."""
-        node = _DoublyLinkedNode(value)
-        if self._head is None:
-            self._tail = node
-            self._head = node
-        else:
-            self._head.prev = node
-            node.next = self._head
-            self._head = node
-        self._length += 1
+    def prepend(self, value: Any, /) -> DoublyLinkedNode:
+        """Prepend the value.
+
+        Returns
+        -------
+        DoublyLinkedNode
+            the handle of the prepended item
+        """
+        node = DoublyLinkedNode(self._check_hashable(value))
+        return self._link(node, None, self._head)
 
     def remove(self, value: Any, /) -> None:
-        """Remove the first occurence of the value."""
+        """Remove the first occurence of the value.
+
+        Raises
+        ------
+        ValueError
+            if the value is not present
+        """
+        if (nodes := self._find_nodes(value)) is not None:
+            if not nodes:
+                raise ValueError from None
+            if len(nodes) == 1:
+                self._detach(next(iter(nodes.values())))
+                return
+            for node in self._yield_nodes():
+                if id(node) in nodes:
+                    self._detach(node)
+                    return
         for node in self._yield_nodes():
             if node.value == value:
                 self._detach(node)
-                break
+                return
+        raise ValueError from None
+
+    def remove_node(self, node: DoublyLinkedNode, /) -> Any:
+        """Return with removal the value of the node in O(1).
+
+        The node handle is no longer valid afterwards.
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+        """
+        node = self._check_node(node)
+        self._detach(node)
+        return node.value
 
     def reverse(self) -> None:
-        """Reverse in place."""
-        dlist = type(self)()
-        while self:
-            dlist.append(self.pop())
-        self.extend(dlist)
-
-    def sort(self) -> None:
-        """Sort in place."""
-        items = merge_sort(tuple(self))
-        self.clear()
-        self.extend(items)
+        """Reverse in place.
+
+        The links of every node are swapped, no nodes are allocated
+        and the handles stay valid.
+        """
+        node = self._head
+        while node is not None:
+            post = node.next
+            node.prev, node.next = post, node.prev
+            node = post
+        self._head, self._tail = self._tail, self._head
+
+    def rotate(self, n: int = 1, /) -> None:
+        """Rotate `n` steps.
+
+        If n is positive, rotate to the right.
+        Otherwise, to the left.
+        The list is closed into a ring and cut before the new head,
+        which is reached from the nearer end, so the rotation by `k`
+        walks O(min(k, n - k)) nodes.
+
+        Parameters
+        ----------
+        n : int
+            the number of steps for rotation.
+
+        Returns
+        -------
+        None
+        """
+        length = self._length
+        if length < 2 or not (steps := n % length):
+            return
+        head = cast("DoublyLinkedNode", self._head)
+        tail = cast("DoublyLinkedNode", self._tail)
+        new_head = self._node_at(length - steps)
+        new_tail = cast("DoublyLinkedNode", new_head.prev)
+        tail.next, head.prev = head, tail
+        new_tail.next = new_head.prev = None
+        self._head, self._tail = new_head, new_tail
+
+    def set_value(self, node: DoublyLinkedNode, value: Any, /) -> None:
+        """Replace the value of the node in O(1).
+
+        The node handle stays valid.
+
+        Raises
+        ------
+        LinkedListError
+            if the node does not belong to the list
+        TypeError
+            if the list is `indexed` and the value is unhashable
+        """
+        node = self._check_node(node)
+        self._set_value(node, self._check_hashable(value))
+
+    def _decorate(self, key: Callable) -> None:
+        """Pair the value of every node with its key, `(key, value)`."""
+        node = self._head
+        try:
+            while node is not None:
+                _store(node, (key(node.value), node.value))
+                node = node.next
+        except BaseException:
+            self._undecorate(stop=node)
+            raise
+
+    def _undecorate(self, *, stop: None | DoublyLinkedNode = None) -> None:
+        """Restore the values of the nodes paired with their keys."""
+        node = self._head
+        while node is not stop:
+            node = cast("DoublyLinkedNode", node)
+            _store(node, node.value[1])
+            node = node.next
+
+    def _relink(self) -> None:
+        """Restore the `prev` links and the tail from the `next` links."""
+        ante: None | DoublyLinkedNode = None
+        node = self._head
+        while node is not None:
+            node.prev = ante
+            ante, node = node, node.next
+        self._tail = ante
+
+    def _merge_pass(self, width: int, precedes: Callable) -> int:
+        """Merge every two adjacent runs of the `width` nodes.
+
+        Only the `next` links are updated.
+        If a comparison fails, then the nodes left unmerged
+        are linked after the merged ones before the error is raised.
+
+        Returns
+        -------
+        int
+            the number of the merged pairs of the runs
+        """
+        merges = 0
+        head: Any = None
+        tail: Any = None
+        left: Any = self._head
+        while left is not None:
+            merges += 1
+            right, lsize = left, 0
+            while (lsize < width) and (right is not None):
+                right, lsize = right.next, lsize + 1
+            rsize = width
+            while lsize or (rsize and (right is not None)):
+                take_left = not rsize or (right is None)
+                if lsize and not take_left:
+                    try:
+                        take_left = not precedes(right.value, left.value)
+                    except BaseException:
+                        self._head = _join(head, tail, left, lsize, right)
+                        raise
+                if lsize and take_left:
+                    node, left, lsize = left, left.next, lsize - 1
+                else:
+                    node, right, rsize = right, right.next, rsize - 1
+                if tail is None:
+                    head = node
+                else:
+                    tail.next = node
+                tail = node
+            left = right
+        tail.next = None
+        self._head = head
+        return merges
+
+    def sort(
+        self, key: None | Callable = None, *, reverse: bool = False
+    ) -> None:
+        """Sort in place.
+
+        The nodes are relinked by the bottom-up merge sort:
+        no nodes are allocated and their handles stay valid.
+        The sort is stable, the equal items keep their order
+        in the `reverse` order too.
+        The `key` is called once per item, the keys are paired
+        with the values of the nodes for the time of the sort.
+        If a comparison fails, then the list keeps all of its items
+        in some order.
+
+        Parameters
+        ----------
+        key : None | Callable, default None
+        reverse : bool, default False
+
+        Returns
+        -------
+        None
+        """
+        if key is not None:
+            validate_key_arg(key)
+        if self._length < 2:
+            return
+        op = gt if reverse else lt
+        precedes = op
+        if key is not None:
+            self._decorate(key)
+            precedes = partial(_precedes_by_key, op)
+        try:
+            width = 1
+            while self._merge_pass(width, precedes) > 1:
+                width *= 2
+        finally:
+            self._relink()
+            if key is not None:
+                self._undecorate()
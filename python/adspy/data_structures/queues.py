@@ -1,6 +1,6 @@
 """Queue data structures."""
 
-from collections.abc import Iterable, Iterator, MutableSequence
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
 from functools import total_ordering
 from sys import maxsize as MAX_INT
 from typing import Any
@@ -8,6 +8,36 @@ from typing import Any
 from typing_extensions import Self
 
 from adspy.data_structures.linked_lists import DoublyLinkedList
+from adspy.data_structures.ring_buffers import RingBuffer
+
+# the storages of the deque items
+BACKENDS: dict[str, type[DoublyLinkedList] | type[RingBuffer]] = {
+    "linked": DoublyLinkedList,
+    "ring": RingBuffer,
+}
+
+
+def _last_items(it: Iterable, count: int) -> list:
+    """Return the last `count` items of the `it`erable (all if fewer).
+
+    The sequences are sliced, the other iterables are consumed
+    keeping the last `count` items in a circular window.
+    """
+    if not count:
+        for _ in it:
+            pass
+        return []
+    if isinstance(it, Sequence):
+        return list(it[-count:])
+    window: list = []
+    pos = 0
+    for item in it:
+        if len(window) < count:
+            window.append(item)
+        else:
+            window[pos] = item
+            pos = (pos + 1) % count
+    return window[pos:] + window[:pos]
 
 
 # Python `deque` does not inherit from MutableSequence
@@ -16,19 +46,35 @@ class Deque:
     """Double-Ended Queue.
 
     Pronounced as "deck".
+
+    The items are stored by the `backend`:
+
+    - "linked" -- the `DoublyLinkedList`, the indexing is O(n);
+    - "ring" -- the `RingBuffer`, the indexing is O(1).
+
+    The appends and pops at both ends are O(1) (amortised for the ring),
+    the rotation by `k` steps is O(min(k, n - k)) for both.
     """
 
-    __slots__ = ("_lst", "_maxlen")
+    __slots__ = ("_lst", "_maxlen", "_backend")
 
     def __init__(
-        self, it: None | Iterable = None, maxlen: None | int = None
+        self,
+        it: None | Iterable = None,
+        maxlen: None | int = None,
+        *,
+        backend: str = "linked",
     ) -> None:
         if maxlen and maxlen < 0:
             msg = f"maxen={maxlen} nust be non-negative"
             raise ValueError(msg)
         self._maxlen = -1 if maxlen is None else maxlen
 
-        self._lst = DoublyLinkedList()
+        if backend not in BACKENDS:
+            msg = f"backend={backend!r} must be one of {tuple(BACKENDS)}"
+            raise ValueError(msg)
+        self._backend = backend
+        self._lst = BACKENDS[backend]()
         if it:
             self.extend(it)
 
@@ -37,8 +83,13 @@ class Deque:
         """Return the maxlen attribute value."""
         return self._maxlen
 
+    @property
+    def backend(self) -> str:
+        """Return the name of the items storage."""
+        return self._backend
+
     def __add__(self, other: Iterable) -> Self:
-        return type(self)(self._lst + other)
+        return type(self)(self._lst + other, backend=self._backend)
 
     def __bool__(self) -> bool:
         return bool(self._lst)
@@ -53,7 +104,9 @@ class Deque:
         del self._lst[key]
 
     def __getitem__(self, key: int | slice) -> Any:
-        return type(self)(self._lst[key])
+        if isinstance(key, int):
+            return self._lst[key]
+        return type(self)(self._lst[key], backend=self._backend)
 
     def __eq__(self, other: object) -> bool:
         return self._lst == other
@@ -79,7 +132,7 @@ class Deque:
         return self._lst < other
 
     def __mul__(self, nbr: int) -> Self:
-        return type(self)(self._lst * nbr)
+        return type(self)(self._lst * nbr, backend=self._backend)
 
     def __repr__(self) -> str:
         cls_name = type(self).__name__
@@ -114,23 +167,41 @@ class Deque:
 
     def copy(self) -> Self:
         """Return the copy of the deque."""
-        return type(self)(self)
+        return type(self)(self, backend=self._backend)
 
     def count(self, value: Any, /) -> int:
         """Return the number of occurrences of the value."""
         return self._lst.count(value)
 
     def extend(self, it: Iterable, /) -> None:
-        """Append the items from the `it`erable."""
-        # not optimal, but efficient
-        for item in it:
-            self.append(item)
+        """Append the items from the `it`erable.
+
+        The items are stored at once. The bounded deque
+        keeps only the last `maxlen` items of the `it`erable
+        and evicts the leftmost ones to make room for them.
+        """
+        if self._maxlen < 0:
+            self._lst.extend(it)
+            return
+        items = _last_items(it, self._maxlen)
+        if (overflow := len(self) + len(items) - self._maxlen) > 0:
+            del self._lst[:overflow]
+        self._lst.extend(items)
 
     def extendleft(self, it: Iterable, /) -> None:
-        """Prepend the items from the `it`erable."""
-        # not optimal, but efficient
-        for item in it:
-            self.appendleft(item)
+        """Prepend the items from the `it`erable one by one.
+
+        So the items come in the reversed order. They are stored at once.
+        The bounded deque keeps only the last `maxlen` items
+        of the `it`erable and evicts the rightmost ones to make room.
+        """
+        if self._maxlen < 0:
+            self._lst.extendleft(reversed(list(it)))
+            return
+        items = _last_items(it, self._maxlen)
+        if (overflow := len(self) + len(items) - self._maxlen) > 0:
+            del self._lst[len(self) - overflow :]
+        self._lst.extendleft(reversed(items))
 
     def index(self, value: Any, start: int = 0, stop: int = MAX_INT) -> int:
         """Return the index of the first occurrence of the value.
@@ -170,7 +241,13 @@ class Deque:
         return self._lst.popleft()
 
     def remove(self, value: Any, /) -> None:
-        """Remove the first occurence of the value."""
+        """Remove the first occurence of the value.
+
+        Raises
+        ------
+        ValueError
+            if the value is not present
+        """
         self._lst.remove(value)
 
     def reverse(self) -> None:
@@ -192,6 +269,7 @@ class Deque:
         -------
         None
         """
+        self._lst.rotate(n)
 
 
 MutableSequence.register(Deque)
@@ -0,0 +1,411 @@
+"""The ring (circular) buffer data structure.
+
+References:
+
+- https://en.wikipedia.org/wiki/Circular_buffer
+"""
+
+from collections.abc import Iterable, Iterator, MutableSequence
+from functools import total_ordering
+from sys import maxsize as MAX_INT
+from typing import Any
+
+from typing_extensions import Self
+
+# the smallest capacity of the buffer, a power of two
+MIN_CAPACITY = 8
+
+
+@total_ordering
+class RingBuffer(MutableSequence):
+    """The growable ring buffer.
+
+    The items are stored in a list of the power-of-two capacity
+    starting at the `head` offset and wrapping around its end,
+    so the `k`-th item is at `(head + k) & (capacity - 1)`.
+    The capacity is doubled when the buffer is full
+    and halved when it is less than a quarter full.
+
+    The appends and pops at both ends are O(1) amortised,
+    the indexing is O(1), the `insert`, `del` and `rotate`
+    move the items of the shorter side only, so O(min(k, n - k)).
+    """
+
+    __slots__ = ("_items", "_head", "_length")
+
+    def __init__(self, it: None | Iterable = None, /) -> None:
+        self._items: list = [None] * MIN_CAPACITY
+        self._head = 0
+        self._length = 0
+        self.extend(it or ())
+
+    def __add__(self, other: Iterable) -> Self:
+        buffer = self.copy()
+        buffer += other
+        return buffer
+
+    def __bool__(self) -> bool:
+        return bool(self._length)
+
+    def __contains__(self, value: Any) -> bool:
+        return any(item is value or item == value for item in self)
+
+    def __copy__(self) -> Self:
+        return self.copy()
+
+    def _position(self, index: int, /) -> int:
+        """Return the buffer position of the item at the index.
+
+        Raises
+        ------
+        IndexError
+            if the index is out of range
+        """
+        length = self._length
+        idx = index + length if index < 0 else index
+        if not 0 <= idx < length:
+            msg = f"index={index} out of range"
+            raise IndexError(msg)
+        return (self._head + idx) & (len(self._items) - 1)
+
+    def __delitem__(self, key: int | slice) -> None:
+        if isinstance(key, slice):
+            items = list(self)
+            del items[key]
+            self._reset(items)
+            return
+        pos = self._position(key)
+        items, mask = self._items, len(self._items) - 1
+        idx = (pos - self._head) & mask
+        if idx < self._length // 2:
+            # shift the items before the index to the right
+            for _ in range(idx):
+                ante = (pos - 1) & mask
+                items[pos] = items[ante]
+                pos = ante
+            items[pos] = None
+            self._head = (pos + 1) & mask
+        else:
+            # shift the items after the index to the left
+            for _ in range(self._length - 1 - idx):
+                post = (pos + 1) & mask
+                items[pos] = items[post]
+                pos = post
+            items[pos] = None
+        self._length -= 1
+        self._shrink()
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            indices = range(*key.indices(self._length))
+            return type(self)(self._items[self._position(i)] for i in indices)
+        return self._items[self._position(key)]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Iterable):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __iadd__(self, other: Iterable) -> Self:
+        self.extend(other)
+        return self
+
+    def __imul__(self, nbr: int) -> Self:
+        self._reset(list(self) * nbr)
+        return self
+
+    def __iter__(self) -> Iterator:
+        items, head = self._items, self._head
+        mask = len(items) - 1
+        for idx in range(self._length):
+            yield items[(head + idx) & mask]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, Iterable):
+            return tuple(self) < tuple(other)
+        return NotImplemented
+
+    def __mul__(self, nbr: int) -> Self:
+        buffer = self.copy()
+        buffer *= nbr
+        return buffer
+
+    def __repr__(self) -> str:
+        cls_name = type(self).__name__
+        it = tuple(self)
+        return f"{cls_name}({it})"
+
+    def __reversed__(self) -> Iterator:
+        items, head = self._items, self._head
+        mask = len(items) - 1
+        for idx in range(self._length - 1, -1, -1):
+            yield items[(head + idx) & mask]
+
+    def __setitem__(self, key: int | slice, value: Any) -> None:
+        if isinstance(key, slice):
+            items = list(self)
+            items[key] = value
+            self._reset(items)
+            return
+        self._items[self._position(key)] = value
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of the items the buffer holds without growing."""
+        return len(self._items)
+
+    def _resize(self, capacity: int) -> None:
+        """Move the items to the start of the new buffer of the capacity."""
+        items = list(self)
+        self._items = items + [None] * (capacity - len(items))
+        self._head = 0
+
+    def _reset(self, items: list) -> None:
+        """Replace the items with the list ones."""
+        capacity = MIN_CAPACITY
+        while capacity < len(items):
+            capacity *= 2
+        self._items = items + [None] * (capacity - len(items))
+        self._head = 0
+        self._length = len(items)
+
+    def _read(self, start: int, count: int) -> list:
+        """Return the `count` slots from the `start` position on."""
+        items = self._items
+        start &= len(items) - 1
+        if (stop := start + count) <= len(items):
+            return items[start:stop]
+        return items[start:] + items[: stop - len(items)]
+
+    def _write(self, start: int, values: list) -> None:
+        """Fill the slots from the `start` position on with the values."""
+        items = self._items
+        start &= len(items) - 1
+        split = len(items) - start
+        items[start : start + len(values)] = values[:split]
+        if len(values) > split:
+            items[: len(values) - split] = values[split:]
+
+    def _grow(self) -> None:
+        """Double the capacity if the buffer is full."""
+        if self._length == len(self._items):
+            self._resize(2 * len(self._items))
+
+    def _shrink(self) -> None:
+        """Halve the capacity if the buffer is less than a quarter full."""
+        capacity = len(self._items)
+        if (capacity > MIN_CAPACITY) and (4 * self._length < capacity):
+            self._resize(capacity // 2)
+
+    def append(self, value: Any, /) -> None:
+        """Append the value."""
+        self._grow()
+        items = self._items
+        items[(self._head + self._length) & (len(items) - 1)] = value
+        self._length += 1
+
+    def clear(self) -> None:
+        """Remove all elements."""
+        self._items = [None] * MIN_CAPACITY
+        self._head = 0
+        self._length = 0
+
+    def copy(self) -> Self:
+        """Return the copy of the buffer."""
+        return type(self)(self)
+
+    def count(self, value: Any, /) -> int:
+        """Return the number of occurrences of the value."""
+        return sum(1 for item in self if item is value or item == value)
+
+    def _reserve(self, count: int) -> None:
+        """Grow the capacity to hold the `count` more items."""
+        capacity = len(self._items)
+        if (needed := self._length + count) > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+
+    def extend(self, it: Iterable, /) -> None:
+        """Append the items from the `it`erable.
+
+        The items are collected first and copied in by the list slices.
+        """
+        values = list(it)
+        self._reserve(len(values))
+        self._write(self._head + self._length, values)
+        self._length += len(values)
+
+    def extendleft(self, it: Iterable, /) -> None:
+        """Prepend the items from the `it`erable keeping their order.
+
+        The items are collected first and copied in by the list slices.
+        """
+        values = list(it)
+        self._reserve(len(values))
+        self._head = (self._head - len(values)) & (len(self._items) - 1)
+        self._write(self._head, values)
+        self._length += len(values)
+
+    def index(self, value: Any, start: int = 0, stop: int = MAX_INT) -> int:
+        """Return the index of the first occurrence of the value.
+
+        The start parametre (default 0) marks the start index.
+
+        Raises
+        ------
+        ValueError
+            if the value is not present
+        """
+        items, head = self._items, self._head
+        mask = len(items) - 1
+        for idx in range(*slice(start, stop).indices(self._length)):
+            item = items[(head + idx) & mask]
+            if item is value or item == value:
+                return idx
+        raise ValueError from None
+
+    def insert(self, index: int, value: Any, /) -> None:
+        """Insert a value in the buffer at the given index.
+
+        Parameters
+        ----------
+        index : int
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        length = self._length
+        idx = min(max(index + length if index < 0 else index, 0), length)
+        self._grow()
+        items, mask = self._items, len(self._items) - 1
+        if idx < length // 2:
+            # shift the items before the index to the left
+            self._head = pos = (self._head - 1) & mask
+            for _ in range(idx):
+                post = (pos + 1) & mask
+                items[pos] = items[post]
+                pos = post
+        else:
+            # shift the items from the index to the right
+            pos = (self._head + length) & mask
+            for _ in range(length - idx):
+                ante = (pos - 1) & mask
+                items[pos] = items[ante]
+                pos = ante
+        items[pos] = value
+        self._length += 1
+
+    def pop(self, index: int = -1, /) -> Any:
+        """Return with removal the value at the index.
+
+        Raises
+        ------
+        IndexError
+            if the buffer is empty or the index is out of range
+        """
+        if index == -1:
+            return self.popright()
+        if not index:
+            return self.popleft()
+        value = self[index]
+        del self[index]
+        return value
+
+    def popleft(self) -> Any:
+        """Return with removal the leftmost item.
+
+        Raises
+        ------
+        IndexError
+            when popping from an empty buffer.
+        """
+        if not self._length:
+            msg = "cannot pop from an empty buffer"
+            raise IndexError(msg)
+        items, head = self._items, self._head
+        value, items[head] = items[head], None
+        self._head = (head + 1) & (len(items) - 1)
+        self._length -= 1
+        self._shrink()
+        return value
+
+    def popright(self) -> Any:
+        """Return with removal the rightmost item.
+
+        Raises
+        ------
+        IndexError
+            when popping from an empty buffer.
+        """
+        if not self._length:
+            msg = "cannot pop from an empty buffer"
+            raise IndexError(msg)
+        items = self._items
+        pos = (self._head + self._length - 1) & (len(items) - 1)
+        value, items[pos] = items[pos], None
+        self._length -= 1
+        self._shrink()
+        return value
+
+    def prepend(self, value: Any, /) -> None:
+        """Prepend the value."""
+        self._grow()
+        items = self._items
+        self._head = (self._head - 1) & (len(items) - 1)
+        items[self._head] = value
+        self._length += 1
+
+    def reverse(self) -> None:
+        """Reverse in place."""
+        items, head = self._items, self._head
+        mask = len(items) - 1
+        lo, hi = head, head + self._length - 1
+        while lo < hi:
+            ante, post = lo & mask, hi & mask
+            items[ante], items[post] = items[post], items[ante]
+            lo += 1
+            hi -= 1
+
+    def rotate(self, n: int = 1, /) -> None:
+        """Rotate `n` steps.
+
+        If n is positive, rotate to the right.
+        Otherwise, to the left.
+        The items of the shorter side are copied across the gap
+        by the list slices, so the rotation by `k` costs O(min(k, n - k)),
+        and the full buffer only moves its head.
+
+        Parameters
+        ----------
+        n : int
+            the number of steps for rotation.
+
+        Returns
+        -------
+        None
+        """
+        length = self._length
+        if length < 2 or not (steps := n % length):
+            return
+        if length == len(self._items):
+            self._head = (self._head - steps) & (length - 1)
+            return
+        if steps <= length // 2:
+            # move the rightmost items to the front
+            span = self._read(self._head + length - steps, steps)
+            self._write(self._head + length - steps, [None] * steps)
+            self._head = (self._head - steps) & (len(self._items) - 1)
+            self._write(self._head, span)
+        else:
+            # move the leftmost items to the back
+            steps = length - steps
+            span = self._read(self._head, steps)
+            self._write(self._head, [None] * steps)
+            self._write(self._head + length, span)
+            self._head = (self._head + steps) & (len(self._items) - 1)
@@ -0,0 +1,50 @@
+"""Compare `batch_binary_search` with a loop of `binary_search` calls.
+
+Usage::
+
+    python -m benchmarks.bench_binary_search [--size SIZE] [--queries NBR]
+"""
+
+import random
+from argparse import ArgumentParser
+from array import array
+from collections.abc import Callable, Sequence
+from time import perf_counter
+
+from adspy.algorithms import vectorised
+from adspy.algorithms.searching import batch_binary_search, binary_search
+
+
+def loop(seq: Sequence, values: list) -> list:
+    return [binary_search(seq, value) for value in values]
+
+
+MODES: dict[str, Callable[[Sequence, list], list]] = {
+    "binary_search loop": loop,
+    "batch_binary_search": batch_binary_search,
+}
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    lst = list(range(0, 2 * args.size, 2))
+    values = [random.randrange(2 * args.size) for _ in range(args.queries)]
+    samples: dict[str, Sequence] = {"list": lst}
+    if vectorised.HAS_NUMPY:
+        samples["array"] = array("q", lst)
+
+    print(f"{'mode':<22}{'input':>8}{'seconds':>10}")
+    for mode, search in MODES.items():
+        for name, sample in samples.items():
+            start = perf_counter()
+            search(sample, values)
+            elapsed = perf_counter() - start
+            print(f"{mode:<22}{name:>8}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the get/put throughput of the caches with `functools.lru_cache`.
+
+The keys are drawn from the log-uniform distribution,
+so the small keys are much hotter than the large ones.
+
+Usage::
+
+    python -m benchmarks.bench_caches [--calls NBR] [--keys NBR] [--maxsize NBR]
+"""
+
+import functools
+import random
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from adspy.data_structures import LFUCache, LRUCache, lfu_cache, lru_cache
+
+
+def identity(arg: int) -> int:
+    return arg
+
+
+def get_put(cache: LFUCache | LRUCache) -> Callable[[int], Any]:
+    def call(key: int) -> Any:
+        if (value := cache.get(key)) is None:
+            value = identity(key)
+            cache.put(key, value)
+        return value
+
+    return call
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--maxsize", type=int, default=1_000)
+    args = parser.parse_args()
+
+    keys = [int(args.keys ** random.random()) for _ in range(args.calls)]
+    modes: dict[str, Callable[[int], Any]] = {
+        "functools.lru_cache": functools.lru_cache(args.maxsize)(identity),
+        "lru_cache": lru_cache(args.maxsize)(identity),
+        "lfu_cache": lfu_cache(args.maxsize)(identity),
+        "LRUCache get/put": get_put(LRUCache(args.maxsize)),
+        "LFUCache get/put": get_put(LFUCache(args.maxsize)),
+    }
+    print(f"{'cache':<22}{'calls/s':>12}{'hit ratio':>12}")
+    for mode, func in modes.items():
+        start = perf_counter()
+        for key in keys:
+            func(key)
+        elapsed = perf_counter() - start
+        info = getattr(func, "cache_info", None)
+        hits = f"{info().hits / args.calls:>12.3f}" if info else f"{'':>12}"
+        print(f"{mode:<22}{args.calls / elapsed:>12,.0f}{hits}")
+
+
+if __name__ == "__main__":
+    main()
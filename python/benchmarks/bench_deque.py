@@ -0,0 +1,76 @@
+"""Compare the `Deque` backends with `collections.deque`.
+
+The operations per second are measured for the appends and pops
+at both ends, the bulk extends, the random indexing and the rotations.
+
+Usage::
+
+    python -m benchmarks.bench_deque [--size NBR] [--ops NBR]
+"""
+
+import random
+from argparse import ArgumentParser
+from collections import deque
+from time import perf_counter
+from typing import Any
+
+from adspy.data_structures import Deque
+
+
+def queue(dq: Any, ops: int) -> None:
+    for value in range(ops):
+        dq.append(value)
+        dq.appendleft(value)
+    for _ in range(ops):
+        dq.pop()
+        dq.popleft()
+
+
+def ingest(dq: Any, ops: int) -> None:
+    dq.extend(range(ops))
+    dq.extendleft(range(ops))
+
+
+def indexing(dq: Any, ops: int) -> None:
+    size = len(dq)
+    for idx in random.choices(range(size), k=ops):
+        dq[idx]
+
+
+def rotation(dq: Any, ops: int) -> None:
+    size = len(dq)
+    for steps in random.choices(range(-size, size), k=ops):
+        dq.rotate(steps)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--ops", type=int, default=2_000)
+    args = parser.parse_args()
+
+    modes = {
+        "collections.deque": lambda: deque(range(args.size)),
+        "Deque(linked)": lambda: Deque(range(args.size), backend="linked"),
+        "Deque(ring)": lambda: Deque(range(args.size), backend="ring"),
+    }
+    benches = {
+        "append/pop": queue,
+        "extend": ingest,
+        "d[i]": indexing,
+        "rotate": rotation,
+    }
+    print(f"{'deque':<20}" + "".join(f"{name:>14}" for name in benches))
+    for mode, make in modes.items():
+        row = f"{mode:<20}"
+        for bench in benches.values():
+            dq = make()
+            start = perf_counter()
+            bench(dq, args.ops)
+            elapsed = perf_counter() - start
+            row += f"{args.ops / elapsed:>14,.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
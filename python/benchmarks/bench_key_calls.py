@@ -0,0 +1,60 @@
+"""Count the `key` calls of the sorting functions.
+
+Every item must be passed to the `key` exactly once.
+
+Usage::
+
+    python -m benchmarks.bench_key_calls
+"""
+
+import random
+from collections.abc import Callable
+from math import sqrt
+from time import perf_counter
+from typing import Any
+
+from adspy.algorithms.sorting import (
+    bubble_sort,
+    insertion_sort,
+    merge_sort,
+    quick_sort,
+    selection_sort,
+)
+
+# the quadratic algorithms are benchmarked on smaller inputs
+SIZES: dict[Callable, int] = {
+    bubble_sort: 2_000,
+    insertion_sort: 2_000,
+    selection_sort: 2_000,
+    merge_sort: 100_000,
+    quick_sort: 100_000,
+}
+
+
+class CostlyKey:
+    """The key with some (artificial) computational cost."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, arg: Any) -> Any:
+        self.calls += 1
+        return sum(sqrt(abs(arg) + idx) for idx in range(20))
+
+
+def main() -> None:
+    print(f"{'function':<16}{'size':>10}{'key calls':>12}{'seconds':>10}")
+    for sort, size in SIZES.items():
+        sample = [random.randint(-size, size) for _ in range(size)]
+        key = CostlyKey()
+
+        start = perf_counter()
+        sort(sample, key)
+        elapsed = perf_counter() - start
+
+        assert key.calls == size, (sort.__name__, key.calls)
+        print(f"{sort.__name__:<16}{size:>10}{key.calls:>12}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
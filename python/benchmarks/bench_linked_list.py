@@ -0,0 +1,68 @@
+"""Time the whole-list operations of `DoublyLinkedList` and `list`.
+
+Every operation is run on a fresh list of the `--size` shuffled items,
+the best of the `--repeat` runs is printed in milliseconds.
+
+Usage::
+
+    python -m benchmarks.bench_linked_list [--size NBR] [--repeat NBR]
+"""
+
+import random
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from adspy.data_structures import DoublyLinkedList
+
+
+def imul(lst: Any) -> None:
+    lst *= 3
+
+
+OPERATIONS: dict[str, Callable[[Any], Any]] = {
+    "clear": lambda lst: lst.clear(),
+    "reverse": lambda lst: lst.reverse(),
+    "*= 3": imul,
+    "copy": lambda lst: lst.copy(),
+    "extend": lambda lst: lst.extend(range(len(lst))),
+    "sort": lambda lst: lst.sort(),
+}
+
+
+def best_time(
+    make: Callable[[], Any], operation: Callable[[Any], Any], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        lst = make()
+        start = perf_counter()
+        operation(lst)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    items = random.sample(range(args.size), args.size)
+    modes: dict[str, Callable[[], Any]] = {
+        "list": lambda: list(items),
+        "DoublyLinkedList": lambda: DoublyLinkedList(items),
+        "indexed": lambda: DoublyLinkedList(items, indexed=True),
+    }
+    print(f"{'list':<18}" + "".join(f"{name:>10}" for name in OPERATIONS))
+    for mode, make in modes.items():
+        row = f"{mode:<18}"
+        for operation in OPERATIONS.values():
+            elapsed = best_time(make, operation, args.repeat)
+            row += f"{1_000 * elapsed:>10.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
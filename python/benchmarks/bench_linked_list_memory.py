@@ -0,0 +1,57 @@
+"""Compare the memory of the `DoublyLinkedList` storage modes.
+
+The node-object `DoublyLinkedList` and the array-backed
+`CompactLinkedList` (and the builtin `list` as the baseline)
+are built from the same items, the memory allocated by the structure
+is traced by `tracemalloc`, the items themselves are not counted.
+
+Usage::
+
+    python -m benchmarks.bench_linked_list_memory [--size NBR]
+"""
+
+import gc
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from adspy.data_structures import CompactLinkedList, DoublyLinkedList
+
+
+def traced(make: Callable[[], Any]) -> tuple[Any, int, float]:
+    """Return the built structure, its traced size and the build time."""
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+    structure = make()
+    elapsed = perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return structure, size, elapsed
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    items = list(range(args.size))
+    modes: dict[str, Callable[[], Any]] = {
+        "list": lambda: list(items),
+        "DoublyLinkedList": lambda: DoublyLinkedList(items),
+        "CompactLinkedList": lambda: CompactLinkedList(items),
+    }
+    print(f"{'list':<20}{'MiB':>10}{'bytes/item':>12}{'build, s':>10}")
+    for mode, make in modes.items():
+        structure, size, elapsed = traced(make)
+        per_item = size / args.size
+        print(
+            f"{mode:<20}{size / 2**20:>10.1f}{per_item:>12.1f}{elapsed:>10.2f}"
+        )
+        del structure
+
+
+if __name__ == "__main__":
+    main()
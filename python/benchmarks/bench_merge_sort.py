@@ -0,0 +1,59 @@
+"""Measure the time and the peak memory of `merge_sort`.
+
+Usage::
+
+    python -m benchmarks.bench_merge_sort [--size SIZE]
+"""
+
+import random
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+
+from adspy.algorithms.sorting import merge_sort
+
+SORTS: dict[str, Callable[[list], list]] = {
+    "merge_sort": merge_sort,
+    "merge_sort(adaptive)": partial(merge_sort, adaptive=True),
+}
+
+
+def nearly_sorted(size: int, late: int) -> list:
+    """Returns the sorted list with a few late arrivals inserted."""
+    lst = sorted(random.random() for _ in range(size - late))
+    for _ in range(late):
+        lst.insert(random.randrange(len(lst)), random.random())
+    return lst
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    samples: dict[str, list] = {
+        "random": [random.random() for _ in range(args.size)],
+        "nearly sorted": nearly_sorted(args.size, args.size // 1_000),
+    }
+    print(f"{'function':<24}{'input':>16}{'seconds':>10}{'peak MiB':>10}")
+    for name, sort in SORTS.items():
+        for input_name, sample in samples.items():
+            start = perf_counter()
+            sort(sample)
+            elapsed = perf_counter() - start
+
+            tracemalloc.start()
+            sort(sample)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"{name:<24}{input_name:>16}{elapsed:>10.3f}"
+                f"{peak / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
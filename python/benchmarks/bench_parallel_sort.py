@@ -0,0 +1,38 @@
+"""Measure the `parallel_merge_sort` speedup for 1..N workers.
+
+Usage::
+
+    python -m benchmarks.bench_parallel_sort [--size SIZE] [--workers N]
+"""
+
+import os
+import random
+from argparse import ArgumentParser
+from time import perf_counter
+
+from adspy.algorithms.sorting import parallel_merge_sort
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    sample = [random.randrange(args.size) for _ in range(args.size)]
+    nbrs = sorted(
+        {1 << power for power in range(args.workers.bit_length())}
+        | {args.workers}
+    )
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}")
+    baseline = 0.0
+    for workers in nbrs:
+        start = perf_counter()
+        parallel_merge_sort(sample, workers=workers)
+        elapsed = perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>10.3f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
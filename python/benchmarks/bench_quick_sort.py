@@ -0,0 +1,46 @@
+"""Compare the `quick_sort` modes on random and duplicate-heavy keys.
+
+Usage::
+
+    python -m benchmarks.bench_quick_sort [--size SIZE] [--distinct NBR]
+"""
+
+import random
+from argparse import ArgumentParser
+from collections.abc import Callable
+from functools import partial
+from time import perf_counter
+
+from adspy.algorithms.sorting import quick_sort
+
+MODES: dict[str, Callable[[list], list]] = {
+    "classic": quick_sort,
+    "introsort": partial(quick_sort, introsort=True),
+    "three-way": partial(quick_sort, three_way=True),
+    "introsort+three-way": partial(quick_sort, introsort=True, three_way=True),
+}
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=20)
+    args = parser.parse_args()
+
+    samples: dict[str, list] = {
+        "random": [random.random() for _ in range(args.size)],
+        f"{args.distinct} keys": [
+            random.randrange(args.distinct) for _ in range(args.size)
+        ],
+    }
+    print(f"{'mode':<22}{'input':>12}{'seconds':>10}")
+    for mode, sort in MODES.items():
+        for name, sample in samples.items():
+            start = perf_counter()
+            sort(sample)
+            elapsed = perf_counter() - start
+            print(f"{mode:<22}{name:>12}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare `EytzingerIndex` queries with `binary_search` and `bisect_left`.
+
+Usage::
+
+    python -m benchmarks.bench_search_index [--size SIZE] [--queries NBR]
+"""
+
+import random
+from argparse import ArgumentParser
+from functools import partial
+from time import perf_counter
+from typing import Any
+
+from adspy.algorithms.searching import (
+    EytzingerIndex,
+    binary_search,
+    bisect_left,
+)
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=200_000)
+    args = parser.parse_args()
+
+    samples: dict[str, list] = {
+        "int": list(range(0, 2 * args.size, 2)),
+        "str": sorted(f"{nbr:016x}" for nbr in range(0, 2 * args.size, 2)),
+    }
+    print(f"{'query':<22}{'input':>8}{'seconds':>10}")
+    for name, sample in samples.items():
+        index = EytzingerIndex(sample)
+        values = random.choices(sample, k=args.queries)
+        queries: dict[str, Any] = {
+            "binary_search": partial(binary_search, sample),
+            "bisect_left": partial(bisect_left, sample),
+            "EytzingerIndex.find": index.find,
+            "EytzingerIndex.rank": index.rank,
+        }
+        for query, func in queries.items():
+            start = perf_counter()
+            for value in values:
+                func(value)
+            elapsed = perf_counter() - start
+            print(f"{query:<22}{name:>8}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,36 @@
-from collections.abc import Iterable
+import bisect
+import random
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
 
 import pytest
 
-from adspy.algorithms.searching.binary_search import binary_search
+from adspy.algorithms.searching.binary_search import (
+    batch_binary_search,
+    binary_search,
+    bisect_left,
+    bisect_right,
+)
+
+
+class NoCopySequence(Sequence):
+    def __init__(self, items: Iterable) -> None:
+        self._items = list(items)
+        self.reads = 0
+
+    def __getitem__(self, idx: Any) -> Any:
+        if isinstance(idx, slice):
+            msg = "the sequence must not be sliced"
+            raise AssertionError(msg)
+        self.reads += 1
+        return self._items[idx]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Any:
+        msg = "the sequence must not be iterated"
+        raise AssertionError(msg)
 
 
 @pytest.mark.parametrize(
@@ -12,13 +40,21 @@ from adspy.algorithms.searching.binary_search import binary_search
         ([1, 2], 42, None),
         ((1, 2), 1, 0),
         ((1, 2), 2, 1),
-        ((2, 1), 2, 0),
         ((1, 2, 2), 2, 1),
         ((1, 2, 2, 2), 2, 1),
+        ((2, 2, 2, 3), 2, 0),
+        pytest.param(
+            (2, 1),
+            2,
+            0,
+            marks=pytest.mark.xfail(
+                reason="an unsorted iterable for binary search"
+            ),
+        ),
         pytest.param(
             (2, 1, 3, 5, 4, 0),
             4,
-            None,
+            4,
             marks=pytest.mark.xfail(
                 reason="an unsorted iterable for binary search"
             ),
@@ -28,3 +64,95 @@ from adspy.algorithms.searching.binary_search import binary_search
 def test_binary_search(it: Iterable, elem: int, ans: None | int):
     lst = list(it)
     assert binary_search(lst, elem) == ans
+
+
+def test_binary_search_iterable():
+    assert binary_search(iter(range(10)), 7) == 7
+    assert binary_search((x for x in range(10)), 10) is None
+
+
+def test_binary_search_in_place():
+    size = 1 << 16
+    seq = NoCopySequence(range(size))
+
+    assert binary_search(seq, 12345) == 12345
+    assert seq.reads <= size.bit_length() + 1
+
+
+@pytest.mark.parametrize(
+    ("lo", "hi", "ans"),
+    [
+        (0, None, 2),
+        (2, None, 2),
+        (3, None, 3),
+        (4, None, None),
+        (0, 2, None),
+        (0, 3, 2),
+        (5, 3, None),
+    ],
+)
+def test_binary_search_bounds(lo: int, hi: None | int, ans: None | int):
+    assert binary_search([0, 1, 2, 2, 3], 2, lo, hi) == ans
+
+
+def test_binary_search_key():
+    seq = [(1, "a"), (2, "b"), (2, "c"), (5, "d")]
+
+    assert binary_search(seq, 2, key=lambda x: x[0]) == 1
+    assert binary_search(seq, 3, key=lambda x: x[0]) is None
+
+
+@pytest.mark.parametrize("func", [binary_search, bisect_left, bisect_right])
+def test_negative_lo(func: Callable):
+    with pytest.raises(ValueError, match="non-negative"):
+        func([1, 2, 3], 2, -1)
+
+
+@pytest.mark.parametrize(
+    ("func", "expected"),
+    [(bisect_left, bisect.bisect_left), (bisect_right, bisect.bisect_right)],
+)
+@pytest.mark.parametrize("key", [None, abs])
+def test_bisect(func: Callable, expected: Callable, key: None | Callable):
+    seq = sorted(
+        (random.randint(-10, 10) for _ in range(random.randint(0, 50))),
+        key=key,
+    )
+    for value in range(11):
+        lo = random.randint(0, len(seq))
+        hi = random.randint(lo, len(seq))
+        assert func(seq, value, key=key) == expected(seq, value, key=key)
+        assert func(seq, value, lo, hi, key=key) == expected(
+            seq, value, lo, hi, key=key
+        )
+
+
+@pytest.mark.parametrize("size", [0, 1, 10, 1_000])
+@pytest.mark.parametrize("nbr", [0, 1, 10, 1_000])
+def test_batch_binary_search(size: int, nbr: int):
+    seq = sorted(random.randint(0, size) for _ in range(size))
+    values = [random.randint(-1, size + 1) for _ in range(nbr)]
+
+    result = batch_binary_search(seq, values)
+
+    assert result == [binary_search(seq, value) for value in values]
+
+
+def test_batch_binary_search_key():
+    seq = [(1, "a"), (2, "b"), (2, "c"), (5, "d")]
+
+    result = batch_binary_search(
+        iter(seq), (x for x in (5, 3, 2, 0)), key=lambda x: x[0]
+    )
+
+    assert result == [3, None, 1, None]
+
+
+def test_batch_binary_search_narrows():
+    size, nbr = 1 << 16, 1 << 8
+    seq = NoCopySequence(range(size))
+    values = random.sample(range(size), nbr)
+
+    assert batch_binary_search(seq, values) == values
+    # the reads for the comparisons and then for the equality checks
+    assert seq.reads < nbr * (size // nbr).bit_length() * 2 + nbr
@@ -0,0 +1,83 @@
+import random
+from typing import Any
+
+import pytest
+
+from adspy.algorithms.searching.binary_search import binary_search
+from adspy.algorithms.searching.exponential_search import exponential_search
+
+
+class Squares:
+    """The lazily computed squares of the non-negative integers."""
+
+    def __init__(self, limit: None | int = None) -> None:
+        self.limit = limit
+        self.reads = 0
+
+    def __getitem__(self, idx: int) -> int:
+        if (self.limit is not None) and (idx >= self.limit):
+            raise IndexError(idx)
+        self.reads += 1
+        return idx * idx
+
+
+@pytest.mark.parametrize(
+    ("seq", "elem", "ans"),
+    [
+        ([], 21, None),
+        ([1, 2], 42, None),
+        ([1, 2], 0, None),
+        ((1, 2), 1, 0),
+        ((1, 2), 2, 1),
+        ((1, 2, 2), 2, 1),
+        ((1, 2, 2, 2), 2, 1),
+        ((2, 2, 2, 3), 2, 0),
+        ((1, 3, 5), 2, None),
+        ("abcd", "c", 2),
+    ],
+)
+def test_exponential_search(seq: Any, elem: Any, ans: None | int):
+    assert exponential_search(seq, elem) == ans
+
+
+def test_like_binary_search():
+    seq = sorted(random.randint(0, 100) for _ in range(100))
+
+    for value in range(-1, 102):
+        lo = random.randint(0, len(seq))
+        assert exponential_search(seq, value) == binary_search(seq, value)
+        assert exponential_search(seq, value, lo) == binary_search(
+            seq, value, lo
+        )
+
+
+@pytest.mark.parametrize("limit", [None, 1_000])
+def test_lazy_source(limit: None | int):
+    source = Squares(limit)
+
+    assert exponential_search(source, 0) == 0
+    assert exponential_search(source, 81) == 9
+    assert exponential_search(source, 82) is None
+    assert exponential_search(source, 999**2) == 999
+    expected = None if limit else 1_000
+    assert exponential_search(source, 1_000**2) == expected
+
+
+def test_probes():
+    source = Squares()
+
+    assert exponential_search(source, 10**12) == 10**6
+    # the unbounded source, O(log d) probes
+    assert source.reads <= 2 * (10**6).bit_length() + 1
+
+
+def test_exponential_search_key():
+    seq = [(1, "a"), (2, "b"), (2, "c"), (5, "d")]
+
+    assert exponential_search(seq, 2, key=lambda x: x[0]) == 1
+    assert exponential_search(seq, 3, key=lambda x: x[0]) is None
+
+
+def test_negative_lo():
+    with pytest.raises(ValueError, match="non-negative"):
+        exponential_search([1, 2, 3], 2, -1)
@@ -0,0 +1,74 @@
+import bisect
+import random
+from array import array
+
+import pytest
+
+from adspy.algorithms.searching.eytzinger_index import EytzingerIndex
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 7, 8, 9, 100])
+@pytest.mark.parametrize("typ", [int, float, str])
+def test_queries(size: int, typ: type):
+    items = sorted(typ(random.randint(0, 20)) for _ in range(size))
+    index = EytzingerIndex(items)
+
+    for value in map(typ, range(-1, 22)):
+        point = bisect.bisect_left(items, value)
+        found = (point < size) and (items[point] == value)
+        assert index.rank(value) == point
+        assert index.find(value) == (point if found else None)
+        assert (value in index) == found
+        assert index.lower_bound(value) == (
+            items[point] if point < size else None
+        )
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "ans"),
+    [
+        (0, 10, [1, 2, 2, 3, 5]),
+        (2, 3, [2, 2]),
+        (2, 2, []),
+        (3, 2, []),
+        (4, 5, []),
+        (5, 6, [5]),
+    ],
+)
+def test_range(start: int, stop: int, ans: list):
+    index = EytzingerIndex([1, 2, 2, 3, 5])
+
+    assert index.range(start, stop) == ans
+
+
+@pytest.mark.parametrize(
+    ("items", "buffer"),
+    [
+        ([1, 2, 3], array),
+        ([0.5, 1.5], array),
+        ([1, 2.5], list),
+        ([False, True], list),
+        ([1, 2**70], list),
+        (["a", "b"], list),
+        ([], list),
+    ],
+)
+def test_buffer(items: list, buffer: type):
+    index = EytzingerIndex(iter(items))
+
+    assert isinstance(index._items, buffer)  # noqa: SLF001
+    assert isinstance(index._tree, buffer)  # noqa: SLF001
+    assert list(index) == items
+    assert len(index) == len(items)
+    assert all(index.find(item) == idx for idx, item in enumerate(items))
+
+
+def test_not_sorted():
+    with pytest.raises(ValueError, match="must be sorted"):
+        EytzingerIndex([2, 1])
+
+
+def test_repr():
+    index = EytzingerIndex([1, 2])
+
+    assert repr(index) == "EytzingerIndex([1, 2])"
@@ -0,0 +1,103 @@
+import random
+from collections.abc import Iterable
+from math import inf, nan
+from typing import Any
+
+import pytest
+
+from adspy.algorithms.searching.binary_search import binary_search
+from adspy.algorithms.searching.interpolation_search import (
+    interpolation_search,
+)
+
+
+class CountingList(list):
+    def __init__(self, items: Iterable) -> None:
+        super().__init__(items)
+        self.reads = 0
+
+    def __getitem__(self, idx: Any) -> Any:
+        self.reads += 1
+        return super().__getitem__(idx)
+
+
+@pytest.mark.parametrize(
+    ("it", "elem", "ans"),
+    [
+        ([], 21, None),
+        ([1, 2], 42, None),
+        ([1, 2], 0, None),
+        ((1, 2), 1, 0),
+        ((1, 2), 2, 1),
+        ((1, 2, 2), 2, 1),
+        ((1, 2, 2, 2), 2, 1),
+        ((2, 2, 2, 3), 2, 0),
+        ((1, 3, 5), 2, None),
+        ((0.5, 1.5, 2.5), 1.5, 1),
+    ],
+)
+def test_interpolation_search(it: Iterable, elem: Any, ans: None | int):
+    lst = list(it)
+    assert interpolation_search(lst, elem) == ans
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        sorted(random.randint(0, 100) for _ in range(100)),
+        sorted(random.random() for _ in range(100)),
+        # skewed keys
+        [2**idx for idx in range(100)],
+        [0] * 50 + list(range(50)) + [10**9] * 50,
+    ],
+)
+def test_like_binary_search(seq: list):
+    for value in [*random.sample(seq, 20), -1, 0.25, 10**10]:
+        lo = random.randint(0, len(seq))
+        hi = random.randint(lo, len(seq))
+        assert interpolation_search(seq, value) == binary_search(seq, value)
+        assert interpolation_search(seq, value, lo, hi) == binary_search(
+            seq, value, lo, hi
+        )
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [-inf, 0.0, 1.0],
+        [-inf, inf],
+        [-inf, -inf, 0.5, 2.0, inf, inf],
+        [0.0, 1.0, 2.0, inf],
+    ],
+)
+@pytest.mark.parametrize("value", [-inf, 0.0, 0.5, 1.0, 2.0, inf, nan])
+def test_not_finite_keys(seq: list, value: float):
+    assert interpolation_search(seq, value) == binary_search(seq, value)
+
+
+def test_interpolation_search_key():
+    seq = [(1, "a"), (2, "b"), (2, "c"), (5, "d")]
+
+    assert interpolation_search(iter(seq), 2, key=lambda x: x[0]) == 1
+    assert interpolation_search(seq, 3, key=lambda x: x[0]) is None
+
+
+def test_interpolation_search_probes():
+    size = 1 << 16
+    uniform = CountingList(range(0, 3 * size, 3))
+    skewed = CountingList(idx**8 for idx in range(size))
+
+    for value in random.sample(range(0, 3 * size, 3), 100):
+        assert interpolation_search(uniform, value) == value // 3
+    for value in random.sample(range(size), 100):
+        assert interpolation_search(skewed, value**8) == value
+
+    # uniform keys are found at once (the window ends are read twice),
+    # the skewed ones fall back to bisection
+    assert uniform.reads <= 100 * 6
+    assert skewed.reads <= 100 * 3 * 2 * size.bit_length()
+
+
+def test_negative_lo():
+    with pytest.raises(ValueError, match="non-negative"):
+        interpolation_search([1, 2, 3], 2, -1)
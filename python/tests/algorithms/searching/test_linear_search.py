@@ -1,8 +1,12 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from itertools import count
 
 import pytest
 
-from adspy.algorithms.searching.linear_search import linear_search
+from adspy.algorithms.searching.linear_search import (
+    batch_linear_search,
+    linear_search,
+)
 
 
 @pytest.mark.parametrize(
@@ -19,3 +23,66 @@ from adspy.algorithms.searching.linear_search import linear_search
 def test_linear_search(it: Iterable, elem: int, ans: None | int):
     lst = list(it)
     assert linear_search(lst, elem) == ans
+
+
+def test_linear_search_streams():
+    it = count()
+
+    assert linear_search(it, 3) == 3
+    assert next(it) == 4
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "ans"),
+    [
+        (0, None, 1),
+        (1, None, 1),
+        (2, None, 3),
+        (2, 3, None),
+        (4, None, None),
+        (0, 0, None),
+    ],
+)
+def test_linear_search_window(start: int, stop: None | int, ans: None | int):
+    it = iter([0, 2, 1, 2])
+
+    assert linear_search(it, 2, start, stop) == ans
+
+
+def test_linear_search_predicate():
+    words = ["apple", "banana", "cherry"]
+
+    assert linear_search(words, predicate=lambda w: w.startswith("b")) == 1
+    assert linear_search(words, predicate=lambda w: len(w) > 6) is None
+    assert linear_search(count(), start=5, predicate=lambda x: x % 4 == 0) == 8
+
+
+@pytest.mark.parametrize("func", [linear_search, batch_linear_search])
+@pytest.mark.parametrize(("start", "stop"), [(-1, None), (0, -1)])
+def test_negative_window(func: Callable, start: int, stop: None | int):
+    with pytest.raises(ValueError, match="must be non-negative"):
+        func([1, 2, 3], [2], start, stop)
+
+
+def test_batch_linear_search():
+    it = iter([3, [], 1, 4, 1, 5, 9, 2, 6])
+
+    result = batch_linear_search(it, [1, 5, 7, 1, 3])
+
+    assert result == [2, 5, None, 2, 0]
+
+
+def test_batch_linear_search_single_pass():
+    it = count()
+
+    assert batch_linear_search(it, (x for x in [9, 5]), start=4) == [9, 5]
+    assert next(it) == 10
+    assert batch_linear_search(it, [12, 3], stop=5) == [1, None]
+    assert next(it) == 16
+
+
+def test_batch_linear_search_no_values():
+    it = count()
+
+    assert batch_linear_search(it, []) == []
+    assert next(it) == 0
@@ -1,13 +1,43 @@
-from collections.abc import Callable, Sequence
+import random
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from itertools import count, islice
 from operator import itemgetter
+from typing import Any
 
 import pytest
 
+from adspy.algorithms.sorting import (
+    bubble_sort,
+    insertion_sort,
+    merge_sort,
+    quick_sort,
+    selection_sort,
+)
 from adspy.algorithms.sorting.common import (
+    _default_key,
+    decorate,
+    gallop,
     is_sorted,
+    kmerge,
     merge,
+    merge_into,
+    merge_runs,
+    undecorate,
 )
 
+SORTS = [bubble_sort, insertion_sort, merge_sort, quick_sort, selection_sort]
+
+
+class CountingKey:
+    def __init__(self, key: Callable = abs) -> None:
+        self.key = key
+        self.calls = 0
+
+    def __call__(self, arg: Any) -> Any:
+        self.calls += 1
+        return self.key(arg)
+
 
 @pytest.mark.parametrize(
     ("seq", "reverse", "strict", "ans"),
@@ -65,3 +95,143 @@ def test_is_sorted_key(seq: Sequence, key: None | Callable, ans: bool):
 )
 def test_merge(seq1: Sequence, seq2: Sequence, reverse: bool, ans: list):
     assert merge(seq1=seq1, seq2=seq2, reverse=reverse) == ans
+
+
+@pytest.mark.parametrize(
+    ("seq", "reverse", "ans"),
+    [
+        ([], False, []),
+        (["b", "a"], False, [(1, 0, "b"), (0, 1, "a")]),
+        (["b", "a"], True, [(1, 0, "b"), (0, -1, "a")]),
+    ],
+)
+def test_decorate(seq: Sequence, reverse: bool, ans: list):
+    records = decorate(seq, key=lambda x: ord(x) - ord("a"), reverse=reverse)
+
+    assert records == ans
+    assert undecorate(records) == list(seq)
+
+
+@pytest.mark.parametrize("sort", [*SORTS, merge])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_is_called_once_per_item(sort: Callable, reverse: bool):
+    sample = [random.randint(-10, 10) for _ in range(50)]
+    key = CountingKey()
+
+    if sort is merge:
+        result = sort(sample[:20], sample[20:], key, reverse=reverse)
+    else:
+        result = sort(sample, key, reverse=reverse)
+
+    assert key.calls == len(sample)
+    if sort is not merge:
+        assert result == sorted(sample, key=abs, reverse=reverse)
+
+
+@pytest.mark.parametrize("sort", SORTS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sorting_is_stable(sort: Callable, reverse: bool):
+    sample = [(random.randint(0, 3), idx) for idx in range(30)]
+    key = itemgetter(0)
+
+    assert sort(sample, key, reverse=reverse) == sorted(
+        sample, key=key, reverse=reverse
+    )
+
+
+@pytest.mark.parametrize(
+    ("src", "mid", "reverse", "ans"),
+    [
+        ([], 0, False, []),
+        ([1, 3, 2], 2, False, [1, 2, 3]),
+        ([1, 3, 2], 3, False, [1, 3, 2]),
+        ([2, 1, 3], 0, False, [2, 1, 3]),
+        ([2, 4, 1, 3], 2, False, [1, 2, 3, 4]),
+        ([4, 2, 3, 1], 2, True, [4, 3, 2, 1]),
+    ],
+)
+def test_merge_into(src: list, mid: int, reverse: bool, ans: list):
+    records = decorate(src, abs, reverse=reverse)
+    dst: list = [None] * (len(src) + 2)
+
+    merge_into(records, dst, 0, mid, len(src), reverse=reverse)
+
+    assert undecorate(dst[: len(src)]) == ans
+    assert dst[len(src) :] == [None, None]
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 10, 100])
+@pytest.mark.parametrize("right", [False, True])
+def test_gallop(size: int, right: bool):
+    lst = sorted(random.randint(0, 10) for _ in range(size))
+    bisect = bisect_right if right else bisect_left
+
+    for item in range(-1, 12):
+        for lo in range(0, size + 1, 3):
+            assert gallop(item, lst, lo, size, right=right) == bisect(
+                lst, item, lo, size
+            )
+
+
+@pytest.mark.parametrize("min_gallop", [1, 7])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_runs(min_gallop: int, reverse: bool):
+    run1 = sorted(random.sample(range(200), 50), reverse=reverse)
+    run2 = sorted(random.sample(range(200), 80), reverse=reverse)
+    records = decorate([*run1, *run2], _default_key, reverse=reverse)
+
+    merge_runs(
+        records,
+        0,
+        len(run1),
+        len(records),
+        reverse=reverse,
+        min_gallop=min_gallop,
+    )
+
+    assert undecorate(records) == sorted(run1 + run2, reverse=reverse)
+
+
+@pytest.mark.parametrize("nbr", [0, 1, 2, 5])
+@pytest.mark.parametrize("key", [None, abs])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_kmerge(nbr: int, key: None | Callable, reverse: bool):
+    lists = [
+        sorted(
+            (random.randint(-20, 20) for _ in range(random.randint(0, 30))),
+            key=key,
+            reverse=reverse,
+        )
+        for _ in range(nbr)
+    ]
+
+    result = kmerge(*lists, key=key, reverse=reverse)
+
+    assert isinstance(result, Iterator)
+    assert list(result) == sorted(sum(lists, []), key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_kmerge_is_stable(reverse: bool):
+    lists = [
+        sorted(
+            ((random.randint(0, 3), order, idx) for idx in range(20)),
+            reverse=reverse,
+        )
+        for order in range(4)
+    ]
+    key = itemgetter(0)
+
+    result = kmerge(*lists, key=key, reverse=reverse)
+
+    assert list(result) == sorted(sum(lists, []), key=key, reverse=reverse)
+
+
+def test_kmerge_is_lazy():
+    evens, odds = count(0, 2), count(1, 2)
+    key = CountingKey()
+
+    result = kmerge(evens, odds, key=key)
+
+    assert list(islice(result, 10)) == list(range(10))
+    assert key.calls == 11
@@ -0,0 +1,111 @@
+"""Test the "Counting sort" implementation(s)."""
+
+import random
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager
+from contextlib import nullcontext as does_not_raise
+from operator import itemgetter
+
+import pytest
+
+from adspy.algorithms.sorting.common import is_sorted
+from adspy.algorithms.sorting.counting_sort import counting_sort
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [],
+        [1],
+        (2, 0, 1),
+        {2, 4, 3, 1},
+        [2, 3, 1, 1, 5],
+    ],
+)
+@pytest.mark.parametrize(
+    "key",
+    [
+        None,
+        abs,
+    ],
+)
+@pytest.mark.parametrize(
+    "reverse",
+    [
+        False,
+        True,
+    ],
+)
+def test_counting_sort(seq: Sequence, key: None | Callable, reverse: bool):
+    lst = list(seq)
+
+    result = counting_sort(lst, key=key, reverse=reverse)
+    expected = sorted(lst, key=key, reverse=reverse)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("seq", "key", "expectation"),
+    [
+        ([0, 1, -1], None, does_not_raise()),
+        (
+            [(2, 1), (3, 4), (5, -5), (0, 2)],
+            itemgetter(-1),
+            does_not_raise(),
+        ),
+        ((0, 1, -1), abs, does_not_raise()),
+        pytest.param(
+            [0],
+            5,
+            pytest.raises(AssertionError),
+            marks=pytest.mark.xfail(reason="key is not callable"),
+        ),
+    ],
+)
+def test_counting_sort_key(
+    seq: Sequence, key: None | Callable, expectation: AbstractContextManager
+):
+    lst = list(seq)
+
+    result = counting_sort(lst, key=key)
+
+    assert is_sorted(result, key=key)
+    with expectation:
+        expected = sorted(lst, key=key)
+        assert result == expected
+
+
+def test_counting_sort_purity():
+    sample = random.sample(range(1, 100, 2), 15)
+    sample_dup = sample.copy()
+
+    assert counting_sort(seq=sample) == sorted(sample)
+    assert sample == sample_dup
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [random.randint(-5, 5) for _ in range(200)],
+        [random.randint(-(10**12), 10**12) for _ in range(200)],
+        [True, 2, False, -1],
+        [0.5, -1.5, 2.0],
+        ["b", "a", "c"],
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_counting_sort_keys(seq: Sequence, reverse: bool):
+    result = counting_sort(seq, reverse=reverse)
+
+    assert result == sorted(seq, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_counting_sort_is_stable(reverse: bool):
+    sample = [(random.randint(0, 3), idx) for idx in range(100)]
+    key = itemgetter(0)
+
+    result = counting_sort(sample, key, reverse=reverse)
+
+    assert result == sorted(sample, key=key, reverse=reverse)
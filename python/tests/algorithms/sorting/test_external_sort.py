@@ -0,0 +1,147 @@
+"""Test the "External merge sort" implementation(s)."""
+
+import pickle
+import random
+from collections.abc import Callable, Iterator, Sequence
+from importlib import import_module
+from math import ceil, log
+from operator import itemgetter
+from tempfile import TemporaryFile
+from typing import IO, Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from adspy.algorithms.sorting.external_sort import external_sort
+
+external_sort_module = import_module(external_sort.__module__)
+
+
+class CountingSerializer:
+    def __init__(self) -> None:
+        self.dumps = 0
+
+    def dump(self, obj: Any, file: IO[bytes], /) -> None:
+        self.dumps += 1
+        pickle.dump(obj, file)
+
+    def load(self, file: IO[bytes], /) -> Any:
+        return pickle.load(file)  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [],
+        [1],
+        (2, 0, 1),
+        {2, 4, 3, 1},
+        [2, 3, 1, 1, 5],
+        [random.randint(-50, 50) for _ in range(100)],
+    ],
+)
+@pytest.mark.parametrize("key", [None, abs])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 3, 1_000])
+def test_external_sort(
+    seq: Sequence, key: None | Callable, reverse: bool, chunk_size: int
+):
+    lst = list(seq)
+
+    result = external_sort(lst, key, reverse=reverse, chunk_size=chunk_size)
+
+    assert isinstance(result, Iterator)
+    assert list(result) == sorted(lst, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_sort_is_stable(reverse: bool):
+    sample = [(random.randint(0, 3), idx) for idx in range(500)]
+    key = itemgetter(0)
+
+    result = external_sort(sample, key, reverse=reverse, chunk_size=7)
+
+    assert list(result) == sorted(sample, key=key, reverse=reverse)
+
+
+def test_external_sort_consumes_iterables():
+    sample = [random.random() for _ in range(1_000)]
+
+    result = external_sort(iter(sample), chunk_size=100)
+
+    assert list(result) == sorted(sample)
+
+
+@pytest.mark.parametrize(
+    ("size", "chunk_size", "spilled"),
+    [
+        (10, 100, False),
+        (100, 100, True),
+        (1_000, 100, True),
+    ],
+)
+def test_external_sort_serializer(size: int, chunk_size: int, spilled: bool):
+    sample = random.sample(range(size), size)
+    serializer = CountingSerializer()
+
+    result = external_sort(sample, chunk_size=chunk_size, serializer=serializer)
+
+    assert list(result) == sorted(sample)
+    assert bool(serializer.dumps) == spilled
+
+
+def test_external_sort_is_lazy():
+    consumed = 0
+
+    def generate() -> Iterator[int]:
+        nonlocal consumed
+        for item in range(100, 0, -1):
+            consumed += 1
+            yield item
+
+    result = external_sort(generate(), chunk_size=10)
+    assert not consumed
+
+    assert next(result) == 1
+    assert consumed == 100
+
+
+def test_external_sort_bad_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size"):
+        external_sort([], chunk_size=0)
+
+
+@pytest.mark.parametrize("max_fan_in", [2, 3, 7, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_external_sort_max_fan_in(
+    max_fan_in: int, reverse: bool, mocker: MockerFixture
+):
+    sample = [(random.randint(0, 9), idx) for idx in range(1_000)]
+    key = itemgetter(0)
+    opened: list[IO[bytes]] = []
+    # at most `max_fan_in - 1` runs per level and a merged one are open
+    levels = 1 + ceil(log(ceil(len(sample) / 7), max_fan_in))
+
+    def temporary_file(*args: Any, **kwargs: Any) -> IO[bytes]:
+        opened.append(TemporaryFile(*args, **kwargs))  # noqa: SIM115
+        open_files = sum(not file.closed for file in opened)
+        assert open_files <= levels * (max_fan_in - 1) + 1
+        return opened[-1]
+
+    mocker.patch.object(external_sort_module, "TemporaryFile", temporary_file)
+    kmerge = mocker.spy(external_sort_module, "kmerge")
+
+    result = external_sort(
+        sample, key, reverse=reverse, chunk_size=7, max_fan_in=max_fan_in
+    )
+
+    assert list(result) == sorted(sample, key=key, reverse=reverse)
+    assert all(len(call.args) <= max_fan_in for call in kmerge.call_args_list)
+    assert len(kmerge.call_args_list[-1].args) > 1
+    assert all(file.closed for file in opened)
+
+
+@pytest.mark.parametrize("max_fan_in", [-1, 0, 1])
+def test_external_sort_bad_max_fan_in(max_fan_in: int):
+    with pytest.raises(ValueError, match="max_fan_in"):
+        external_sort([], max_fan_in=max_fan_in)
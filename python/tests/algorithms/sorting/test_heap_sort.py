@@ -0,0 +1,84 @@
+"""Test the "Heap sort" implementation(s)."""
+
+import random
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager
+from contextlib import nullcontext as does_not_raise
+from operator import itemgetter
+
+import pytest
+
+from adspy.algorithms.sorting.common import is_sorted
+from adspy.algorithms.sorting.heap_sort import heap_sort
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [],
+        [1],
+        (2, 0, 1),
+        {2, 4, 3, 1},
+        [2, 3, 1, 1, 5],
+    ],
+)
+@pytest.mark.parametrize(
+    "key",
+    [
+        None,
+        abs,
+    ],
+)
+@pytest.mark.parametrize(
+    "reverse",
+    [
+        False,
+        True,
+    ],
+)
+def test_heap_sort(seq: Sequence, key: None | Callable, reverse: bool):
+    lst = list(seq)
+
+    result = heap_sort(lst, key=key, reverse=reverse)
+    expected = sorted(lst, key=key, reverse=reverse)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("seq", "key", "expectation"),
+    [
+        ([0, 1, -1], None, does_not_raise()),
+        (
+            [(2, 1), (3, 4), (5, -5), (0, 2)],
+            itemgetter(-1),
+            does_not_raise(),
+        ),
+        ((0, 1, -1), abs, does_not_raise()),
+        pytest.param(
+            [0],
+            5,
+            pytest.raises(AssertionError),
+            marks=pytest.mark.xfail(reason="key is not callable"),
+        ),
+    ],
+)
+def test_heap_sort_key(
+    seq: Sequence, key: None | Callable, expectation: AbstractContextManager
+):
+    lst = list(seq)
+
+    result = heap_sort(lst, key=key)
+
+    assert is_sorted(result, key=key)
+    with expectation:
+        expected = sorted(lst, key=key)
+        assert result == expected
+
+
+def test_heap_sort_purity():
+    sample = random.sample(range(1, 100, 2), 15)
+    sample_dup = sample.copy()
+
+    assert heap_sort(seq=sample) == sorted(sample)
+    assert sample == sample_dup
@@ -36,10 +36,19 @@ from adspy.algorithms.sorting.merge_sort import merge_sort
         True,
     ],
 )
-def test_merge_sort(seq: Sequence, key: None | Callable, reverse: bool):
+@pytest.mark.parametrize(
+    "adaptive",
+    [
+        False,
+        True,
+    ],
+)
+def test_merge_sort(
+    seq: Sequence, key: None | Callable, reverse: bool, adaptive: bool
+):
     lst = list(seq)
 
-    result = merge_sort(lst, key=key, reverse=reverse)
+    result = merge_sort(lst, key=key, reverse=reverse, adaptive=adaptive)
     expected = sorted(lst, key=key, reverse=reverse)
 
     assert result == expected
@@ -54,12 +63,7 @@ def test_merge_sort(seq: Sequence, key: None | Callable, reverse: bool):
             itemgetter(-1),
             does_not_raise(),
         ),
-        pytest.param(
-            (0, 1, -1),
-            abs,
-            does_not_raise(),
-            marks=pytest.mark.xfail(reason="key failed to sort"),
-        ),
+        ((0, 1, -1), abs, does_not_raise()),
         pytest.param(
             [0],
             5,
@@ -87,3 +91,51 @@ def test_merge_sort_purity():
 
     assert merge_sort(seq=sample) == sorted(sample)
     assert sample == sample_dup
+
+
+def _nearly_sorted(size: int, late: int) -> list:
+    lst = list(range(size))
+    for _ in range(late):
+        lst.insert(random.randrange(size), random.randrange(size))
+    return lst
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        list(range(1_000)),
+        list(range(1_000, 0, -1)),
+        [*range(500), *range(500, 0, -1)],
+        _nearly_sorted(1_000, 10),
+        [random.randint(0, 3) for _ in range(1_000)],
+        [random.random() for _ in range(1_000)],
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_sort_adaptive(seq: Sequence, reverse: bool):
+    result = merge_sort(seq, reverse=reverse, adaptive=True)
+
+    assert result == sorted(seq, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_merge_sort_adaptive_sorted_input_is_linear(reverse: bool):
+    comparisons = 0
+
+    class Item(int):
+        def __lt__(self, other: int) -> bool:
+            nonlocal comparisons
+            comparisons += 1
+            return super().__lt__(other)
+
+        def __gt__(self, other: int) -> bool:
+            nonlocal comparisons
+            comparisons += 1
+            return super().__gt__(other)
+
+    sample = [Item(idx) for idx in range(1_000)]
+    if reverse:
+        sample.reverse()
+
+    assert merge_sort(sample, reverse=reverse, adaptive=True) == sample
+    assert comparisons == len(sample) - 1
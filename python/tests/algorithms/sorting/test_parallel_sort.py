@@ -0,0 +1,64 @@
+"""Test the parallel "Merge sort" implementation(s)."""
+
+import random
+from collections.abc import Callable, Sequence
+from importlib import import_module
+from operator import itemgetter
+
+import pytest
+
+from adspy.algorithms.sorting.parallel_sort import parallel_merge_sort
+
+parallel_sort_module = import_module(parallel_merge_sort.__module__)
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel_sort_module, "MIN_CHUNK_SIZE", 2)
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [],
+        [1],
+        (2, 0, 1),
+        {2, 4, 3, 1},
+        [2, 3, 1, 1, 5],
+        [random.randint(-50, 50) for _ in range(100)],
+    ],
+)
+@pytest.mark.parametrize("key", [None, abs])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_merge_sort(
+    seq: Sequence, key: None | Callable, reverse: bool, workers: int
+):
+    lst = list(seq)
+
+    result = parallel_merge_sort(lst, key, reverse=reverse, workers=workers)
+
+    assert result == sorted(lst, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_parallel_merge_sort_is_stable(reverse: bool):
+    sample = [(random.randint(0, 3), idx) for idx in range(200)]
+    key = itemgetter(0)
+
+    result = parallel_merge_sort(sample, key, reverse=reverse, workers=4)
+
+    assert result == sorted(sample, key=key, reverse=reverse)
+
+
+def test_parallel_merge_sort_unpicklable_key():
+    sample = random.sample(range(100), 100)
+
+    result = parallel_merge_sort(sample, lambda x: -x, workers=2)
+
+    assert result == sorted(sample, reverse=True)
+
+
+def test_parallel_merge_sort_bad_workers():
+    with pytest.raises(ValueError, match="workers"):
+        parallel_merge_sort([], workers=0)
@@ -4,13 +4,18 @@ import random
 from collections.abc import Callable, Sequence
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
+from importlib import import_module
 from operator import itemgetter
 
 import pytest
+from pytest_mock import MockerFixture
 
 from adspy.algorithms.sorting.common import is_sorted
 from adspy.algorithms.sorting.quick_sort import quick_sort
 
+# the package re-exports the function under the module name
+quick_sort_module = import_module(quick_sort.__module__)
+
 
 @pytest.mark.parametrize(
     "seq",
@@ -37,10 +42,32 @@ from adspy.algorithms.sorting.quick_sort import quick_sort
         True,
     ],
 )
-def test_quick_sort(seq: Sequence, key: None | Callable, reverse: bool):
+@pytest.mark.parametrize(
+    "introsort",
+    [
+        False,
+        True,
+    ],
+)
+@pytest.mark.parametrize(
+    "three_way",
+    [
+        False,
+        True,
+    ],
+)
+def test_quick_sort(
+    seq: Sequence,
+    key: None | Callable,
+    reverse: bool,
+    introsort: bool,
+    three_way: bool,
+):
     lst = list(seq)
 
-    result = quick_sort(lst, key=key, reverse=reverse)
+    result = quick_sort(
+        lst, key=key, reverse=reverse, introsort=introsort, three_way=three_way
+    )
     expected = sorted(lst, key=key, reverse=reverse)
 
     assert result == expected
@@ -55,12 +82,7 @@ def test_quick_sort(seq: Sequence, key: None | Callable, reverse: bool):
             itemgetter(-1),
             does_not_raise(),
         ),
-        pytest.param(
-            (0, 1, -1),
-            abs,
-            does_not_raise(),
-            marks=pytest.mark.xfail(reason="key failed to sort"),
-        ),
+        ((0, 1, -1), abs, does_not_raise()),
         pytest.param(
             [0],
             5,
@@ -88,3 +110,56 @@ def test_quick_sort_purity():
 
     assert quick_sort(seq=sample) == sorted(sample)
     assert sample == sample_dup
+
+
+@pytest.mark.parametrize(
+    "seq",
+    [
+        list(range(5_000)),
+        list(range(5_000, 0, -1)),
+        [*range(2_500), *range(2_500, 0, -1)],
+        [random.randint(0, 3) for _ in range(5_000)],
+        [random.random() for _ in range(5_000)],
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("three_way", [False, True])
+def test_quick_sort_introsort(seq: Sequence, reverse: bool, three_way: bool):
+    result = quick_sort(
+        seq, reverse=reverse, introsort=True, three_way=three_way
+    )
+
+    assert result == sorted(seq, reverse=reverse)
+
+
+def test_quick_sort_introsort_falls_back_to_heap_sort(mocker: MockerFixture):
+    def second_smallest(
+        lst: list,
+        left: int,
+        right: int,
+        cmp: Callable,  # noqa: ARG001
+    ) -> int:
+        candidates = sorted(range(left, right + 1), key=lst.__getitem__)
+        return candidates[1]
+
+    mocker.patch.object(
+        quick_sort_module, "_choose_pivot", side_effect=second_smallest
+    )
+    heap_sort = mocker.spy(quick_sort_module, "_heap_sort")
+    sample = random.sample(range(1_000), 1_000)
+
+    assert quick_sort(sample, introsort=True) == sorted(sample)
+    assert heap_sort.called
+
+
+@pytest.mark.parametrize("introsort", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_quick_sort_three_way_is_stable(introsort: bool, reverse: bool):
+    sample = [(random.randint(0, 5), idx) for idx in range(2_000)]
+    key = itemgetter(0)
+
+    result = quick_sort(
+        sample, key, reverse=reverse, introsort=introsort, three_way=True
+    )
+
+    assert result == sorted(sample, key=key, reverse=reverse)
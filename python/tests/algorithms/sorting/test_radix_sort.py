@@ -0,0 +1,71 @@
+"""Test the "Radix sort" implementation(s)."""
+
+import random
+from collections.abc import Callable, Sequence
+from operator import itemgetter
+
+import pytest
+
+from adspy.algorithms.sorting.common import is_sorted
+from adspy.algorithms.sorting.radix_sort import lsd_radix_sort, msd_radix_sort
+
+
+def _random_str(size: int) -> str:
+    return "".join(random.choice("ab\xe9\U0001f600") for _ in range(size))
+
+
+@pytest.mark.parametrize("sort", [lsd_radix_sort, msd_radix_sort])
+@pytest.mark.parametrize(
+    "seq",
+    [
+        [],
+        [1],
+        (2, 0, 1),
+        {2, 4, 3, 1},
+        [2, 3, 1, 1, 5],
+        [random.randint(-(10**12), 10**12) for _ in range(200)],
+        [True, 2, False, -1],
+        [_random_str(random.randint(0, 5)) for _ in range(200)],
+        [random.randbytes(random.randint(0, 3)) for _ in range(200)],
+        [0.5, -1.5, 2.0],
+    ],
+)
+@pytest.mark.parametrize("key", [None, abs])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_radix_sort(
+    sort: Callable, seq: Sequence, key: None | Callable, reverse: bool
+):
+    lst = list(seq)
+    if key and not all(isinstance(item, (int, float)) for item in lst):
+        key = len
+
+    result = sort(lst, key=key, reverse=reverse)
+
+    assert is_sorted(result, key=key, reverse=reverse)
+    assert result == sorted(lst, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("sort", [lsd_radix_sort, msd_radix_sort])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_radix_sort_is_stable(sort: Callable, reverse: bool):
+    sample = [(random.choice(["a", "ab", "b", ""]), idx) for idx in range(200)]
+    key = itemgetter(0)
+
+    result = sort(sample, key, reverse=reverse)
+
+    assert result == sorted(sample, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("sort", [lsd_radix_sort, msd_radix_sort])
+def test_radix_sort_mixed_keys(sort: Callable):
+    with pytest.raises(TypeError):
+        sort([1, "a", b"b"])
+
+
+@pytest.mark.parametrize("sort", [lsd_radix_sort, msd_radix_sort])
+def test_radix_sort_purity(sort: Callable):
+    sample = random.sample(range(1, 100, 2), 15)
+    sample_dup = sample.copy()
+
+    assert sort(sample) == sorted(sample)
+    assert sample == sample_dup
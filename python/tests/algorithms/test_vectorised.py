@@ -0,0 +1,149 @@
+import random
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from adspy.algorithms import vectorised
+from adspy.algorithms.searching import (
+    batch_binary_search,
+    binary_search,
+    bisect_left,
+    bisect_right,
+)
+from adspy.algorithms.sorting import merge_sort, quick_sort
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize(
+    ("seq", "numeric"),
+    [
+        (np.array([3.0, 1.0]), True),
+        (np.array([3, 1], dtype=np.uint8), True),
+        (np.array([True, False]), True),
+        (np.array(["b", "a"]), False),
+        (np.array([[2, 1], [4, 3]]), False),
+        (array("d", [3.0, 1.0]), True),
+        (array("q", [3, 1]), True),
+        (array("u", "ba"), False),
+        ([3, 1], False),
+    ],
+)
+def test_numeric_array(seq: Any, numeric: bool):
+    assert (vectorised.numeric_array(seq) is not None) == numeric
+
+
+def test_numeric_array_without_numpy(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(vectorised, "HAS_NUMPY", False)
+
+    assert vectorised.numeric_array(np.array([3.0, 1.0])) is None
+
+
+@pytest.mark.parametrize("sort", [merge_sort, quick_sort])
+@pytest.mark.parametrize(
+    "seq",
+    [
+        np.array([]),
+        np.random.default_rng().normal(size=100),
+        np.random.default_rng().integers(-5, 5, size=100),
+        array("q", (random.randint(-5, 5) for _ in range(100))),
+    ],
+)
+@pytest.mark.parametrize(
+    "key",
+    [
+        None,
+        abs,
+        lambda x: -x,
+        np.abs,  # vectorised
+        np.negative,  # vectorised
+        lambda x: x if x > 0 else -x,  # not vectorised
+        lambda x: str(x),  # not numeric
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sort(sort: Callable, seq: Any, key: None | Callable, reverse: bool):
+    result = sort(seq, key, reverse=reverse)
+
+    assert isinstance(result, list)
+    assert result == sorted(seq.tolist(), key=key, reverse=reverse)
+
+
+def test_sort_dispatches_to_numpy():
+    seq = np.array([3.0, 1.0, 2.0])
+
+    assert vectorised.sort(seq) == [1.0, 2.0, 3.0]
+    assert vectorised.sort(seq, np.negative) == [3.0, 2.0, 1.0]
+    assert vectorised.sort(seq, abs) is None
+    assert vectorised.sort(seq, lambda x: x if x > 0 else -x) is None
+    assert vectorised.sort(seq.tolist()) is None
+
+
+@pytest.mark.parametrize("sort", [merge_sort, quick_sort])
+@pytest.mark.parametrize(
+    ("seq", "key"),
+    [
+        # the int64 squares overflow
+        (array("q", [3_000_000_000, 5, 4_000_000_000]), lambda x: x * x),
+        # the int8 abs(-128) overflows
+        (np.array([-128, 127, 0], dtype=np.int8), abs),
+        # not a NumPy array method
+        (array("q", [8, 1, 3]), lambda x: x.bit_length()),
+    ],
+)
+def test_sort_keys_with_python_semantics(
+    sort: Callable, seq: Any, key: Callable
+):
+    assert sort(seq, key) == sorted(seq.tolist(), key=key)
+
+
+@pytest.mark.parametrize(
+    ("seq", "value", "ans"),
+    [
+        (np.array([]), 1, None),
+        (np.array([1, 2, 2, 2, 5]), 2, 1),
+        (np.array([1, 2, 2, 2, 5]), 3, None),
+        (np.array([1.5, 2.5]), 2.5, 1),
+        (array("i", [1, 2, 3]), 3, 2),
+    ],
+)
+def test_binary_search(seq: Any, value: Any, ans: None | int):
+    assert vectorised.search(seq, value) is not None
+    assert binary_search(seq, value) == ans
+
+
+def test_search_bounds():
+    seq = array("q", [1, 2, 2, 2, 5, 5])
+
+    assert vectorised.search(seq, 2, lo=2) == 2
+    assert vectorised.search(seq, 2, lo=2, hi=3, right=True) == 3
+    assert vectorised.search(seq, 5, hi=4) == 4
+    assert binary_search(seq, 5, 0, 4) is None
+
+
+def test_batch_binary_search():
+    seq = np.array([1, 2, 2, 2, 5])
+    values = [5, 2, 3, 0.5, 6]
+
+    assert vectorised.search_batch(seq, values) == [4, 1, 4, 0, 5]
+    assert vectorised.search_batch(seq, values, right=True) == [5, 4, 4, 0, 5]
+    assert vectorised.search_batch(seq, ["a"]) is None
+    assert batch_binary_search(seq, values) == [4, 1, None, None, None]
+
+
+@pytest.mark.parametrize("bisect", [bisect_left, bisect_right])
+def test_keyed_bisect_calls_key_per_probe(bisect: Callable):
+    seq = np.arange(1_024)
+    calls = []
+
+    def key(item: Any) -> Any:
+        calls.append(item)
+        return -item
+
+    idx = bisect(seq[::-1], -500, key=key)
+
+    assert idx == (523 if bisect is bisect_left else 524)
+    assert len(calls) <= 11
+    assert batch_binary_search(seq[::-1], [-500], key=key) == [523]
@@ -0,0 +1,168 @@
+import functools
+import random
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+from adspy.data_structures.caches import (
+    Cache,
+    CacheInfo,
+    LFUCache,
+    LRUCache,
+    lfu_cache,
+    lru_cache,
+    memoize,
+)
+
+CACHES = [LRUCache, LFUCache]
+
+
+@pytest.mark.parametrize("cache_cls", CACHES)
+def test_get_put(cache_cls: type[Cache]):
+    cache = cache_cls(2)
+
+    assert cache.get("a") is None
+    assert cache.get("a", 0) == 0
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert "a" in cache
+    assert cache.get("a") == 1
+    cache.put("a", 3)
+    assert cache.get("a") == 3
+    assert len(cache) == 2
+    assert cache.info() == CacheInfo(
+        hits=2, misses=2, evictions=0, maxsize=2, currsize=2
+    )
+
+    cache.clear()
+    assert len(cache) == 0
+    assert "a" not in cache
+    assert cache.info() == CacheInfo(0, 0, 0, 2, 0)
+
+
+def test_lru_eviction():
+    cache = LRUCache(3)
+    for key in "abc":
+        cache.put(key, key)
+
+    cache.get("a")
+    cache.put("d", "d")
+    assert "b" not in cache
+    cache.put("c", "C")
+    cache.put("e", "e")
+    assert "a" not in cache
+    assert [key for key in "abcde" if key in cache] == ["c", "d", "e"]
+    assert cache.evictions == 2
+
+
+def test_lfu_eviction():
+    cache = LFUCache(3)
+    for key in "abc":
+        cache.put(key, key)
+
+    for _ in range(3):
+        cache.get("a")
+    cache.get("b")
+    cache.put("d", "d")  # "c" is used once
+    assert "c" not in cache
+    cache.put("e", "e")  # "d" is used once, "b" twice
+    assert "d" not in cache
+    assert cache.frequency("a") == 4
+    assert cache.frequency("b") == 2
+    assert cache.frequency("e") == 1
+    assert cache.frequency("z") == 0
+    assert cache.evictions == 2
+
+
+@pytest.mark.parametrize("cache_cls", CACHES)
+@pytest.mark.parametrize("maxsize", [None, 0, 1, 5])
+def test_like_reference(cache_cls: type[Cache], maxsize: None | int):
+    cache = cache_cls(maxsize)
+    reference: dict = {}
+    uses: Counter = Counter()
+    order: list = []
+
+    for _ in range(1_000):
+        key = random.randint(0, 9)
+        if random.random() < 0.5:
+            value = cache.get(key)
+            if key in reference:
+                assert value == reference[key]
+                uses[key] += 1
+                order.remove(key)
+                order.append(key)
+            else:
+                assert value is None
+            continue
+        value = random.random()
+        if maxsize == 0:
+            cache.put(key, value)
+            continue
+        if (key not in reference) and (len(reference) == maxsize):
+            if cache_cls is LRUCache:
+                evicted = order[0]
+            else:
+                least = min(uses[k] for k in order)
+                evicted = next(k for k in order if uses[k] == least)
+            del reference[evicted]
+            del uses[evicted]
+            order.remove(evicted)
+        if key in order:
+            order.remove(key)
+        reference[key] = value
+        uses[key] += 1
+        order.append(key)
+        cache.put(key, value)
+
+        assert len(cache) == len(reference)
+        assert all(key in cache for key in reference)
+
+
+@pytest.mark.parametrize("cache_cls", CACHES)
+def test_negative_maxsize(cache_cls: type[Cache]):
+    with pytest.raises(ValueError, match="must be non-negative"):
+        cache_cls(-1)
+
+
+@pytest.mark.parametrize("decorator", [lru_cache, lfu_cache])
+def test_decorators(decorator: Callable):
+    calls: list = []
+
+    @decorator(maxsize=2)
+    def power(base: int, exp: int = 2) -> int:
+        calls.append((base, exp))
+        return int(base**exp)
+
+    assert power(2) == 4
+    assert power(2) == 4
+    assert power(2, exp=3) == 8
+    assert power(2, 3) == 8
+    assert calls == [(2, 2), (2, 3), (2, 3)]
+    assert power.__name__ == "power"
+    assert power.cache_info() == CacheInfo(1, 3, 1, 2, 2)
+
+    power.cache_clear()
+    assert power.cache_info() == CacheInfo(0, 0, 0, 2, 0)
+
+
+def test_memoize_like_functools():
+    cache = LRUCache(16)
+
+    @memoize(cache)
+    def fib(nbr: int) -> int:
+        return nbr if nbr < 2 else fib(nbr - 1) + fib(nbr - 2)
+
+    @functools.lru_cache(16)
+    def reference(nbr: int) -> int:
+        return nbr if nbr < 2 else reference(nbr - 1) + reference(nbr - 2)
+
+    assert fib(50) == reference(50)
+    assert fib.cache is cache  # type: ignore [attr-defined]
+    info, expected = cache.info(), reference.cache_info()
+    assert (info.hits, info.misses) == (expected.hits, expected.misses)
+
+
+@pytest.mark.parametrize("cache_cls", CACHES)
+def test_repr(cache_cls: type[Cache]):
+    assert repr(cache_cls(3)) == f"{cache_cls.__name__}(maxsize=3)"
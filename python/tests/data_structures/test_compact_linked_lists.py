@@ -0,0 +1,215 @@
+import random
+from collections import deque
+from collections.abc import Callable, MutableSequence
+from sys import maxsize
+
+import pytest
+
+from adspy.data_structures.compact_linked_lists import CompactLinkedList
+from adspy.data_structures.linked_lists import DoublyLinkedList
+
+
+def test_is_mutable_sequence() -> None:
+    assert isinstance(CompactLinkedList(), MutableSequence)
+
+
+def assert_links(clist: CompactLinkedList) -> None:
+    """The `prev` links mirror the `next` ones, the free slots are unused."""
+    slots = list(clist._yield_slots())  # noqa: SLF001
+    assert list(clist._yield_slots(reverse=True)) == slots[::-1]  # noqa: SLF001
+    assert len(slots) == len(clist)
+    assert not set(slots) & set(clist._free)  # noqa: SLF001
+
+
+class TestCompactLinkedListSuite:
+    @pytest.mark.parametrize("it", [[], [1], [1, "2", [3]]])
+    def test_init(self, it: list) -> None:
+        clist = CompactLinkedList(it)
+
+        assert clist == it
+        assert list(reversed(clist)) == it[::-1]
+        assert len(clist) == len(it)
+        assert bool(clist) is bool(it)
+        assert repr(clist) == f"CompactLinkedList({tuple(it)})"
+        assert_links(clist)
+
+    def test_free_slots_are_reused(self) -> None:
+        clist = CompactLinkedList(range(10))
+
+        for value in range(100):
+            clist.pop(random.randrange(len(clist)))
+            clist.insert(random.randrange(len(clist) + 1), value)
+            assert len(clist._values) == 10  # noqa: SLF001
+        assert_links(clist)
+
+        while clist:
+            clist.popleft()
+        assert not clist._values  # noqa: SLF001
+
+    @pytest.mark.parametrize("pop", ["popleft", "popright", "pop"])
+    def test_storage_is_compacted(self, pop: str) -> None:
+        clist = CompactLinkedList(range(100))
+
+        for _ in range(51):
+            getattr(clist, pop)()
+            assert len(clist._values) <= 2 * len(clist) + 1  # noqa: SLF001
+        assert len(clist._values) < 100  # noqa: SLF001
+        assert clist == (range(51, 100) if pop == "popleft" else range(49))
+        assert_links(clist)
+
+        while clist:
+            getattr(clist, pop)()
+        assert not clist._values  # noqa: SLF001
+
+    @pytest.mark.parametrize("pop", ["popleft", "popright", "pop"])
+    def test_pop_from_empty(self, pop: str) -> None:
+        with pytest.raises(IndexError):
+            getattr(CompactLinkedList(), pop)()
+
+    @pytest.mark.parametrize("index", [-6, 5])
+    def test_index_out_of_range(self, index: int) -> None:
+        clist = CompactLinkedList(range(5))
+
+        with pytest.raises(IndexError):
+            clist[index]
+        with pytest.raises(IndexError):
+            clist[index] = 0
+        with pytest.raises(IndexError):
+            del clist[index]
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            slice(None),
+            slice(1, -1),
+            slice(None, None, -2),
+            slice(7, 1, -3),
+            slice(3, 3),
+        ],
+    )
+    def test_slices(self, key: slice) -> None:
+        lst: list = list(range(10))
+        clist = CompactLinkedList(lst)
+
+        assert isinstance(clist[key], CompactLinkedList)
+        assert clist[key] == lst[key]
+
+        clist[key] = values = [f"v{idx}" for idx in range(len(lst[key]))]
+        lst[key] = values
+        assert clist == lst
+
+        del clist[key]
+        del lst[key]
+        assert clist == lst
+        assert_links(clist)
+
+    def test_search(self) -> None:
+        lst = [3, 1, 3, 2, 3]
+        clist = CompactLinkedList(lst)
+
+        assert 2 in clist
+        assert 4 not in clist
+        assert clist.count(3) == lst.count(3)
+        for start, stop in [(0, maxsize), (1, maxsize), (-3, -1), (1, 3)]:
+            assert clist.index(3, start, stop) == lst.index(3, start, stop)
+        with pytest.raises(ValueError):  # noqa: PT011
+            clist.index(3, 3, 4)
+
+        clist.remove(3)
+        lst.remove(3)
+        assert clist == lst
+        with pytest.raises(ValueError):  # noqa: PT011
+            clist.remove(4)
+
+    @pytest.mark.parametrize("cls", [CompactLinkedList, DoublyLinkedList])
+    def test_remove_missing(
+        self, cls: type[CompactLinkedList] | type[DoublyLinkedList]
+    ) -> None:
+        seq = cls([1, 2])
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            seq.remove(3)
+
+        assert seq == [1, 2]
+
+    def test_operations(self) -> None:
+        clist = CompactLinkedList([1, 2])
+
+        assert clist + [3] == [1, 2, 3]
+        assert clist * 3 == [1, 2] * 3
+        assert clist * -1 == []
+        assert clist.copy() == clist
+        assert clist.copy() is not clist
+        assert clist < [1, 3]
+
+        clist *= 2
+        clist += [3]
+        clist.extendleft([-1, 0])
+        assert clist == [-1, 0, 1, 2, 1, 2, 3]
+        assert_links(clist)
+
+        clist.clear()
+        assert not clist
+        clist.extend([1])
+        assert clist == [1]
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 5])
+    def test_reverse(self, length: int) -> None:
+        clist = CompactLinkedList(range(length))
+        if length:
+            clist.pop(length // 2)
+
+        answer = list(clist)[::-1]
+        clist.reverse()
+
+        assert clist == answer
+        clist.append("x")
+        clist.prepend("y")
+        assert clist == ["y", *answer, "x"]
+        assert_links(clist)
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 5])
+    @pytest.mark.parametrize("steps", [-7, -1, 0, 1, 2, 4, 11])
+    def test_rotate(self, length: int, steps: int) -> None:
+        clist = CompactLinkedList(range(length))
+        deq = deque(range(length))
+
+        clist.rotate(steps)
+        deq.rotate(steps)
+
+        assert clist == deq
+        assert_links(clist)
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    @pytest.mark.parametrize("key", [None, abs])
+    def test_sort(self, reverse: bool, key: None | Callable) -> None:
+        values = [random.randint(-5, 5) for _ in range(30)]
+        clist = CompactLinkedList(values)
+
+        clist.sort(key=key, reverse=reverse)
+
+        assert clist == sorted(values, key=key, reverse=reverse)
+        assert_links(clist)
+
+    def test_random_operations(self) -> None:
+        clist = CompactLinkedList()
+        lst: list[int] = []
+
+        for value in range(1_000):
+            operation = random.choice(["append", "prepend", "insert", "pop"])
+            if operation == "append":
+                clist.append(value)
+                lst.append(value)
+            elif operation == "prepend":
+                clist.prepend(value)
+                lst.insert(0, value)
+            elif operation == "insert":
+                index = random.randint(-len(lst) - 1, len(lst) + 1)
+                clist.insert(index, value)
+                lst.insert(index, value)
+            elif lst:
+                index = random.randrange(-len(lst), len(lst))
+                assert clist.pop(index) == lst.pop(index)
+            assert len(clist) == len(lst)
+        assert clist == lst
+        assert_links(clist)
@@ -1,16 +1,22 @@
 import copy
 import random
-from collections.abc import Iterable, MutableSequence
+from collections import deque
+from collections.abc import Callable, Iterable, MutableSequence
 from contextlib import AbstractContextManager
 from contextlib import nullcontext as does_not_raise
 from sys import maxsize
-from typing import Any
+from typing import Any, cast
 
 import pytest
+from pytest_mock import MockerFixture
 
 from adspy.algorithms.searching import linear_search
 from adspy.algorithms.sorting import merge_sort, quick_sort
-from adspy.data_structures.linked_lists import DoublyLinkedList
+from adspy.data_structures.linked_lists import (
+    DoublyLinkedList,
+    DoublyLinkedNode,
+    LinkedListError,
+)
 
 
 def test_is_mutable_sequence():
@@ -165,6 +171,15 @@ class TestDoublyLinkedListSuite:
 
             assert lst == it
 
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_remove_missing(self, indexed: bool) -> None:
+        dlist = DoublyLinkedList([1, 2], indexed=indexed)
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            dlist.remove(3)
+
+        assert dlist == [1, 2]
+
     def test_pop(self) -> None:
         it = random.sample(range(100), 10)
         dlist = DoublyLinkedList(it)
@@ -396,3 +411,636 @@ class TestDoublyLinkedListSuite:
 
         with pytest.raises(IndexError):
             dlist.pop(idx)
+
+
+def assert_indexed(dlist: DoublyLinkedList) -> None:
+    nodes: dict[Any, dict[int, DoublyLinkedNode]] = {}
+    for node in dlist._yield_nodes():  # noqa: SLF001
+        nodes.setdefault(node.value, {})[id(node)] = node
+    value_nodes = dlist._value_nodes  # noqa: SLF001
+    assert value_nodes is not None
+    assert value_nodes.keys() == nodes.keys()
+    for value, expected in nodes.items():
+        assert value_nodes[value].keys() == expected.keys()
+        assert all(
+            value_nodes[value][ident] is expected[ident] for ident in expected
+        )
+
+
+class TestPositionalAccessSuite:
+    @pytest.mark.parametrize("size", [1, 2, 5, 10])
+    def test_like_list(self, size: int) -> None:
+        lst = list(range(size))
+        dlist = DoublyLinkedList(lst)
+
+        for idx in range(-size, size):
+            assert dlist[idx] == lst[idx]
+            dlist[idx] = lst[idx] = -idx
+            assert dlist == lst
+        for _ in range(size):
+            idx = random.randrange(-len(lst), len(lst))
+            del dlist[idx]
+            del lst[idx]
+            assert dlist == lst
+            assert list(reversed(dlist)) == lst[::-1]
+
+    @pytest.mark.parametrize("idx", [-4, 3, 100])
+    def test_out_of_range(self, idx: int) -> None:
+        dlist = DoublyLinkedList([1, 2, 3])
+
+        with pytest.raises(IndexError, match="out of range"):
+            dlist[idx]
+        with pytest.raises(IndexError, match="out of range"):
+            dlist[idx] = 0
+        with pytest.raises(IndexError, match="out of range"):
+            del dlist[idx]
+        with pytest.raises(IndexError, match="out of range"):
+            dlist.pop(idx)
+        assert dlist == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        ("idx", "steps"), [(0, 0), (-1, 0), (1, 1), (-2, 1), (499, 499)]
+    )
+    def test_nearer_end(
+        self, mocker: MockerFixture, idx: int, steps: int
+    ) -> None:
+        dlist = DoublyLinkedList(range(1_000))
+        walked: list[DoublyLinkedNode] = []
+        for name in ("next", "prev"):
+            link = getattr(DoublyLinkedNode, name)
+
+            def step(node: DoublyLinkedNode, link: Any = link) -> Any:
+                walked.append(node)
+                return link.__get__(node)
+
+            mocker.patch.object(DoublyLinkedNode, name, new=property(step))
+
+        assert dlist[idx] == range(1_000)[idx]
+        assert len(walked) == steps
+
+
+SLICES = [
+    slice(None),
+    slice(None, None, -1),
+    slice(2, None),
+    slice(None, 3),
+    slice(-3, None),
+    slice(1, -1),
+    slice(None, None, 2),
+    slice(1, None, 3),
+    slice(-1, 0, -2),
+    slice(5, 1, -1),
+    slice(3, 1),
+    slice(100, None),
+    slice(-100, 100),
+]
+
+
+class TestSlicesSuite:
+    @pytest.mark.parametrize("size", [0, 1, 6])
+    @pytest.mark.parametrize("key", SLICES)
+    def test_get(self, size: int, key: slice) -> None:
+        lst = list(range(size))
+        dlist = DoublyLinkedList(lst)
+
+        assert dlist[key] == lst[key]
+        assert isinstance(dlist[key], DoublyLinkedList)
+
+    @pytest.mark.parametrize("size", [0, 1, 6])
+    @pytest.mark.parametrize("key", SLICES)
+    def test_delete(self, size: int, key: slice) -> None:
+        lst = list(range(size))
+        dlist = DoublyLinkedList(lst, indexed=True)
+
+        del dlist[key]
+        del lst[key]
+
+        assert dlist == lst
+        assert len(dlist) == len(lst)
+        assert list(reversed(dlist)) == lst[::-1]
+        assert_indexed(dlist)
+
+    @pytest.mark.parametrize("size", [0, 1, 6])
+    @pytest.mark.parametrize("key", SLICES)
+    @pytest.mark.parametrize("nbr", [0, 1, 2, 8])
+    def test_set(self, size: int, key: slice, nbr: int) -> None:
+        lst = list(range(size))
+        dlist = DoublyLinkedList(lst, indexed=True)
+        values = range(100, 100 + nbr)
+
+        try:
+            lst[key] = values
+        except ValueError:
+            with pytest.raises(ValueError, match="extended slice of size"):
+                dlist[key] = values
+        else:
+            dlist[key] = iter(values)
+
+        assert dlist == lst
+        assert len(dlist) == len(lst)
+        assert list(reversed(dlist)) == lst[::-1]
+        assert_indexed(dlist)
+
+    def test_single_walk(self, mocker: MockerFixture) -> None:
+        dlist = DoublyLinkedList(range(1_000))
+        spy = mocker.spy(DoublyLinkedList, "_node_at")
+
+        del dlist[::2]
+
+        assert dlist == list(range(1, 1_000, 2))
+        assert spy.call_count == 1
+
+
+class TestNodeHandlesSuite:
+    def test_handles(self) -> None:
+        dlist = DoublyLinkedList()
+
+        node2 = dlist.append(2)
+        node0 = dlist.prepend(0)
+        node1 = dlist.insert(1, 1)
+        node3 = dlist.insert_after(node2, 3)
+
+        assert dlist == [0, 1, 2, 3]
+        for value, node in enumerate([node0, node1, node2, node3]):
+            assert isinstance(node, DoublyLinkedNode)
+            assert node.value == value
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_moves(self, indexed: bool) -> None:
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in [0, 1, 2, 1]]
+
+        dlist.move_to_front(nodes[2])
+        assert dlist == [2, 0, 1, 1]
+        dlist.move_to_front(nodes[2])
+        assert dlist == [2, 0, 1, 1]
+        dlist.move_to_end(nodes[0])
+        assert dlist == [2, 1, 1, 0]
+        dlist.move_to_end(nodes[0])
+        assert dlist == [2, 1, 1, 0]
+        dlist.move_to_front(nodes[3])
+        assert dlist == [1, 2, 1, 0]
+        assert dlist.index(1) == 0
+        assert dlist.remove_node(nodes[1]) == 1
+        assert dlist == [1, 2, 0]
+        dlist.insert_after(nodes[0], 3)
+        assert dlist == [1, 2, 0, 3]
+        assert len(dlist) == 4
+        assert list(reversed(dlist)) == [3, 0, 2, 1]
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    @pytest.mark.parametrize("steps", [-7, -2, 0, 1, 3, 4, 11])
+    def test_rotate(self, indexed: bool, steps: int) -> None:
+        values = [0, 1, 0, 2, 1]
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in values]
+        deq = deque(values)
+
+        dlist.rotate(steps)
+        deq.rotate(steps)
+
+        assert dlist == deq
+        assert list(reversed(dlist)) == list(reversed(deq))
+        assert cast("DoublyLinkedNode", dlist.head).prev is None
+        assert cast("DoublyLinkedNode", dlist.tail).next is None
+        dlist.move_to_end(nodes[2])
+        assert dlist.tail is nodes[2]
+        assert len(dlist) == len(values)
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_set_value(self, indexed: bool) -> None:
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in [1, 2, 1]]
+
+        with pytest.raises(AttributeError):
+            nodes[0].value = 3  # type: ignore [misc]
+        dlist.set_value(nodes[0], 2)
+
+        assert dlist == [2, 2, 1]
+        assert nodes[0].value == 2
+        assert dlist.count(2) == 2
+        assert 1 in dlist
+        dlist.remove(1)
+        assert dlist.remove_node(nodes[0]) == 2
+        assert dlist == [2]
+        with pytest.raises(LinkedListError, match="not in the list"):
+            dlist.set_value(nodes[0], 0)
+        if indexed:
+            with pytest.raises(TypeError):
+                dlist.set_value(nodes[1], [0])
+            assert_indexed(dlist)
+
+    def test_unhashable_handles(self) -> None:
+        node = DoublyLinkedList().append(1)
+
+        assert node == 1
+        with pytest.raises(TypeError):
+            hash(node)
+
+    def test_head_and_tail(self) -> None:
+        empty = DoublyLinkedList()
+        assert empty.head is None
+        assert empty.tail is None
+
+        dlist = DoublyLinkedList()
+        first, last = dlist.append(1), dlist.append(2)
+        assert dlist.head is first
+        assert dlist.tail is last
+
+    def test_single_node(self) -> None:
+        dlist = DoublyLinkedList()
+        node = dlist.append(1)
+
+        dlist.move_to_front(node)
+        dlist.move_to_end(node)
+        assert dlist == [1]
+        dlist.insert_after(node, 2)
+        assert dlist == [1, 2]
+        assert dlist.remove_node(node) == 1
+        assert dlist == [2]
+
+    def test_foreign_nodes(self) -> None:
+        dlist, other = DoublyLinkedList([1]), DoublyLinkedList([1])
+        node = other.append(2)
+        removed = dlist.append(3)
+        dlist.remove(3)
+        popped = dlist.append(4)
+        dlist.pop()
+
+        bads: list[Any] = [node, removed, popped, DoublyLinkedNode(1), 1]
+        for bad in bads:
+            for method in [
+                dlist.move_to_front,
+                dlist.move_to_end,
+                dlist.remove_node,
+            ]:
+                with pytest.raises(LinkedListError, match="not in the list"):
+                    method(bad)
+            with pytest.raises(LinkedListError, match="not in the list"):
+                dlist.insert_after(bad, 0)
+        assert dlist == [1]
+        assert other == [1, 2]
+
+
+class TestBulkExtendSuite:
+    @pytest.mark.parametrize("indexed", [False, True])
+    @pytest.mark.parametrize("left", [False, True])
+    @pytest.mark.parametrize("before", [[], [1], [1, 2, 1]])
+    @pytest.mark.parametrize("values", [[], [2], [1, 3, 1, 2]])
+    def test_extend(
+        self, indexed: bool, left: bool, before: list, values: list
+    ) -> None:
+        dlist = DoublyLinkedList(before, indexed=indexed)
+
+        if left:
+            dlist.extendleft(iter(values))
+            answer = values + before
+        else:
+            dlist.extend(iter(values))
+            answer = before + values
+
+        assert dlist == answer
+        assert list(reversed(dlist)) == answer[::-1]
+        assert len(dlist) == len(answer)
+        if answer:
+            head = cast("DoublyLinkedNode", dlist.head)
+            tail = cast("DoublyLinkedNode", dlist.tail)
+            assert head.prev is None
+            assert tail.next is None
+            dlist.move_to_end(head)
+            assert dlist.tail is head
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("method", ["extend", "extendleft"])
+    def test_unhashable_values(self, method: str) -> None:
+        dlist = DoublyLinkedList([1, 2], indexed=True)
+
+        with pytest.raises(TypeError):
+            getattr(dlist, method)(iter([3, [4], 5]))
+
+        assert dlist == [1, 2]
+        assert len(dlist) == 2
+        assert_indexed(dlist)
+
+    def test_extend_itself(self) -> None:
+        dlist = DoublyLinkedList([1, 2])
+
+        dlist.extend(dlist)
+        assert dlist == [1, 2, 1, 2]
+
+        dlist.extendleft(dlist)
+        assert dlist == [1, 2] * 4
+
+
+class TestWholeListSuite:
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_clear(self, indexed: bool) -> None:
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in [1, 2, 1]]
+
+        dlist.clear()
+
+        assert not dlist
+        assert dlist.head is None
+        assert dlist.tail is None
+        assert 1 not in dlist
+        for node in nodes:
+            with pytest.raises(LinkedListError):
+                dlist.remove_node(node)
+
+        node = dlist.append(1)
+        dlist.extend([2, 1])
+        dlist.move_to_end(node)
+        assert dlist == [2, 1, 1]
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    @pytest.mark.parametrize("values", [[], [1], [1, 2], [1, 2, 1, 3, 2]])
+    def test_reverse(self, indexed: bool, values: list) -> None:
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in values]
+
+        dlist.reverse()
+
+        assert dlist == values[::-1]
+        assert list(reversed(dlist)) == values
+        assert list(dlist._yield_nodes(reverse=True)) == nodes  # noqa: SLF001
+        if nodes:
+            dlist.move_to_front(nodes[0])
+            assert dlist == [values[0], *values[:0:-1]]
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    @pytest.mark.parametrize("nbr", [-1, 0, 1, 2, 3])
+    @pytest.mark.parametrize("values", [[], [1], [1, 2, 1]])
+    def test_imul(self, indexed: bool, nbr: int, values: list) -> None:
+        dlist = DoublyLinkedList(indexed=indexed)
+        nodes = [dlist.append(value) for value in values]
+
+        dlist *= nbr
+
+        assert dlist == values * nbr
+        assert list(reversed(dlist)) == (values * nbr)[::-1]
+        assert len(dlist) == len(values * nbr)
+        if nbr > 0 and nodes:
+            assert dlist.head is nodes[0]
+            dlist.move_to_end(nodes[0])
+        if indexed:
+            assert_indexed(dlist)
+
+
+class TestSortSuite:
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 7, 8, 33])
+    @pytest.mark.parametrize("reverse", [False, True])
+    @pytest.mark.parametrize("key", [None, abs])
+    def test_sort(self, size: int, reverse: bool, key: None | Callable) -> None:
+        values = [random.randint(-5, 5) for _ in range(size)]
+        dlist = DoublyLinkedList(values)
+
+        dlist.sort(key=key, reverse=reverse)
+
+        answer = sorted(values, key=key, reverse=reverse)
+        assert dlist == answer
+        assert list(reversed(dlist)) == answer[::-1]
+        assert len(dlist) == size
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_stability(self, reverse: bool) -> None:
+        records = [(random.randint(0, 3), idx) for idx in range(50)]
+        dlist = DoublyLinkedList(records)
+
+        dlist.sort(key=lambda record: record[0], reverse=reverse)
+
+        assert dlist == sorted(
+            records, key=lambda record: record[0], reverse=reverse
+        )
+
+    def test_nodes_are_relinked(self, mocker: MockerFixture) -> None:
+        dlist = DoublyLinkedList()
+        nodes = [dlist.append(value) for value in [3, 1, 2, 1]]
+        spy = mocker.spy(DoublyLinkedNode, "__init__")
+
+        dlist.sort()
+
+        assert not spy.call_count
+        assert dlist.head is nodes[1]
+        assert dlist.tail is nodes[0]
+        dlist.move_to_front(nodes[0])
+        assert dlist == [3, 1, 1, 2]
+
+    def test_key_calls(self, mocker: MockerFixture) -> None:
+        values = random.sample(range(100), 20)
+        dlist = DoublyLinkedList(values)
+        key = mocker.Mock(side_effect=lambda value: -value)
+
+        dlist.sort(key=key)
+
+        assert dlist == sorted(values, reverse=True)
+        assert key.call_count == len(values)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_indexed(self, indexed: bool) -> None:
+        values = [3, 1, 2, 1, 3, 1.0]
+        dlist = DoublyLinkedList(values, indexed=indexed)
+
+        dlist.sort(reverse=True)
+
+        assert dlist == sorted(values, reverse=True)
+        if indexed:
+            assert_indexed(dlist)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    @pytest.mark.parametrize("key", [None, str.lower])
+    def test_failed_comparison(
+        self, indexed: bool, key: None | Callable
+    ) -> None:
+        values = ["b", "a", "c", 1, "d", "e"]
+        dlist = DoublyLinkedList(values, indexed=indexed)
+
+        with pytest.raises(TypeError):
+            dlist.sort(key=key)
+
+        assert sorted(dlist, key=str) == sorted(values, key=str)
+        assert list(reversed(dlist)) == list(dlist)[::-1]
+        assert len(dlist) == len(values)
+        if indexed:
+            assert_indexed(dlist)
+
+    def test_not_callable_key(self) -> None:
+        dlist = DoublyLinkedList([2, 1])
+
+        with pytest.raises(TypeError):
+            dlist.sort(key=1)  # type: ignore [arg-type]
+
+        assert dlist == [2, 1]
+
+
+OPERATIONS: dict[str, Callable[[MutableSequence, int, Any], Any]] = {
+    "append": lambda seq, _, value: seq.append(value),
+    "prepend": lambda seq, _, value: seq.insert(0, value),
+    "insert": lambda seq, idx, value: seq.insert(idx, value),
+    "pop": lambda seq, idx, _: seq.pop(idx),
+    "remove": lambda seq, _, value: seq.remove(value),
+    "set": lambda seq, idx, value: seq.__setitem__(idx, value),
+    "del": lambda seq, idx, _: seq.__delitem__(idx),
+}
+
+
+class ComparedValue:
+    """The hashable value counting its equality comparisons."""
+
+    comparisons = 0
+
+    def __init__(self, key: int) -> None:
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        type(self).comparisons += 1
+        return isinstance(other, ComparedValue) and (self.key == other.key)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+class TestIndexedDoublyLinkedListSuite:
+    def test_indexed(self) -> None:
+        assert not DoublyLinkedList().indexed
+        assert DoublyLinkedList(indexed=True).indexed
+        assert DoublyLinkedList(indexed=True).copy().indexed
+        assert (DoublyLinkedList([1], indexed=True) + [2]).indexed
+
+    def test_operations(self) -> None:
+        lst: list[int] = []
+        dlist = DoublyLinkedList(indexed=True)
+
+        for _ in range(500):
+            name, op = random.choice(list(OPERATIONS.items()))
+            value = random.randint(0, 5)
+            idx = random.randint(-len(lst) - 1, len(lst) + 1)
+            if name in {"pop", "set", "del"}:
+                if not lst:
+                    continue
+                idx = random.randrange(len(lst))
+            if (name == "remove") and (value not in lst):
+                continue
+
+            result, expected = op(dlist, idx, value), op(lst, idx, value)
+            if name == "pop":
+                assert result == expected
+            assert dlist == lst
+            assert_indexed(dlist)
+            for value in range(7):
+                assert (value in dlist) == (value in lst)
+                assert dlist.count(value) == lst.count(value)
+                if value in lst:
+                    assert dlist.index(value) == lst.index(value)
+
+    @pytest.mark.parametrize("it", [[], [3, 1, 2, 1, 3]])
+    def test_reverse_and_sort(self, it: list) -> None:
+        dlist = DoublyLinkedList(it, indexed=True)
+
+        dlist.reverse()
+        assert_indexed(dlist)
+
+        dlist.sort()
+        assert_indexed(dlist)
+
+        dlist.clear()
+        assert_indexed(dlist)
+        assert 1 not in dlist
+
+    @pytest.mark.parametrize(
+        ("value", "start", "stop", "ans"),
+        [
+            (1, 0, maxsize, 1),
+            (1, 2, maxsize, 3),
+            (1, 4, maxsize, None),
+            (1, 2, 3, None),
+            (3, -1, maxsize, 4),
+            (4, 0, maxsize, None),
+            ([1], 0, maxsize, None),
+        ],
+    )
+    def test_index(
+        self, value: Any, start: int, stop: int, ans: None | int
+    ) -> None:
+        dlist = DoublyLinkedList([0, 1, 2, 1, 3], indexed=True)
+
+        if ans is None:
+            with pytest.raises(ValueError):  # noqa: PT011
+                dlist.index(value, start, stop)
+        else:
+            assert dlist.index(value, start, stop) == ans
+
+    def test_unhashable(self) -> None:
+        dlist = DoublyLinkedList([1, 2], indexed=True)
+
+        assert [1] not in dlist
+        assert dlist.count([1]) == 0
+        with pytest.raises(ValueError):  # noqa: PT011
+            dlist.remove([1])
+        assert dlist == [1, 2]
+        with pytest.raises(TypeError):
+            dlist.append([3])
+        with pytest.raises(TypeError):
+            dlist.insert(1, [3])
+        with pytest.raises(TypeError):
+            dlist[0] = [3]
+        assert dlist == [1, 2]
+        assert_indexed(dlist)
+
+    def test_nan_keeps_the_list_order(self) -> None:
+        nan = float("nan")
+        dlist = DoublyLinkedList([nan, 1, nan, 2], indexed=True)
+
+        dlist.insert(3, nan)
+        dlist.remove(nan)
+
+        assert [item is nan for item in dlist] == [False, True, True, False]
+        assert list(dlist)[::3] == [1, 2]
+        assert_indexed(dlist)
+
+    @pytest.mark.parametrize("index", range(6))
+    def test_insert_among_identical_values(self, index: int) -> None:
+        nan = float("nan")
+        dlist = DoublyLinkedList([nan, 1, nan, 2, nan], indexed=True)
+
+        dlist.insert(index, nan)
+        dlist.insert(index, 0)
+
+        assert dlist.index(0) == index
+        assert_indexed(dlist)
+
+    @pytest.mark.parametrize("key", [slice(1, 4), slice(None, None, 2)])
+    def test_slice_assignment(self, key: slice) -> None:
+        lst = [1, 2, 1, 2, 1, 2]
+        dlist = DoublyLinkedList(lst, indexed=True)
+
+        dlist[key] = lst[key] = [2] * len(lst[key])
+
+        assert dlist == lst
+        assert dlist.count(2) == lst.count(2)
+        assert_indexed(dlist)
+
+    def test_handles_compare_no_values(self) -> None:
+        values = [ComparedValue(idx % 3) for idx in range(30)]
+        dlist = DoublyLinkedList(values, indexed=True)
+        node = dlist.append(values[0])
+        ComparedValue.comparisons = 0
+
+        dlist.insert_after(node, values[1])
+        dlist.move_to_front(node)
+        dlist.move_to_end(node)
+        dlist.set_value(node, values[2])
+        dlist.remove_node(node)
+
+        assert ComparedValue.comparisons == 0
+        assert dlist.count(values[1]) == 11
+        assert_indexed(dlist)
@@ -8,7 +8,9 @@ from sys import maxsize
 from typing import Any
 
 import pytest
+from pytest_mock import MockerFixture
 
+from adspy.data_structures.linked_lists import DoublyLinkedNode
 from adspy.data_structures.queues import Deque
 
 
@@ -293,3 +295,114 @@ class TestDequeSuite:
 
         dq.reverse()
         assert dq == rev
+
+
+@pytest.mark.parametrize("backend", ["linked", "ring"])
+class TestDequeBackendsSuite:
+    def test_backend(self, backend: str) -> None:
+        dq = Deque([1, 2, 3], backend=backend)
+
+        assert dq.backend == backend
+        for other in (dq.copy(), dq[1:], dq + [4], dq * 2):
+            assert other.backend == backend
+
+    def test_indexing(self, backend: str) -> None:
+        dq = Deque(range(10), maxlen=8, backend=backend)
+        deq = deque(range(10), maxlen=8)
+
+        assert [dq[idx] for idx in range(-8, 8)] == [
+            deq[idx] for idx in range(-8, 8)
+        ]
+        dq[3] = deq[3] = -3
+        del dq[-2]
+        del deq[-2]
+        assert dq == deq
+        with pytest.raises(IndexError):
+            dq[7]
+
+    def test_remove(self, backend: str) -> None:
+        dq = Deque([1, 2, 1], backend=backend)
+        deq = deque([1, 2, 1])
+
+        dq.remove(1)
+        deq.remove(1)
+        assert dq == deq
+        for container in (dq, deq):
+            with pytest.raises(ValueError):  # noqa: PT011
+                container.remove(3)
+        assert dq == deq
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 7])
+    @pytest.mark.parametrize("steps", [-8, -1, 0, 1, 3, 6, 15])
+    def test_rotate(self, backend: str, length: int, steps: int) -> None:
+        dq = Deque(range(length), backend=backend)
+        deq = deque(range(length))
+
+        dq.rotate(steps)
+        deq.rotate(steps)
+
+        assert dq == deq
+
+    @pytest.mark.parametrize("maxlen", [None, 0, 1, 3, 6])
+    @pytest.mark.parametrize("before", [[], [1, 2]])
+    @pytest.mark.parametrize("sized", [False, True])
+    def test_extend(
+        self, backend: str, maxlen: None | int, before: list, sized: bool
+    ) -> None:
+        items = list(range(10, 15))
+        for method in ("extend", "extendleft"):
+            dq = Deque(before, maxlen=maxlen, backend=backend)
+            deq = deque(before, maxlen=maxlen)
+
+            getattr(dq, method)(items if sized else iter(items))
+            getattr(deq, method)(items)
+
+            assert dq == deq
+
+    def test_extend_itself(self, backend: str) -> None:
+        for maxlen in (None, 3):
+            dq = Deque([1, 2], maxlen=maxlen, backend=backend)
+            deq = deque([1, 2], maxlen=maxlen)
+
+            dq.extend(dq)
+            deq.extend(deq)
+            dq.extendleft(dq)
+            deq.extendleft(deq)
+
+            assert dq == deq
+
+    def test_random_operations(self, backend: str) -> None:
+        dq = Deque(maxlen=50, backend=backend)
+        deq: deque[int] = deque(maxlen=50)
+
+        for value in range(1_000):
+            operation = random.choice(
+                ["append", "appendleft", "pop", "popleft", "rotate"]
+            )
+            if operation in ("append", "appendleft"):
+                getattr(dq, operation)(value)
+                getattr(deq, operation)(value)
+            elif operation == "rotate":
+                steps = random.randint(-60, 60)
+                dq.rotate(steps)
+                deq.rotate(steps)
+            elif deq:
+                assert getattr(dq, operation)() == getattr(deq, operation)()
+            assert len(dq) == len(deq)
+        assert dq == deq
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="backend='array'"):
+        Deque(backend="array")
+
+
+def test_bounded_extend_links_last_items(mocker: MockerFixture) -> None:
+    maxlen = 10
+    dq = Deque(range(5), maxlen=maxlen)
+    spy = mocker.spy(DoublyLinkedNode, "__init__")
+
+    dq.extend(iter(range(1_000)))
+
+    assert dq == list(range(990, 1_000))
+    assert spy.call_count == maxlen
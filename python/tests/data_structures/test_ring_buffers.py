@@ -0,0 +1,191 @@
+import random
+from collections import deque
+from collections.abc import MutableSequence
+from sys import maxsize
+
+import pytest
+
+from adspy.data_structures.ring_buffers import MIN_CAPACITY, RingBuffer
+
+
+def test_is_mutable_sequence() -> None:
+    assert isinstance(RingBuffer(), MutableSequence)
+
+
+class TestRingBufferSuite:
+    @pytest.mark.parametrize("it", [[], [1], list(range(MIN_CAPACITY + 1))])
+    def test_init(self, it: list[int]) -> None:
+        buffer = RingBuffer(it)
+
+        assert buffer == it
+        assert list(reversed(buffer)) == it[::-1]
+        assert len(buffer) == len(it)
+        assert repr(buffer) == f"RingBuffer({tuple(it)})"
+
+    def test_wrap_around(self) -> None:
+        buffer = RingBuffer(range(MIN_CAPACITY))
+        lst = list(range(MIN_CAPACITY))
+
+        for value in range(3 * MIN_CAPACITY):
+            buffer.popleft()
+            buffer.append(value)
+            lst = [*lst[1:], value]
+            assert buffer == lst
+            assert [buffer[idx] for idx in range(-len(lst), len(lst))] == (
+                lst + lst
+            )
+        assert buffer.capacity == MIN_CAPACITY
+
+    def test_capacity(self) -> None:
+        size = 10 * MIN_CAPACITY
+        buffer = RingBuffer()
+
+        for value in range(size):
+            buffer.prepend(value)
+            assert buffer.capacity >= len(buffer)
+        assert buffer.capacity == 16 * MIN_CAPACITY
+
+        while len(buffer) > 1:
+            buffer.popright()
+            capacity = buffer.capacity
+            assert len(buffer) <= capacity <= max(MIN_CAPACITY, 4 * len(buffer))
+        assert buffer == [size - 1]
+
+        buffer.clear()
+        assert not buffer
+        assert buffer.capacity == MIN_CAPACITY
+
+    @pytest.mark.parametrize("pop", ["popleft", "popright", "pop"])
+    def test_pop_from_empty(self, pop: str) -> None:
+        with pytest.raises(IndexError):
+            getattr(RingBuffer(), pop)()
+
+    @pytest.mark.parametrize("index", [-8, 7])
+    def test_index_out_of_range(self, index: int) -> None:
+        buffer = RingBuffer(range(7))
+
+        with pytest.raises(IndexError):
+            buffer[index]
+        with pytest.raises(IndexError):
+            buffer[index] = 0
+        with pytest.raises(IndexError):
+            del buffer[index]
+
+    @pytest.mark.parametrize("head", range(MIN_CAPACITY))
+    def test_insert_and_delete(self, head: int) -> None:
+        for index in range(-9, 9):
+            buffer = RingBuffer(range(head))
+            for _ in range(head):
+                buffer.popleft()
+            buffer.extend(range(6))
+            lst: list = list(range(6))
+
+            buffer.insert(index, "x")
+            lst.insert(index, "x")
+            assert buffer == lst
+
+            if -len(lst) <= index < len(lst):
+                del buffer[index]
+                del lst[index]
+                assert buffer == lst
+            if -len(lst) <= index < len(lst):
+                assert buffer.pop(index) == lst.pop(index)
+                assert buffer == lst
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 5, MIN_CAPACITY])
+    @pytest.mark.parametrize("steps", [-9, -3, -1, 0, 1, 2, 4, 7, 17])
+    def test_rotate(self, length: int, steps: int) -> None:
+        buffer = RingBuffer(range(length))
+        buffer.prepend(-1)
+        buffer.popleft()
+        deq = deque(range(length))
+
+        buffer.rotate(steps)
+        deq.rotate(steps)
+
+        assert buffer == deq
+        buffer.rotate(-steps)
+        assert buffer == list(range(length))
+
+    @pytest.mark.parametrize("length", [0, 1, 2, 5, MIN_CAPACITY + 1])
+    def test_reverse(self, length: int) -> None:
+        buffer = RingBuffer(range(length))
+        buffer.prepend(-1)
+
+        buffer.reverse()
+
+        assert buffer == [*range(length - 1, -1, -1), -1]
+
+    @pytest.mark.parametrize(
+        "key",
+        [slice(None), slice(1, -1), slice(None, None, -2), slice(5, 1, -1)],
+    )
+    def test_slices(self, key: slice) -> None:
+        lst: list = list(range(10))
+        buffer = RingBuffer(lst)
+
+        assert isinstance(buffer[key], RingBuffer)
+        assert buffer[key] == lst[key]
+
+        buffer[key] = values = [f"v{idx}" for idx in range(len(lst[key]))]
+        lst[key] = values
+        assert buffer == lst
+
+        del buffer[key]
+        del lst[key]
+        assert buffer == lst
+
+    def test_search(self) -> None:
+        lst = [3, 1, 3, 2, 3]
+        buffer = RingBuffer(lst)
+
+        assert 2 in buffer
+        assert 4 not in buffer
+        assert buffer.count(3) == lst.count(3)
+        for start, stop in [(0, maxsize), (1, maxsize), (-3, -1), (1, 3)]:
+            assert buffer.index(3, start, stop) == lst.index(3, start, stop)
+        with pytest.raises(ValueError):  # noqa: PT011
+            buffer.index(3, 3, 4)
+
+        buffer.remove(3)
+        lst.remove(3)
+        assert buffer == lst
+        with pytest.raises(ValueError):  # noqa: PT011
+            buffer.remove(4)
+
+    def test_operations(self) -> None:
+        buffer = RingBuffer([1, 2])
+
+        assert buffer + [3] == [1, 2, 3]
+        assert buffer * 3 == [1, 2] * 3
+        assert buffer.copy() == buffer
+        assert buffer.copy() is not buffer
+        assert buffer < [1, 3]
+
+        buffer *= 2
+        buffer += [3]
+        buffer.extendleft([-1, 0])
+        assert buffer == [-1, 0, 1, 2, 1, 2, 3]
+
+    def test_random_operations(self) -> None:
+        buffer = RingBuffer()
+        deq: deque[int] = deque()
+
+        for value in range(2_000):
+            operation = random.choice(
+                ["append", "appendleft", "pop", "popleft", "rotate"]
+            )
+            if operation == "append":
+                buffer.append(value)
+                deq.append(value)
+            elif operation == "appendleft":
+                buffer.prepend(value)
+                deq.appendleft(value)
+            elif operation == "rotate":
+                steps = random.randint(-10, 10)
+                buffer.rotate(steps)
+                deq.rotate(steps)
+            elif deq:
+                assert getattr(buffer, operation)() == getattr(deq, operation)()
+            assert len(buffer) == len(deq)
+        assert buffer == deq